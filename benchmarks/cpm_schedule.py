@@ -0,0 +1,73 @@
+"""
+Time taken by `PROJECT.schedule` to schedule the projects of a .xer file,
+and by `PROJECT.driving_path` and `PROJECT.float_paths` to trace the paths
+into the activity that finishes last.
+
+Usage:
+    python -m benchmarks.cpm_schedule /path/to/file.xer
+
+Each project is scheduled once after the file is read (cold), when the
+network of the project is built and the row fields used by the scheduler are
+converted for the first time, and then again a few times (warm). The first
+path traced schedules the project again for `PROJECT.cpm`, which is then
+reused by the following paths (path). The best of the timings is reported.
+
+Results on a 1 project, 100,000 activity, 130,000 relationship .xer file
+(Python 3.11, 64-bit), before and after the scheduler used the cached network
+of the project and read the fields of the activities in one pass per column.
+Both versions were run in turn on the same machine, and the median of six
+runs is reported, since the timings varied by up to 30% between runs:
+
+    project   cold (s)  warm (s)  first path (s)  path (s)  float paths (s)
+    before        2.6       1.35           1.55      0.002            0.17
+    after         1.9       0.73           0.75      0.002            0.17
+
+The cold schedule is dominated by building the network (about 0.35 s) and
+converting the fields of the activities (about 0.65 s), which are only done
+once per project. The first path traced schedules the project for
+`PROJECT.cpm`, so it takes as long as a warm schedule; the paths traced
+after it reuse that schedule.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from xerparser import Xer
+
+REPEAT = 5  # warm schedules timed per project
+
+
+def best_time(func, repeat: int) -> float:
+    """Shortest time taken by `repeat` calls of a function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(file: Path) -> None:
+    xer = Xer.reader(file)
+    print(
+        "project     activities  relationships  cold (s)  warm (s)"
+        "  first path (s)  path (s)  float paths (s)"
+    )
+    for project in xer.projects.values():
+        cold = best_time(project.schedule, 1)
+        warm = best_time(project.schedule, REPEAT)
+        first = best_time(lambda: project.cpm, 1)
+        target = max(project.cpm, key=lambda item: item[1].early_finish)[0]
+        first += best_time(lambda: project.driving_path(target), 1)
+        path = best_time(lambda: project.driving_path(target), REPEAT)
+        floats = best_time(lambda: project.float_paths(target), REPEAT)
+        print(
+            f"{project.short_name:<10}  {len(project.tasks):>10,}"
+            f"  {len(project.relationships):>13,}  {cold:>8.2f}  {warm:>8.2f}"
+            f"  {first:>14.2f}  {path:>8.3f}  {floats:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]))
@@ -0,0 +1,152 @@
+"""
+Memory used by the objects read from a .xer file, compared with an earlier
+version of xerparser whose schema classes store every converted field in an
+instance `__dict__`.
+
+Usage:
+    python -m benchmarks.object_memory /path/to/file.xer /path/to/baseline
+
+`baseline` is the root directory of another checkout of xerparser, e.g.
+`git worktree add /tmp/baseline <commit>`. Each version is measured in its
+own process. Objects are measured as `Xer.reader` returns them, so fields
+that are converted on first access are not converted.
+
+For each class, the `(B)` columns are the average size of the objects themselves:
+the instance and its `__dict__`, if it has one, but not the attribute values
+or the raw rows, which are shared with `Xer.tables`. `retained (MB)` is the
+memory held by the `Xer` object and everything it references, including the
+raw tables, after the file is read.
+
+Results on a 2 project, 6,000 activity, 6,000 relationship .xer file with
+3,000 resource assignments (Python 3.11, 64-bit):
+
+    class         before (B)  after (B)  change
+    TASK               1,640        472    -71%
+    TASKRSRC             352        264    -25%
+    TASKPRED             224        136    -39%
+    LinkToTask           152         56    -63%
+
+    retained (MB)   before    after  change
+    retain='all'      58.2     59.0     +1%
+    retain='none'        -     22.2    -62%
+
+The objects are smaller, but with the default `retain="all"` they keep a
+reference to their raw rows, which are held by `Xer.tables` as well, so the
+memory held after reading the file is about the same. Releasing the tables
+converts the remaining fields and drops the rows.
+"""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+CLASSES = ("TASK", "TASKRSRC", "TASKPRED", "LinkToTask")
+
+
+def object_size(obj: Any) -> int:
+    """Size of an object and its instance dictionary, without its values."""
+    size = sys.getsizeof(obj)
+    if (attrs := getattr(obj, "__dict__", None)) is not None:
+        size += sys.getsizeof(attrs)
+    return size
+
+
+def average(objects: list) -> float | None:
+    return sum(map(object_size, objects)) / len(objects) if objects else None
+
+
+def retained(file: str, **options: Any) -> float:
+    """Memory held by the `Xer` object after the file is read, in MB."""
+    from xerparser import Xer
+
+    gc.collect()
+    tracemalloc.start()
+    xer = Xer.reader(file, **options)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del xer
+    return size / 1e6
+
+
+def measure(file: str) -> dict[str, Any]:
+    """Measure the objects of the version of xerparser that is imported."""
+    from inspect import signature
+
+    from xerparser import Xer
+
+    xer = Xer.reader(file)
+    tasks = list(xer.tasks.values())
+    objects = {
+        "TASK": tasks,
+        "TASKRSRC": [res for task in tasks for res in task.resources.values()],
+        "TASKPRED": list(xer.relationships.values()),
+        "LinkToTask": [link for task in tasks for link in task.predecessors],
+    }
+    del xer, tasks
+    result = {
+        "objects": {name: average(objects[name]) for name in CLASSES},
+        "all": retained(file),
+        "none": None,
+    }
+    if "retain" in signature(Xer.reader).parameters:
+        result["none"] = retained(file, retain="none")
+    return result
+
+
+def run(file: Path, root: Path) -> dict[str, Any]:
+    """Measure the xerparser package in `root` in a new process."""
+    env = {**os.environ, "PYTHONPATH": str(root)}
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", str(file)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def change(before: float | None, after: float | None) -> str:
+    if before is None or after is None:
+        return "-"
+    return f"{after / before - 1:+.0%}"
+
+
+def number(value: float | None, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def main(file: Path, baseline: Path) -> None:
+    before = run(file, baseline)
+    after = run(file, Path(__file__).resolve().parent.parent)
+
+    print(f"{'class':<12}  before (B)  after (B)  change")
+    for name in CLASSES:
+        old, new = before["objects"][name], after["objects"][name]
+        print(
+            f"{name:<12}  {number(old, ',.0f'):>10}  {number(new, ',.0f'):>9}"
+            f"  {change(old, new):>6}"
+        )
+
+    print(f"\n{'retained (MB)':<14}  before    after  change")
+    for key in ("all", "none"):
+        # both are compared with the baseline, which keeps all of the tables
+        old, new = before[key], after[key]
+        label = f"retain={key!r}"
+        print(
+            f"{label:<14}  {number(old, '.1f'):>6}  {number(new, '.1f'):>7}"
+            f"  {change(before['all'], new):>6}"
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1] == "--measure":
+        print(json.dumps(measure(sys.argv[2])))
+    else:
+        main(Path(sys.argv[1]), Path(sys.argv[2]))
@@ -0,0 +1,571 @@
+"""
+Sample .xer files for the unittests.
+
+The files are generated in memory, so the tests of the reader options and of
+the scheduling tools do not depend on the .xer files listed in `config.py`.
+`sample_tables` builds a multi-project file using most of the tables of an
+export, and `network_tables` a single project of activities and relationships.
+`SampleFile` writes the `sample_tables` file once for a test case.
+"""
+
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from xerparser.src.xer import Xer
+
+Tables = dict[str, list[dict[str, Any]]]
+
+START = datetime(2024, 1, 1, 8)  # a Monday
+DATA_DATE = datetime(2024, 1, 15, 8)
+
+# Monday to Friday, 08:00 to 12:00 and 13:00 to 17:00
+WORK_DAY = "(0||0(s|08:00|f|12:00)())(0||1(s|13:00|f|17:00)())"
+CALENDAR_DATA = (
+    "(0||CalendarData()((0||DaysOfWeek()((0||1()())"
+    + "".join(f"(0||{day}()({WORK_DAY}))" for day in range(2, 7))
+    + "(0||7()()))(0||VIEW(ShowTotal|Y)())(0||Exceptions()()))"
+)
+
+ERMHDR = (
+    "ERMHDR\t19.12\t2024-01-15\tProject\tadmin\tadmin\tdbxDatabaseNoName"
+    "\tProject Management\tUSD"
+)
+
+
+def date(value: datetime | None) -> str:
+    return value.strftime("%Y-%m-%d %H:%M") if value else ""
+
+
+def xer_text(tables: Tables) -> str:
+    """Contents of a .xer file with the rows of each table."""
+    lines = [ERMHDR]
+    for name, rows in tables.items():
+        if not rows:
+            continue
+        columns = list(dict.fromkeys(col for row in rows for col in row))
+        lines.append(f"%T\t{name}")
+        lines.append("%F\t" + "\t".join(columns))
+        for row in rows:
+            lines.append("%R\t" + "\t".join(str(row.get(col, "")) for col in columns))
+    lines.append("%E")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def write_xer(directory: str | Path, tables: Tables, name: str = "sample.xer") -> Path:
+    """Write a .xer file to a directory."""
+    path = Path(directory) / name
+    path.write_text(xer_text(tables), encoding=Xer.CODEC, newline="")
+    return path
+
+
+def project_tables(proj_ids: list[str], **options: Any) -> Tables:
+    """Tables of the projects, with a calendar and schedule options for each."""
+    calendars = [calendar_row("1", "Standard", "CA_Base")]
+    calendars.extend(
+        calendar_row(f"1{proj_id}", f"Calendar {proj_id}", "CA_Project", proj_id)
+        for proj_id in proj_ids
+    )
+    return {
+        "CALENDAR": calendars,
+        "PROJECT": [
+            {
+                "proj_id": proj_id,
+                "proj_short_name": f"PRJ-{proj_id}",
+                "export_flag": "Y",
+                "clndr_id": "1",
+                "plan_start_date": date(START),
+                "plan_end_date": "",
+                "scd_end_date": date(START + timedelta(days=120)),
+                "add_date": date(START),
+                "last_recalc_date": date(DATA_DATE),
+                "last_schedule_date": date(DATA_DATE),
+                "last_fin_dates_id": "",
+            }
+            for proj_id in proj_ids
+        ],
+        "SCHEDOPTIONS": [
+            {
+                "schedoptions_id": str(i),
+                "proj_id": proj_id,
+                "sched_outer_depend_type": "SD_None",
+                "sched_open_critical_flag": "N",
+                "sched_lag_early_start_flag": "N",
+                "sched_retained_logic": "Y",
+                "sched_setplantoforecast": "N",
+                "sched_float_type": "FT_FF",
+                "sched_calendar_on_relationship_lag": "rcal_Predecessor",
+                "sched_use_expect_end_flag": "N",
+                "sched_progress_override": "N",
+                "sched_use_project_end_date_for_float": "N",
+                "max_multiple_longest_path": "10",
+                "use_total_float_multiple_longest_paths": "N",
+            }
+            | options
+            for i, proj_id in enumerate(proj_ids, 1)
+        ],
+        "PROJWBS": [
+            row
+            for proj_id in proj_ids
+            for row in (
+                wbs_row(f"{proj_id}0", proj_id, f"PRJ-{proj_id}", "1", "Y"),
+                wbs_row(f"{proj_id}1", proj_id, "A", f"{proj_id}0"),
+            )
+        ],
+    }
+
+
+def calendar_row(
+    clndr_id: str, name: str, clndr_type: str, proj_id: str = ""
+) -> dict[str, str]:
+    return {
+        "clndr_id": clndr_id,
+        "default_flag": "Y" if clndr_id == "1" else "N",
+        "clndr_name": name,
+        "proj_id": proj_id,
+        "base_clndr_id": "" if clndr_id == "1" else "1",
+        "last_chng_date": "",
+        "clndr_type": clndr_type,
+        "day_hr_cnt": "8",
+        "week_hr_cnt": "40",
+        "year_hr_cnt": "2000",
+        "clndr_data": CALENDAR_DATA,
+    }
+
+
+def wbs_row(
+    wbs_id: str, proj_id: str, code: str, parent: str, proj_node: str = "N"
+) -> dict[str, str]:
+    return {
+        "wbs_id": wbs_id,
+        "proj_id": proj_id,
+        "seq_num": "0",
+        "proj_node_flag": proj_node,
+        "status_code": "WS_Open",
+        "wbs_short_name": code,
+        "wbs_name": f"WBS {code}",
+        "parent_wbs_id": parent,
+    }
+
+
+def task_row(
+    task_id: str,
+    proj_id: str,
+    code: str,
+    hours: float = 8,
+    task_type: str = "TT_Task",
+    status: str = "TK_NotStart",
+    start: datetime | None = None,
+    finish: datetime | None = None,
+    **fields: Any,
+) -> dict[str, str]:
+    """
+    A TASK row. Started and completed activities use `start` and `finish`
+    as their actual dates.
+    """
+    start = start or DATA_DATE
+    finish = finish or start + timedelta(hours=hours)
+    return {
+        "task_id": task_id,
+        "proj_id": proj_id,
+        "wbs_id": f"{proj_id}1",
+        "clndr_id": f"1{proj_id}",
+        "phys_complete_pct": "50" if status == "TK_Active" else "0",
+        "complete_pct_type": "CP_Drtn",
+        "task_type": task_type,
+        "duration_type": "DT_FixedDrtn",
+        "status_code": status,
+        "task_code": code,
+        "task_name": f"Task {code}",
+        "total_float_hr_cnt": "0",
+        "free_float_hr_cnt": "0",
+        "remain_drtn_hr_cnt": "0" if status == "TK_Complete" else str(hours),
+        "act_work_qty": "0",
+        "target_work_qty": "0",
+        "target_drtn_hr_cnt": str(hours),
+        "target_equip_qty": "0",
+        "act_equip_qty": "0",
+        "cstr_date": "",
+        "act_start_date": "" if status == "TK_NotStart" else date(start),
+        "act_end_date": date(finish) if status == "TK_Complete" else "",
+        "late_start_date": date(start),
+        "late_end_date": date(finish),
+        "expect_end_date": "",
+        "early_start_date": date(start),
+        "early_end_date": date(finish),
+        "restart_date": date(start),
+        "reend_date": date(finish),
+        "target_start_date": date(start),
+        "target_end_date": date(finish),
+        "rem_late_start_date": "",
+        "rem_late_end_date": "",
+        "cstr_type": "",
+        "suspend_date": "",
+        "resume_date": "",
+        "float_path": "",
+        "float_path_order": "",
+        "cstr_date2": "",
+        "cstr_type2": "",
+        "driving_path_flag": "N",
+        "create_date": date(START),
+        "update_date": "",
+    } | {key: str(value) for key, value in fields.items()}
+
+
+def pred_row(
+    task_pred_id: str,
+    pred: dict[str, str],
+    succ: dict[str, str],
+    link: str = "FS",
+    lag: float = 0,
+) -> dict[str, str]:
+    return {
+        "task_pred_id": task_pred_id,
+        "task_id": succ["task_id"],
+        "pred_task_id": pred["task_id"],
+        "proj_id": succ["proj_id"],
+        "pred_proj_id": pred["proj_id"],
+        "pred_type": f"PR_{link}",
+        "lag_hr_cnt": str(lag),
+        "float_path": "",
+        "aref": "",
+        "arls": "",
+    }
+
+
+def network_tables(
+    tasks: list[dict[str, str]],
+    relationships: list[tuple[str, str, str, float]],
+    **options: Any,
+) -> Tables:
+    """
+    Tables of a single project (`proj_id` "1") with the activities (see
+    `task_row`) and relationships (predecessor code, successor code, link
+    type, and lag in hours). `options` replace the schedule options.
+    """
+    by_code = {task["task_code"]: task for task in tasks}
+    return project_tables(["1"], **options) | {
+        "TASK": tasks,
+        "TASKPRED": [
+            pred_row(str(k), by_code[pred], by_code[succ], link, lag)
+            for k, (pred, succ, link, lag) in enumerate(relationships, 1)
+        ],
+    }
+
+
+def sample_tables(projects: int = 2, tasks: int = 12) -> Tables:
+    """
+    A multi-project export with activity codes, resources, costs, financial
+    periods, notebooks, and user defined fields. The first activities of each
+    project are completed, the next one is in progress, and each activity is a
+    successor of the one before it. An additional project is not exported.
+    """
+    proj_ids = [str(1000 + p) for p in range(projects)]
+    tables = {
+        "CURRTYPE": [{"curr_id": "1", "curr_type": "USD"}],
+        "ACCOUNT": [
+            {
+                "acct_id": "1",
+                "parent_acct_id": "",
+                "acct_seq_num": "0",
+                "acct_name": "Account",
+                "acct_short_name": "A",
+                "acct_descr": "",
+            }
+        ],
+        "ACTVTYPE": [
+            {
+                "actv_code_type_id": "1",
+                "actv_short_len": "10",
+                "seq_num": "1",
+                "actv_code_type": "Phase",
+                "proj_id": "",
+                "actv_code_type_scope": "AS_Global",
+            }
+        ],
+        "ACTVCODE": [
+            {
+                "actv_code_id": str(i),
+                "parent_actv_code_id": "",
+                "actv_code_type_id": "1",
+                "actv_code_name": name,
+                "short_name": name[0],
+                "seq_num": str(i),
+            }
+            for i, name in ((1, "Design"), (2, "Build"))
+        ],
+        "FINDATES": [
+            {
+                "fin_dates_id": "1",
+                "fin_dates_name": "January",
+                "start_date": "2024-01-01 00:00",
+                "end_date": "2024-01-31 23:59",
+            }
+        ],
+        "MEMOTYPE": [{"memo_type_id": "1", "memo_type": "Notes"}],
+        "PCATTYPE": [
+            {
+                "proj_catg_type_id": "1",
+                "seq_num": "1",
+                "proj_catg_short_len": "10",
+                "proj_catg_type": "Region",
+            }
+        ],
+        "PCATVAL": [
+            {
+                "proj_catg_id": "1",
+                "proj_catg_type_id": "1",
+                "seq_num": "1",
+                "proj_catg_short_name": "E",
+                "parent_proj_catg_id": "",
+                "proj_catg_name": "East",
+            }
+        ],
+        "RSRC": [
+            {
+                "rsrc_id": "1",
+                "parent_rsrc_id": "",
+                "clndr_id": "1",
+                "rsrc_seq_num": "1",
+                "rsrc_name": "Labor",
+                "rsrc_short_name": "LAB",
+                "rsrc_type": "RT_Labor",
+            }
+        ],
+        "RSRCRATE": [
+            {
+                "rsrc_rate_id": "1",
+                "rsrc_id": "1",
+                "max_qty_per_hr": "1",
+                "cost_per_qty": "100",
+                "start_date": "2024-01-01 00:00",
+                "shift_period_id": "",
+                "cost_per_qty2": "",
+                "cost_per_qty3": "",
+                "cost_per_qty4": "",
+                "cost_per_qty5": "",
+            }
+        ],
+        "UDFTYPE": [
+            {
+                "udf_type_id": str(i),
+                "table_name": table,
+                "udf_type_name": f"user_field_{i}",
+                "udf_type_label": label,
+                "logical_data_type": data_type,
+            }
+            for i, table, label, data_type in (
+                (1, "TASK", "Note", "FT_TEXT"),
+                (2, "PROJECT", "Amount", "FT_MONEY"),
+                (3, "PROJWBS", "Owner", "FT_TEXT"),
+            )
+        ],
+    }
+
+    # the projects, plus a project that is referenced but not exported
+    tables |= project_tables(proj_ids + ["9999"])
+    tables["PROJECT"][-1]["export_flag"] = "N"
+    tables["PROJWBS"] = [row for row in tables["PROJWBS"] if row["proj_id"] != "9999"]
+    tables["PROJPCAT"] = [
+        {"proj_id": proj_id, "proj_catg_type_id": "1", "proj_catg_id": "1"}
+        for proj_id in proj_ids
+    ]
+
+    rows: Tables = {
+        "TASK": [],
+        "TASKACTV": [],
+        "TASKMEMO": [],
+        "TASKPRED": [],
+        "TASKRSRC": [],
+        "TASKFIN": [],
+        "TRSRCFIN": [],
+        "UDFVALUE": [],
+    }
+    for proj_id in proj_ids:
+        project_tasks = []
+        for k in range(tasks):
+            start = START + timedelta(days=k)
+            status = "TK_Complete" if k < 3 else "TK_Active" if k == 3 else ""
+            task = task_row(
+                f"{proj_id}{k:03d}",
+                proj_id,
+                f"A{k:03d}",
+                hours=8 * (k % 3),
+                task_type=(
+                    "TT_Mile"
+                    if k == 0
+                    else "TT_FinMile" if k == tasks - 1 else "TT_Task"
+                ),
+                status=status or "TK_NotStart",
+                start=start if status else None,
+                finish=start + timedelta(hours=8) if status else None,
+            )
+            project_tasks.append(task)
+            if k:
+                rows["TASKPRED"].append(
+                    pred_row(str(len(rows["TASKPRED"]) + 1), project_tasks[k - 1], task)
+                )
+            if k % 2:
+                continue
+
+            # codes, notebooks, resources, and user defined fields
+            task_id = task["task_id"]
+            taskrsrc_id = str(len(rows["TASKRSRC"]) + 1)
+            rows["TASKACTV"].append(
+                {
+                    "task_id": task_id,
+                    "actv_code_type_id": "1",
+                    "actv_code_id": str(1 + k % 4 // 2),
+                    "proj_id": proj_id,
+                }
+            )
+            rows["TASKMEMO"].append(
+                {
+                    "memo_id": str(len(rows["TASKMEMO"]) + 1),
+                    "task_id": task_id,
+                    "memo_type_id": "1",
+                    "proj_id": proj_id,
+                    "task_memo": f"<p>Note {k}</p>",
+                }
+            )
+            rows["TASKRSRC"].append(
+                {
+                    "taskrsrc_id": taskrsrc_id,
+                    "task_id": task_id,
+                    "proj_id": proj_id,
+                    "acct_id": "1",
+                    "rsrc_id": "1",
+                    "remain_qty": "8",
+                    "target_qty": "16",
+                    "act_ot_qty": "0",
+                    "act_reg_qty": "8",
+                    "target_cost": "1600",
+                    "act_reg_cost": "800",
+                    "act_ot_cost": "0",
+                    "remain_cost": "800",
+                    "act_start_date": "",
+                    "act_end_date": "",
+                    "restart_date": date(START),
+                    "reend_date": date(START),
+                    "target_start_date": date(START),
+                    "target_end_date": date(START),
+                    "target_lag_drtn_hr_cnt": "0",
+                    "rem_late_start_date": "",
+                    "rem_late_end_date": "",
+                    "act_this_per_cost": "100",
+                    "act_this_per_qty": "1",
+                    "rsrc_type": "RT_Labor",
+                }
+            )
+            rows["TASKFIN"].append(
+                {
+                    "task_id": task_id,
+                    "fin_dates_id": "1",
+                    "proj_id": proj_id,
+                    "act_work_qty": "0",
+                    "act_work_cost": "100",
+                    "act_equip_qty": "0",
+                    "act_equip_cost": "0",
+                    "act_mat_cost": "0",
+                    "act_expense_cost": "0",
+                    "bcwp": "0",
+                    "sched_work_qty": "0",
+                    "perfm_work_qty": "0",
+                    "bcws": "0",
+                }
+            )
+            rows["TRSRCFIN"].append(
+                {
+                    "taskrsrc_id": taskrsrc_id,
+                    "fin_dates_id": "1",
+                    "task_id": task_id,
+                    "proj_id": proj_id,
+                    "act_qty": "1",
+                    "act_cost": "100",
+                }
+            )
+            rows["UDFVALUE"].append(udf_row("1", task_id, proj_id, udf_text=f"{k}"))
+
+        rows["TASK"].extend(project_tasks)
+        rows["UDFVALUE"].append(udf_row("2", proj_id, proj_id, udf_number="12.5"))
+        rows["UDFVALUE"].append(
+            udf_row("3", f"{proj_id}1", proj_id, udf_text="Owner A")
+        )
+    return tables | rows
+
+
+def udf_row(udf_type_id: str, fk_id: str, proj_id: str, **value: str) -> dict:
+    return {
+        "udf_type_id": udf_type_id,
+        "fk_id": fk_id,
+        "proj_id": proj_id,
+        "udf_date": "",
+        "udf_number": "",
+        "udf_text": "",
+    } | value
+
+
+def summary(xer: Xer) -> dict[str, Any]:
+    """Values of the linked objects of an `Xer`, to compare two objects."""
+    projects = {}
+    for project in xer.projects.values():
+        projects[project.short_name] = {
+            "name": project.name,
+            "wbs": sorted(node.full_code for node in project.wbs_nodes),
+            "tasks": [
+                (
+                    task.task_code,
+                    task.status.name,
+                    task.wbs.full_code,
+                    task.calendar.name,
+                    task.act_start_date,
+                    task.remain_drtn_hr_cnt,
+                    sorted(f"{t.task.task_code} {t.link}" for t in task.predecessors),
+                    sorted(v.code for v in task.activity_codes.values()),
+                    sorted(map(str, task.user_defined_fields.values())),
+                    len(task.memos),
+                    len(task.periods),
+                    sorted(task.resources),
+                )
+                for task in project.tasks
+            ],
+            "relationships": sorted(rel.uid for rel in project.relationships),
+            "resources": sorted(res.uid for res in project.resources),
+            "actual_cost": project.actual_cost,
+            "budgeted_cost": project.budgeted_cost,
+            "task_percent": project.task_percent,
+            "calendars": sorted(cal.name for cal in project.calendars),
+            "project_codes": {t.name: v.code for t, v in project.project_codes.items()},
+            "user_defined_fields": sorted(
+                map(str, project.user_defined_fields.values())
+            ),
+        }
+    return {
+        "tables": sorted(xer.tables),
+        "tasks": sorted(xer.tasks),
+        "relationships": sorted(xer.relationships),
+        "projects": projects,
+    }
+
+
+class SampleFile:
+    """
+    Test case mixin writing the `sample_tables` file to a temporary directory
+    before the tests of the case are run. `sample` holds the arguments passed
+    to `sample_tables`; the path of the file is `file`.
+    """
+
+    sample: dict[str, int] = {}
+    file: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._directory = tempfile.TemporaryDirectory()
+        cls.file = write_xer(cls._directory.name, sample_tables(**cls.sample))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._directory.cleanup()
+        super().tearDownClass()
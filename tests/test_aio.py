@@ -0,0 +1,114 @@
+"""
+Unittests of reading .xer files from async byte streams.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile
+from xerparser.src.aio import AsyncStreamReader, is_async_stream
+from xerparser.src.xer import Xer
+
+
+class UploadFile:
+    """An upload with an async `read` method, like Starlette's `UploadFile`."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.position = 0
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        await asyncio.sleep(0)
+        self.reads += 1
+        end = len(self.data) if size < 0 else self.position + size
+        chunk = self.data[self.position : end]
+        self.position += len(chunk)
+        return chunk
+
+
+async def iter_chunks(data: bytes, size: int):
+    """An async iterable of bytes, like Starlette's `Request.stream()`."""
+    for i in range(0, len(data), size):
+        yield b""
+        yield data[i : i + size]
+
+
+class TestAsyncReader(SampleFile, unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.data = cls.file.read_bytes()
+        cls.xer = Xer.reader(cls.file)
+
+    async def test_upload_file(self):
+        upload = UploadFile(self.data)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        # the upload is read in chunks while the event loop keeps running
+        ticker = asyncio.create_task(tick())
+        try:
+            xer = await Xer.areader(upload)
+        finally:
+            ticker.cancel()
+        self.assertGreater(upload.reads, 1)
+        self.assertGreater(ticks, upload.reads)
+        self.assertEqual(xer.tables, self.xer.tables)
+        self.assertEqual(xer.tasks.keys(), self.xer.tasks.keys())
+
+    async def test_async_iterable(self):
+        # empty chunks are not mistaken for the end of the stream
+        xer = await Xer.areader(iter_chunks(self.data, 100))
+        self.assertEqual(xer.tables, self.xer.tables)
+
+    async def test_path(self):
+        xer = await Xer.areader(self.file, exclude={"TASKPRED"})
+        self.assertEqual(xer.relationships, {})
+        self.assertEqual(xer.tasks.keys(), self.xer.tasks.keys())
+
+    async def test_limit(self):
+        reader = Xer.reader
+        lock = threading.Lock()
+        running = []
+        most = 0
+
+        def counted(*args, **kwargs):
+            nonlocal most
+            with lock:
+                running.append(1)
+                most = max(most, len(running))
+            try:
+                return reader(*args, **kwargs)
+            finally:
+                with lock:
+                    running.pop()
+
+        limit = asyncio.Semaphore(2)
+        with mock.patch.object(Xer, "reader", side_effect=counted):
+            xers = await asyncio.gather(
+                *(Xer.areader(UploadFile(self.data), limit=limit) for _ in range(4))
+            )
+        self.assertEqual(most, 2)
+        self.assertEqual([len(xer.tasks) for xer in xers], [len(self.xer.tasks)] * 4)
+
+    async def test_stream_reader(self):
+        self.assertTrue(is_async_stream(UploadFile(b"")))
+        self.assertFalse(is_async_stream(self.data))
+        with self.assertRaises(TypeError):
+            AsyncStreamReader(self.data, asyncio.get_running_loop())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unittests of reading many .xer files in worker processes.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import sample_tables, write_xer
+from xerparser.src.batch import read_many
+from xerparser.src.xer import Xer
+
+
+def task_count(xer: Xer) -> int:
+    """Reducer run in the worker processes."""
+    return len(xer.tasks)
+
+
+class TestReadMany(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._directory = tempfile.TemporaryDirectory()
+        cls.files = [
+            write_xer(cls._directory.name, sample_tables(1, tasks), f"{tasks}.xer")
+            for tasks in (5, 10, 15, 20)
+        ]
+        # a file missing a required table
+        tables = sample_tables(1, 5)
+        del tables["TASK"]
+        cls.corrupt = write_xer(cls._directory.name, tables, "corrupt.xer")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._directory.cleanup()
+
+    def test_reducer(self):
+        results = list(Xer.read_many(self.files, task_count, workers=2))
+        self.assertEqual([result.file for result in results], self.files)
+        self.assertEqual([result.value for result in results], [5, 10, 15, 20])
+        self.assertFalse(any(result.is_corrupt for result in results))
+
+    def test_unordered(self):
+        results = read_many(
+            self.files, task_count, workers=2, ordered=False, max_pending=1
+        )
+        self.assertEqual(
+            sorted((result.value, result.file) for result in results),
+            list(zip([5, 10, 15, 20], self.files)),
+        )
+
+    def test_corrupt_file(self):
+        results = list(read_many([self.corrupt, *self.files[:1]], task_count, 2))
+        self.assertTrue(results[0].is_corrupt)
+        self.assertIsNone(results[0].value)
+        self.assertEqual(results[1].value, 5)
+
+    def test_unreadable_files(self):
+        # files that are not .xer files, or are missing, are reported in
+        # their results without stopping the others
+        not_xer = Path(self._directory.name) / "notes.xer"
+        not_xer.write_bytes(b"not a .xer file")
+        missing = Path(self._directory.name) / "missing.xer"
+        files = [not_xer, self.files[0], missing, self.files[1]]
+        results = list(read_many(files, task_count, workers=2))
+        self.assertEqual([result.file for result in results], files)
+        self.assertEqual([result.value for result in results], [None, 5, None, 10])
+        self.assertTrue(results[0].is_corrupt)
+        self.assertIn("FileNotFoundError", results[2].errors[0])
+
+    def test_reader_options(self):
+        (result,) = read_many(self.files[:1], workers=1, exclude={"TASKPRED"})
+        self.assertIsInstance(result.value, Xer)
+        self.assertEqual(len(result.value.tasks), 5)
+        self.assertEqual(result.value.relationships, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
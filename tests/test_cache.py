@@ -0,0 +1,131 @@
+"""
+Unittests of the on-disk cache of parsed .xer files.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile, sample_tables, summary, write_xer
+from xerparser.schemas._field import RowField
+from xerparser.src import cache
+from xerparser.src.cache import SUFFIX, XerCache
+from xerparser.src.errors import CorruptXerFile
+from xerparser.src.parser import read_tables
+from xerparser.src.snapshot import load_snapshot
+from xerparser.src.validation import Check
+from xerparser.src.xer import Xer
+
+
+class NoTasks(Check):
+    """Check reporting an error if the file has activities."""
+
+    def errors(self, tables) -> list[str]:
+        return ["Activities are not allowed"] if "TASK" in tables else []
+
+
+class TestXerCache(SampleFile, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.other = write_xer(cls._directory.name, sample_tables(1), "other.xer")
+        cls.expected = summary(Xer.reader(cls.file))
+
+    def setUp(self) -> None:
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.cache = XerCache(self._cache_dir.name)
+
+    def tearDown(self) -> None:
+        self._cache_dir.cleanup()
+
+    def entries(self) -> list[Path]:
+        return list(Path(self._cache_dir.name).glob(f"*{SUFFIX}"))
+
+    def test_miss_and_hit(self):
+        self.assertEqual(summary(self.cache.reader(self.file)), self.expected)
+        self.assertEqual(len(self.cache), 1)
+
+        # a cached file is not read again, and its objects are not built
+        # or converted from the rows again
+        with (
+            mock.patch.object(cache, "read_tables", side_effect=AssertionError),
+            mock.patch.object(Xer, "_build", side_effect=AssertionError),
+            mock.patch.object(RowField, "_compute", side_effect=AssertionError),
+        ):
+            self.assertEqual(summary(self.cache.reader(self.file)), self.expected)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_entry_is_snapshot(self):
+        self.cache.reader(self.file)
+        (entry,) = self.entries()
+        xer = load_snapshot(entry)
+        self.assertEqual(xer.tables, read_tables(self.file))
+        self.assertEqual(summary(xer), self.expected)
+
+    def test_released_tables(self):
+        # all tables are stored, and released from the object returned
+        self.cache.reader(self.file, retain="none")
+        xer = self.cache.reader(self.file, retain="none")
+        self.assertEqual(xer.tables, {})
+        self.assertEqual(xer.table("TASK"), read_tables(self.file)["TASK"])
+        self.assertEqual(sorted(xer.tasks), self.expected["tasks"])
+
+    def test_options(self):
+        # entries are keyed by the file contents and the reader options
+        self.cache.reader(self.file)
+        xer = self.cache.reader(self.file, exclude={"TASKPRED"})
+        self.assertEqual(xer.relationships, {})
+        self.cache.reader(io.BytesIO(self.file.read_bytes()))
+        self.assertEqual(len(self.cache), 2)
+        self.cache.reader(self.other)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_lazy_and_workers(self):
+        # all objects are built when a file is stored, and the options are
+        # not part of the key of its entry
+        self.cache.reader(self.file, lazy=True)
+        xer = self.cache.reader(self.file, workers=2)
+        self.assertEqual(sorted(xer.relationships), self.expected["relationships"])
+        self.assertEqual(summary(xer), self.expected)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_checks(self):
+        # checks are run on a cached file again
+        self.cache.reader(self.file)
+        with self.assertRaises(CorruptXerFile):
+            self.cache.reader(self.file, checks=[NoTasks()])
+
+    def test_damaged_entry(self):
+        self.cache.reader(self.file)
+        (entry,) = self.entries()
+        entry.write_bytes(b"damaged")
+        # the damaged entry is replaced
+        xer = self.cache.reader(self.file)
+        self.assertEqual(sorted(xer.tasks), self.expected["tasks"])
+        self.assertEqual(len(self.cache), 1)
+        self.assertIsInstance(load_snapshot(entry), Xer)
+
+    def test_eviction(self):
+        self.cache.reader(self.file)
+        (first,) = self.entries()
+        self.cache.max_size = first.stat().st_size
+        time.sleep(0.01)
+        self.cache.reader(self.other)
+        # the least recently used entry is removed
+        self.assertEqual(len(self.cache), 1)
+        self.assertFalse(first.exists())
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+"""
+Unittests of the critical path scheduling of a project.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import network_tables, task_row, write_xer
+from xerparser.src.xer import Xer
+
+# A (8h) drives B (16h) and D (8h) to the finish milestone F; C and E have float
+RELATIONSHIPS = [
+    ("A", "B", "FS", 0),
+    ("A", "C", "SS", 4),
+    ("B", "D", "FF", 0),
+    ("A", "E", "SF", 16),
+    ("D", "F", "FS", 0),
+    ("C", "F", "FS", 0),
+    ("E", "F", "FS", 0),
+]
+
+
+def network_tasks(**fields) -> list[dict[str, str]]:
+    """Activities of `RELATIONSHIPS`, with the fields of each activity by code."""
+    hours = {"A": 8, "B": 16, "C": 8, "D": 8, "E": 8, "F": 0}
+    tasks = [
+        task_row(str(i), "1", code, hours[code], **fields.get(code, {}))
+        for i, code in enumerate(hours, 1)
+    ]
+    tasks[-1]["task_type"] = "TT_FinMile"
+    return tasks
+
+
+class CPMTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def project(self, tasks: list[dict[str, str]], relationships=RELATIONSHIPS):
+        tables = network_tables(tasks, relationships)
+        return Xer.reader(write_xer(self._directory.name, tables)).projects["1"]
+
+    def assertDates(self, cpm, task, early_start, early_finish) -> None:
+        dates = cpm[task]
+        self.assertEqual(
+            (dates.early_start, dates.early_finish), (early_start, early_finish)
+        )
+
+
+class TestSchedule(CPMTestCase):
+    def test_relationship_types(self):
+        project = self.project(network_tasks())
+        cpm = project.schedule()
+        tasks = project.tasks_by_code
+        self.assertDates(
+            cpm, tasks["A"], datetime(2024, 1, 15, 8), datetime(2024, 1, 15, 17)
+        )
+        self.assertDates(
+            cpm, tasks["B"], datetime(2024, 1, 16, 8), datetime(2024, 1, 17, 17)
+        )
+        # start to start with 4 hours of lag, after the lunch break
+        self.assertDates(
+            cpm, tasks["C"], datetime(2024, 1, 15, 13), datetime(2024, 1, 16, 12)
+        )
+        self.assertDates(
+            cpm, tasks["D"], datetime(2024, 1, 17, 8), datetime(2024, 1, 17, 17)
+        )
+        self.assertDates(
+            cpm, tasks["E"], datetime(2024, 1, 16, 8), datetime(2024, 1, 16, 17)
+        )
+        self.assertDates(
+            cpm, tasks["F"], datetime(2024, 1, 17, 17), datetime(2024, 1, 17, 17)
+        )
+
+    def test_float_and_critical(self):
+        project = self.project(network_tasks())
+        cpm = project.schedule()
+        tasks = project.tasks_by_code
+        self.assertEqual(cpm.finish, datetime(2024, 1, 17, 17))
+        self.assertEqual(
+            [task.task_code for task in cpm.critical], ["A", "B", "D", "F"]
+        )
+        self.assertEqual(cpm[tasks["C"]].total_float_hr_cnt, 12)
+        self.assertEqual(cpm[tasks["E"]].total_float_hr_cnt, 8)
+        self.assertEqual(cpm[tasks["C"]].late_start, datetime(2024, 1, 17, 8))
+
+    def test_constraint(self):
+        constraint = {"cstr_type": "CS_MSOA", "cstr_date": "2024-01-18 08:00"}
+        project = self.project(network_tasks(C=constraint))
+        cpm = project.schedule()
+        tasks = project.tasks_by_code
+        self.assertDates(
+            cpm, tasks["C"], datetime(2024, 1, 18, 8), datetime(2024, 1, 18, 17)
+        )
+        self.assertEqual(cpm.finish, datetime(2024, 1, 18, 17))
+        self.assertEqual([task.task_code for task in cpm.critical], ["C", "F"])
+
+    def test_progress(self):
+        project = self.project(
+            network_tasks(
+                A={
+                    "status": "TK_Complete",
+                    "start": datetime(2024, 1, 8, 8),
+                    "finish": datetime(2024, 1, 8, 17),
+                },
+                B={"status": "TK_Active", "start": datetime(2024, 1, 9, 8)},
+            )
+        )
+        cpm = project.schedule()
+        tasks = project.tasks_by_code
+        # actual dates are kept, and the remaining work starts at the data date
+        self.assertDates(
+            cpm, tasks["A"], datetime(2024, 1, 8, 8), datetime(2024, 1, 8, 17)
+        )
+        self.assertDates(
+            cpm, tasks["B"], datetime(2024, 1, 9, 8), datetime(2024, 1, 16, 17)
+        )
+        self.assertNotIn(tasks["A"], cpm.critical)
+
+    def test_repeat_and_what_if(self):
+        project = self.project(network_tasks())
+        tasks = project.tasks_by_code
+        first = project.schedule()
+        self.assertEqual(
+            [dates for _, dates in project.schedule()], [dates for _, dates in first]
+        )
+        self.assertIs(project.network, first._scheduler.network)
+
+        # assigned values are used instead of the values of the xer file
+        tasks["B"].remain_drtn_hr_cnt = 32.0
+        tasks["C"].cstr_type = "CS_MSOA"
+        tasks["C"].cstr_date = datetime(2024, 1, 25, 8)
+        cpm = project.schedule()
+        self.assertDates(
+            cpm, tasks["B"], datetime(2024, 1, 16, 8), datetime(2024, 1, 19, 17)
+        )
+        self.assertDates(
+            cpm, tasks["C"], datetime(2024, 1, 25, 8), datetime(2024, 1, 25, 17)
+        )
+        self.assertEqual(first.finish, datetime(2024, 1, 17, 17))
+
+    def test_changed_relationships(self):
+        project = self.project(network_tasks())
+        tasks = project.tasks_by_code
+        project.schedule()
+        rel = next(rel for rel in project.relationships if rel.successor is tasks["C"])
+        rel.lag_hr_cnt = 40.0
+        # the cached network is built again after it is deleted
+        del project.network
+        cpm = project.schedule()
+        self.assertDates(
+            cpm, tasks["C"], datetime(2024, 1, 22, 8), datetime(2024, 1, 22, 17)
+        )
+
+    def test_loop(self):
+        project = self.project(network_tasks(), RELATIONSHIPS + [("D", "A", "FS", 0)])
+        with self.assertRaises(ValueError):
+            project.schedule()
+
+
+class TestFloatPaths(CPMTestCase):
+    def paths_project(self, **options):
+        # X is completed; A, B, D is the driving path into D, then E and C
+        tasks = [
+            task_row(
+                "1",
+                "1",
+                "X",
+                status="TK_Complete",
+                start=datetime(2024, 1, 8, 8),
+                finish=datetime(2024, 1, 8, 17),
+            ),
+            task_row("2", "1", "A", 8),
+            task_row("3", "1", "B", 16),
+            task_row("4", "1", "C", 16),
+            task_row("5", "1", "E", 8),
+            task_row("6", "1", "D", 8),
+            task_row("7", "1", "G", 8),
+        ]
+        relationships = [
+            ("X", "A", "FS", 0),
+            ("A", "B", "FS", 0),
+            ("B", "D", "FS", 0),
+            ("C", "D", "FS", 0),
+            ("E", "D", "FS", 0),
+            ("E", "G", "FS", 16),
+        ]
+        tables = network_tables(tasks, relationships, **options)
+        return Xer.reader(write_xer(self._directory.name, tables)).projects["1"]
+
+    def codes(self, paths) -> list[list[str]]:
+        return [[task.task_code for task in path] for path in paths]
+
+    def test_relative_float(self):
+        project = self.paths_project()
+        target = project.tasks_by_code["D"]
+        paths = project.float_paths(target)
+        self.assertEqual(paths[0], project.driving_path(target))
+        self.assertEqual(self.codes(paths), [["A", "B", "D"], ["C"], ["E"], ["X"]])
+        self.assertEqual(
+            self.codes(project.float_paths(target, 2)), [["A", "B", "D"], ["C"]]
+        )
+
+    def test_total_float(self):
+        project = self.paths_project(use_total_float_multiple_longest_paths="Y")
+        target = project.tasks_by_code["D"]
+        paths = project.float_paths(target)
+        self.assertEqual(paths[0], project.driving_path(target))
+        # E is critical through G, and the completed X is left out
+        self.assertEqual(self.codes(paths), [["A", "B", "D"], ["E"], ["C"]])
+        self.assertNotIn(project.tasks_by_code["X"], project.cpm.critical)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unittests of the index of raw table rows by foreign key.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import sample_tables, write_xer
+from xerparser.src.foreign_keys import FOREIGN_KEYS, ForeignKeyIndex
+from xerparser.src.table import Table
+from xerparser.src.xer import Xer
+
+
+class TestForeignKeyIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tables = sample_tables()
+        self.index = ForeignKeyIndex(self.tables)
+
+    def test_positions(self):
+        rows = self.tables["TASK"]
+        positions = self.index.positions("TASK", "proj_id")
+        self.assertEqual(set(positions), {"1000", "1001"})
+        for proj_id, group in positions.items():
+            self.assertEqual(
+                group, [i for i, row in enumerate(rows) if row["proj_id"] == proj_id]
+            )
+        # each index is built once
+        self.assertIn(("TASK", "proj_id"), self.index)
+        self.assertIs(self.index.positions("TASK", "proj_id"), positions)
+
+    def test_rows_and_count(self):
+        rows = self.index.rows("TASKPRED", "pred_task_id", "1000002")
+        self.assertEqual([row["task_id"] for row in rows], ["1000003"])
+        self.assertEqual(self.index.count("TASKPRED", "pred_task_id", "1000002"), 1)
+        self.assertEqual(self.index.rows("TASKPRED", "pred_task_id", "0"), [])
+        self.assertEqual(self.index.count("TASKPRED", "pred_task_id", "0"), 0)
+
+    def test_missing_table(self):
+        self.assertEqual(self.index.positions("NOT_LOADED", "proj_id"), {})
+        self.assertEqual(self.index.rows("NOT_LOADED", "proj_id", "1000"), [])
+        self.assertEqual(self.index.count("NOT_LOADED", "proj_id", "1000"), 0)
+
+    def test_columnar(self):
+        tables = {
+            name: Table(rows[0], [list(row.values()) for row in rows])
+            for name, rows in self.tables.items()
+            if rows
+        }
+        index = ForeignKeyIndex(tables)
+        for table, columns in FOREIGN_KEYS.items():
+            for column in columns:
+                if table not in tables or column not in tables[table].columns:
+                    continue
+                with self.subTest(table=table, column=column):
+                    self.assertEqual(
+                        index.positions(table, column),
+                        self.index.positions(table, column),
+                    )
+        self.assertEqual(
+            index.rows("TASK", "wbs_id", "10001"),
+            self.index.rows("TASK", "wbs_id", "10001"),
+        )
+
+
+class TestLinking(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._directory = tempfile.TemporaryDirectory()
+        tables = sample_tables()
+        # a project level activity code type
+        code_type = dict(tables["ACTVTYPE"][0])
+        code_type.update(
+            actv_code_type_id="2", proj_id="1001", actv_code_type_scope="AS_Project"
+        )
+        tables["ACTVTYPE"].append(code_type)
+        cls.xer = Xer.reader(write_xer(cls._directory.name, tables))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._directory.cleanup()
+
+    def test_project_calendars(self):
+        # global calendars and the calendars of each project, in table order
+        for project in self.xer.projects.values():
+            with self.subTest(project.short_name):
+                self.assertEqual(
+                    [cal.uid for cal in project.calendars], ["1", f"1{project.uid}"]
+                )
+
+    def test_project_activity_codes(self):
+        projects = self.xer.projects
+        self.assertEqual(projects["1000"].activity_codes, [])
+        self.assertEqual([code.uid for code in projects["1001"].activity_codes], ["2"])
+
+    def test_index_reused(self):
+        self.assertIn(("CALENDAR", "proj_id"), self.xer.foreign_keys)
+        self.assertEqual(
+            len(self.xer.foreign_keys.rows("TASK", "proj_id", "1000")),
+            len(self.xer.projects["1000"].tasks),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Unittests of the memory-mapped table index, run on generated sample files.
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile
+from xerparser.src.index import XerIndex
+from xerparser.src.parser import CODEC, parser
+
+
+class TestXerIndex(SampleFile, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.expected = parser(cls.file.read_text(encoding=CODEC))
+
+    def test_read_tables(self):
+        with XerIndex(self.file) as index:
+            self.assertEqual(index.read_tables(), self.expected)
+            self.assertEqual(list(index), list(self.expected)[1:])
+            self.assertEqual(index.header, self.expected["ERMHDR"])
+
+    def test_table_info(self):
+        with XerIndex(self.file) as index:
+            info = index["TASK"]
+            self.assertEqual(info.row_count, len(self.expected["TASK"]))
+            self.assertEqual(info.columns, list(self.expected["TASK"][0]))
+            with open(self.file, "rb") as f:
+                f.seek(info.offset)
+                self.assertTrue(f.read(info.length).startswith(b"%T\tTASK\r\n"))
+
+    def test_select_tables(self):
+        with XerIndex(self.file) as index:
+            tables = index.read_tables(["TASKPRED", "NOT_A_TABLE"])
+            self.assertEqual(list(tables), ["ERMHDR", "TASKPRED"])
+            self.assertEqual(tables["TASKPRED"], self.expected["TASKPRED"])
+            self.assertNotIn("NOT_A_TABLE", index)
+
+    def test_invalid_file(self):
+        for contents in (b"", b"not a xer file"):
+            path = Path(self._directory.name) / "invalid.xer"
+            path.write_bytes(contents)
+            with self.subTest(contents=contents), self.assertRaises(ValueError):
+                XerIndex(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
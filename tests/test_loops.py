@@ -0,0 +1,108 @@
+"""
+Unittests of finding the relationship loops of a project network.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import network_tables, task_row, write_xer
+from xerparser.src.xer import Xer
+
+# two loops (A, B, C and E, F), a self link (G), and activities outside of them
+RELATIONSHIPS = [
+    ("A", "B", "FS", 0),
+    ("B", "C", "FS", 0),
+    ("C", "A", "SS", 0),
+    ("C", "D", "FS", 0),
+    ("D", "E", "FS", 0),
+    ("E", "F", "FF", 0),
+    ("F", "E", "FS", 0),
+    ("F", "H", "FS", 0),
+    ("G", "G", "FS", 0),
+]
+
+
+class TestLoops(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def network(self, relationships):
+        names = sorted({code for rel in relationships for code in rel[:2]})
+        tasks = [task_row(str(i), "1", code) for i, code in enumerate(names, 1)]
+        tables = network_tables(tasks, relationships)
+        project = Xer.reader(write_xer(self._directory.name, tables)).projects["1"]
+        return project.network
+
+    def assertLoop(self, loop) -> None:
+        """Check the relationships are followed in order back to the start."""
+        for rel, after in zip(loop, loop[1:] + loop[:1]):
+            self.assertIs(rel.successor, after.predecessor)
+
+    def test_strong_components(self):
+        network = self.network(RELATIONSHIPS)
+        components = [
+            sorted(network.tasks[i].task_code for i in component)
+            for component in network.strong_components()
+        ]
+        self.assertEqual(sorted(components), [["A", "B", "C"], ["E", "F"], ["G"]])
+        for component in network.strong_components():
+            self.assertEqual(component, sorted(component))
+
+    def test_loops(self):
+        network = self.network(RELATIONSHIPS)
+        loops = network.loops()
+        self.assertEqual(len(loops), 3)
+        for loop in loops:
+            self.assertLoop(loop)
+        self.assertEqual(
+            sorted([rel.predecessor.task_code for rel in loop] for loop in loops),
+            [["A", "B", "C"], ["E", "F"], ["G"]],
+        )
+
+    def test_shortest_loop(self):
+        # the shortest loop through the first activity of a group is reported
+        network = self.network(
+            [
+                ("A", "B", "FS", 0),
+                ("B", "C", "FS", 0),
+                ("C", "D", "FS", 0),
+                ("D", "A", "FS", 0),
+                ("B", "D", "FS", 0),
+            ]
+        )
+        (loop,) = network.loops()
+        self.assertLoop(loop)
+        self.assertEqual([rel.predecessor.task_code for rel in loop], ["A", "B", "D"])
+
+    def test_long_loop(self):
+        # no recursion, so loops longer than the recursion limit are found
+        size = sys.getrecursionlimit() + 100
+        names = [f"T{i:05}" for i in range(size)]
+        relationships = [
+            (names[i], names[(i + 1) % size], "FS", 0) for i in range(size)
+        ]
+        network = self.network(relationships)
+        (loop,) = network.loops()
+        self.assertEqual(len(loop), size)
+        self.assertLoop(loop)
+
+    def test_no_loops(self):
+        network = self.network([("A", "B", "FS", 0), ("A", "C", "FS", 0)])
+        self.assertEqual(network.strong_components(), [])
+        self.assertEqual(network.loops(), [])
+        self.assertEqual(len(network.topological_order()), 3)
+
+    def test_topological_order(self):
+        with self.assertRaisesRegex(ValueError, "loop"):
+            self.network(RELATIONSHIPS).topological_order()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Unittests of the compressed sparse row network of a project's relationships.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import network_tables, task_row, write_xer
+from xerparser.src.network import FF, FS, SF, SS, Network
+from xerparser.src.xer import Xer
+
+CODES = ["A", "B", "C", "D"]
+RELATIONSHIPS = [
+    ("A", "B", "FS", 0),
+    ("A", "C", "SS", 8),
+    ("B", "D", "FF", 0),
+    ("C", "D", "SF", -4),
+]
+
+
+class NetworkTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def project(self, relationships=RELATIONSHIPS):
+        tasks = [task_row(str(i), "1", code) for i, code in enumerate(CODES, 1)]
+        tables = network_tables(tasks, relationships)
+        return Xer.reader(write_xer(self._directory.name, tables)).projects["1"]
+
+    def numbers(self, network: Network) -> dict[str, int]:
+        """Number of each activity by code."""
+        return {task.task_code: i for i, task in enumerate(network.tasks)}
+
+
+class TestNetwork(NetworkTestCase):
+    def test_arrays(self):
+        network = self.project().network
+        n = self.numbers(network)
+        self.assertEqual(len(network), 4)
+        self.assertEqual(list(network.pred_offsets), [0, 0, 1, 2, 4])
+        self.assertEqual(list(network.succ_offsets), [0, 2, 3, 4, 4])
+        self.assertEqual(list(network.predecessors(n["D"])), [n["B"], n["C"]])
+        self.assertEqual(list(network.successors(n["A"])), [n["B"], n["C"]])
+        self.assertEqual(list(network.pred_types), [FS, SS, FF, SF])
+        self.assertEqual(list(network.pred_lags), [0, 8, 0, -4])
+        self.assertEqual(list(network.succ_types), [FS, SS, FF, SF])
+
+    def test_links(self):
+        # links map the arrays back to the relationship objects
+        network = self.project().network
+        for k, rel_k in enumerate(network.pred_links):
+            rel = network.relationships[rel_k]
+            with self.subTest(rel.link):
+                self.assertIs(network.tasks[network.pred_tasks[k]], rel.predecessor)
+        for k, rel_k in enumerate(network.succ_links):
+            rel = network.relationships[rel_k]
+            self.assertIs(network.tasks[network.succ_tasks[k]], rel.successor)
+
+    def test_index(self):
+        project = self.project()
+        network = project.network
+        for i, task in enumerate(network.tasks):
+            self.assertEqual(network.index(task), i)
+            self.assertIn(task, network)
+        # the network is cached by the project
+        self.assertIs(project.network, network)
+
+    def test_external(self):
+        project = self.project()
+        tasks = project.tasks_by_code
+        network = Network([tasks["A"], tasks["B"], tasks["D"]], project.relationships)
+        self.assertEqual(len(network.relationships), 2)
+        self.assertEqual(sorted(rel.link for rel in network.external), ["SF", "SS"])
+        self.assertNotIn(tasks["C"], network)
+        with self.assertRaises(KeyError):
+            network.index(tasks["C"])
+
+    def test_topological_order(self):
+        network = self.project().network
+        order = network.topological_order()
+        self.assertEqual(sorted(order), list(range(len(network))))
+        position = {i: p for p, i in enumerate(order)}
+        for i in range(len(network)):
+            for j in network.successors(i):
+                self.assertLess(position[i], position[j])
+
+
+if __name__ == "__main__":
+    unittest.main()
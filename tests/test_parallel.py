@@ -0,0 +1,89 @@
+"""
+Unittests of the conversion of large tables in worker processes.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile
+from xerparser.src import parallel
+from xerparser.src import xer as xer_module
+from xerparser.src.parser import read_tables
+from xerparser.src.xer import Xer
+
+
+def task_values(xer: Xer) -> list[tuple]:
+    """Converted fields and links of the activities of an `Xer`."""
+    return [
+        (
+            task.uid,
+            task.status,
+            task.act_start_date,
+            task.remain_drtn_hr_cnt,
+            task.calendar.name,
+            task.wbs.full_code,
+            [(link.task.uid, link.link) for link in task.predecessors],
+            sorted(task.resources),
+        )
+        for task in xer.tasks.values()
+    ]
+
+
+class TestWorkers(SampleFile, unittest.TestCase):
+    sample = {"tasks": 30}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.expected = task_values(Xer.reader(cls.file))
+
+    def test_workers(self):
+        chunks = []
+
+        def record(executor, tables):
+            submit = executor.submit
+
+            def counted(func, name, rows):
+                chunks.append((name, len(rows)))
+                return submit(func, name, rows)
+
+            with mock.patch.object(executor, "submit", side_effect=counted):
+                return parallel.submit_tables(executor, tables)
+
+        # several chunks of each large table are converted by the workers
+        with (
+            mock.patch.object(parallel, "CHUNK_ROWS", 7),
+            mock.patch.object(xer_module, "submit_tables", side_effect=record),
+        ):
+            xer = Xer.reader(self.file, workers=2)
+        tables = read_tables(self.file)
+        for name in ("TASK", "TASKPRED", "TASKRSRC"):
+            sizes = [size for table, size in chunks if table == name]
+            self.assertEqual(sum(sizes), len(tables[name]))
+            self.assertGreater(len(sizes), 1)
+        # the objects hold the converted values, not the rows
+        self.assertFalse(any(hasattr(task, "_row") for task in xer.tasks.values()))
+        self.assertEqual(task_values(xer), self.expected)
+
+    def test_columnar_workers(self):
+        xer = Xer.reader(self.file, workers=2, columnar=True)
+        self.assertEqual(task_values(xer), self.expected)
+
+    def test_convert_rows(self):
+        tables = read_tables(self.file)
+        chunks = [parallel.convert_rows("TASK", tables["TASK"][:7])]
+        chunks.append(parallel.convert_rows("TASK", tables["TASK"][7:]))
+        tasks = parallel.restore_objects("TASK", chunks)
+        self.assertEqual(
+            [task.task_code for task in tasks],
+            [row["task_code"] for row in tables["TASK"]],
+        )
+        self.assertTrue(all(task.calendar is None for task in tasks))
+
+
+if __name__ == "__main__":
+    unittest.main()
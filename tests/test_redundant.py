@@ -0,0 +1,135 @@
+"""
+Unittests of the search for redundant relationships.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import network_tables, task_row, write_xer
+from xerparser.src.utils import find_redundant_logic, find_redundant_relationships
+from xerparser.src.xer import Xer
+
+
+def redundant_logic(project) -> set[tuple[str, str, str]]:
+    """Redundant relationships found by `find_redundant_logic` for each activity."""
+    return {
+        (paths[0].task.task_code, task.task_code, paths[0].link)
+        for task in project.tasks
+        for paths in find_redundant_logic(task)
+    }
+
+
+def codes(relationships) -> set[tuple[str, str, str]]:
+    return {
+        (rel.predecessor.task_code, rel.successor.task_code, rel.link)
+        for rel in relationships
+    }
+
+
+class TestRedundantRelationships(unittest.TestCase):
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def project(self, relationships, loe=()):
+        names = sorted({code for rel in relationships for code in rel[:2]})
+        tasks = [
+            task_row(
+                str(i), "1", code, task_type="TT_LOE" if code in loe else "TT_Task"
+            )
+            for i, code in enumerate(names, 1)
+        ]
+        tables = network_tables(tasks, relationships)
+        return Xer.reader(write_xer(self._directory.name, tables)).projects["1"]
+
+    def test_redundant(self):
+        project = self.project(
+            [
+                ("A", "B", "FS", 0),
+                ("B", "C", "FS", 0),
+                ("A", "C", "FS", 0),
+                ("A", "D", "SS", 0),
+                ("C", "D", "FS", 0),
+            ]
+        )
+        self.assertEqual(
+            codes(find_redundant_relationships(project)), {("A", "C", "FS")}
+        )
+
+    def test_link_types(self):
+        # paths start with the link type of the relationship, and every link
+        # has the same start or end type
+        project = self.project(
+            [
+                ("A", "B", "SF", 0),
+                ("B", "C", "FF", 0),
+                ("A", "C", "SF", 0),
+                ("A", "D", "FS", 0),
+                ("D", "E", "SF", 0),
+                ("A", "E", "FF", 0),
+            ]
+        )
+        self.assertEqual(
+            codes(find_redundant_relationships(project)), {("A", "C", "SF")}
+        )
+        self.assertEqual(redundant_logic(project), {("A", "C", "SF")})
+
+    def test_level_of_effort(self):
+        # only the last activity before the successor can be a level of effort
+        relationships = [
+            ("A", "B", "FS", 0),
+            ("B", "C", "FS", 0),
+            ("C", "D", "FS", 0),
+            ("A", "D", "FS", 0),
+        ]
+        project = self.project(relationships, loe={"C"})
+        self.assertEqual(
+            codes(find_redundant_relationships(project)), {("A", "D", "FS")}
+        )
+        project = self.project(relationships, loe={"B"})
+        self.assertEqual(find_redundant_relationships(project), [])
+        self.assertEqual(redundant_logic(project), set())
+
+    def test_order(self):
+        project = self.project(
+            [
+                ("B", "C", "FS", 0),
+                ("C", "D", "FS", 0),
+                ("B", "D", "FS", 0),
+                ("A", "B", "FS", 0),
+                ("A", "D", "FS", 0),
+            ]
+        )
+        redundant = find_redundant_relationships(project)
+        order = [rel for rel in project.relationships if rel in redundant]
+        self.assertEqual(redundant, order)
+        self.assertEqual(codes(redundant), {("B", "D", "FS"), ("A", "D", "FS")})
+
+    def test_matches_find_redundant_logic(self):
+        rnd = random.Random(7)
+        names = [f"T{i:02}" for i in range(40)]
+        relationships = {
+            (names[i], names[j], rnd.choice(["FS", "SS", "FF", "SF"]), 0)
+            for _ in range(120)
+            for i, j in [sorted(rnd.sample(range(len(names)), 2))]
+        }
+        project = self.project(sorted(relationships), loe={"T05", "T17", "T30"})
+        self.assertEqual(
+            codes(find_redundant_relationships(project)), redundant_logic(project)
+        )
+
+    def test_loop(self):
+        project = self.project([("A", "B", "FS", 0), ("B", "A", "FS", 0)])
+        with self.assertRaises(ValueError):
+            find_redundant_relationships(project)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Unittests of the schema registry and the values of table rows.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import sample_tables
+from xerparser.src.registry import SCHEMAS, table_values
+from xerparser.src.table import Table
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tables = sample_tables(1, 4)
+
+    def test_schemas(self):
+        for name, cls in SCHEMAS.items():
+            with self.subTest(name):
+                self.assertEqual(cls.__name__, name)
+
+    def test_table_values(self):
+        rows = self.tables["TASK"]
+        columns, values = table_values(rows)
+        self.assertEqual(columns, tuple(rows[0]))
+        self.assertEqual(list(values), [tuple(row.values()) for row in rows])
+
+        table = Table(rows[0], [list(row.values()) for row in rows])
+        self.assertEqual(table_values(table)[0], columns)
+        self.assertEqual(
+            list(table_values(table)[1]), [tuple(row.values()) for row in rows]
+        )
+
+        self.assertEqual(table_values([]), ((), ()))
+
+    def test_missing_values(self):
+        # rows missing a column get an empty value
+        rows = [{"a": "1", "b": "2"}, {"a": "3"}]
+        columns, values = table_values(rows)
+        self.assertEqual(columns, ("a", "b"))
+        self.assertEqual([list(v) for v in values], [["1", "2"], ["3", ""]])
+
+
+if __name__ == "__main__":
+    unittest.main()
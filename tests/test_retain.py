@@ -0,0 +1,127 @@
+"""
+Unittests of releasing the raw tables once the objects are built.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile, sample_tables, write_xer
+from xerparser.src.registry import SCHEMAS
+from xerparser.src.table import Table
+from xerparser.src.xer import Xer
+
+
+class TestRetain(SampleFile, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.xer = Xer.reader(cls.file)
+
+    def test_retain_all(self):
+        xer = Xer.reader(self.file, retain="all")
+        self.assertEqual(xer.tables.keys(), self.xer.tables.keys())
+        self.assertEqual(xer.released_tables, [])
+
+    def test_retain_unconverted(self):
+        xer = Xer.reader(self.file, retain="unconverted")
+        self.assertEqual(
+            set(xer.tables), {"CURRTYPE", "PROJPCAT", "TASKACTV", "UDFVALUE"}
+        )
+        self.assertTrue(all(name in SCHEMAS for name in xer.released_tables[1:]))
+        self.assertIn("ERMHDR", xer.released_tables)
+        # the retained tables are still linked to the objects
+        task = xer.tasks["1000002"]
+        self.assertEqual(task.activity_codes, self.xer.tasks["1000002"].activity_codes)
+        self.assertEqual(
+            list(map(str, task.user_defined_fields.values())),
+            list(map(str, self.xer.tasks["1000002"].user_defined_fields.values())),
+        )
+
+    def test_retain_none(self):
+        xer = Xer.reader(self.file, retain="none")
+        self.assertEqual(xer.tables, {})
+        self.assertEqual(set(xer.released_tables), set(self.xer.tables))
+        # objects keep the values of the released rows
+        task = xer.tasks["1000003"]
+        self.assertEqual(task.act_start_date, self.xer.tasks["1000003"].act_start_date)
+        self.assertEqual(task.predecessors[0].task, xer.tasks["1000002"])
+        project = xer.projects["1000"]
+        self.assertEqual(project.actual_cost, self.xer.projects["1000"].actual_cost)
+        self.assertEqual(
+            [cal.name for cal in project.calendars], ["Standard", "Calendar 1000"]
+        )
+
+    def test_rows_released(self):
+        for retain in ("unconverted", "none"):
+            with self.subTest(retain):
+                xer = Xer.reader(self.file, retain=retain)
+                objects = [
+                    *xer.projects.values(),
+                    *xer.tasks.values(),
+                    *xer.relationships.values(),
+                    *(
+                        rsrc
+                        for task in xer.tasks.values()
+                        for rsrc in task.resources.values()
+                    ),
+                ]
+                self.assertTrue(objects)
+                self.assertFalse([obj for obj in objects if hasattr(obj, "_row")])
+        xer = Xer.reader(self.file, retain="all")
+        self.assertTrue(hasattr(xer.tasks["1000003"], "_row"))
+
+    def test_release_tables(self):
+        xer = Xer.reader(self.file, lazy=True)
+        xer.release_tables()
+        # all objects are built before the tables are released
+        self.assertNotIn("TASK", xer.tables)
+        self.assertEqual(xer.tasks.keys(), self.xer.tasks.keys())
+        self.assertEqual(
+            [len(project.tasks) for project in xer.projects.values()],
+            [len(project.tasks) for project in self.xer.projects.values()],
+        )
+        self.assertEqual(xer.foreign_keys.positions("TASK", "proj_id"), {})
+        with self.assertRaises(ValueError):
+            xer.release_tables("some")
+
+    def test_read_released_table(self):
+        xer = Xer.reader(self.file, retain="none")
+        for name in ("ERMHDR", "TASK", "UDFVALUE"):
+            with self.subTest(name):
+                self.assertEqual(xer.table(name), self.xer.tables[name])
+        self.assertNotIn("TASK", xer.tables)
+        with self.assertRaises(KeyError):
+            xer.table("RCATTYPE")
+
+    def test_read_columnar(self):
+        xer = Xer.reader(self.file, columnar=True, retain="none")
+        table = xer.table("TASKPRED")
+        self.assertIsInstance(table, Table)
+        self.assertEqual(list(table), self.xer.tables["TASKPRED"])
+
+    def test_read_filtered(self):
+        xer = Xer.reader(self.file, projects=["1001"], retain="none")
+        self.assertEqual({row["proj_id"] for row in xer.table("TASK")}, {"1001"})
+        self.assertEqual([row["proj_id"] for row in xer.table("PROJECT")], ["1001"])
+
+    def test_stream(self):
+        xer = Xer.reader(io.BytesIO(self.file.read_bytes()), retain="none")
+        with self.assertRaises(ValueError):
+            xer.table("TASK")
+
+    def test_file_changed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file = write_xer(directory, sample_tables(1))
+            xer = Xer.reader(file, retain="none")
+            write_xer(directory, sample_tables(2))
+            with self.assertRaises(ValueError):
+                xer.table("TASK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Unittests of the lazy row fields and slots of the schema classes.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile, task_row
+from xerparser.schemas._field import (
+    field_values,
+    load_fields,
+    object_state,
+    row_fields,
+)
+from xerparser.schemas.task import TASK
+from xerparser.src.xer import Xer
+
+
+def is_converted(obj, name: str) -> bool:
+    """Check if the value of a row field is stored in its slot."""
+    try:
+        getattr(type(obj), f"_{name}").__get__(obj)
+    except AttributeError:
+        return False
+    return True
+
+
+class SchemaTestCase(SampleFile, unittest.TestCase):
+    def setUp(self) -> None:
+        self.xer = Xer.reader(self.file)
+        self.task = self.xer.tasks["1000003"]
+
+
+class TestRowFields(SchemaTestCase):
+    def test_converted_on_first_read(self):
+        self.assertFalse(is_converted(self.task, "act_start_date"))
+        self.assertEqual(self.task.act_start_date, datetime(2024, 1, 4, 8))
+        self.assertTrue(is_converted(self.task, "act_start_date"))
+        self.assertIs(self.task.act_start_date, self.task.act_start_date)
+
+    def test_assign_and_delete(self):
+        self.task.remain_drtn_hr_cnt = 4.0
+        self.assertEqual(self.task.remain_drtn_hr_cnt, 4.0)
+        # deleting the attribute converts the raw value again
+        del self.task.remain_drtn_hr_cnt
+        self.assertEqual(self.task.remain_drtn_hr_cnt, 0.0)
+
+    def test_invalid_value(self):
+        # invalid values raise when the field is read
+        row = task_row("1", "1", "A", act_start_date="not a date", status="TK_Active")
+        task = self.xer.tasks["1000000"]
+        task._row = row
+        with self.assertRaises(ValueError) as error:
+            task.act_start_date
+        # the error names the table and column of the value
+        self.assertEqual(
+            str(error.exception),
+            "Invalid value 'not a date' in column act_start_date of table TASK",
+        )
+        task._row["task_type"] = "TT_Unknown"
+        with self.assertRaises(ValueError):
+            task.type
+        with self.assertRaises(ValueError):
+            field_values([self.task, task], "act_start_date")
+
+    def test_load_fields(self):
+        load_fields(self.task)
+        self.assertFalse(hasattr(self.task, "_row"))
+        self.assertTrue(all(is_converted(self.task, name) for name in row_fields(TASK)))
+        self.assertEqual(self.task.status, TASK.TaskStatus.TK_Active)
+
+    def test_field_values(self):
+        tasks = list(self.xer.tasks.values())
+        self.task.remain_drtn_hr_cnt = 4.0
+        values = field_values(tasks, "remain_drtn_hr_cnt")
+        # assigned values are kept, and the other values are converted and stored
+        self.assertEqual(values[tasks.index(self.task)], 4.0)
+        self.assertTrue(all(is_converted(task, "remain_drtn_hr_cnt") for task in tasks))
+        self.assertEqual(values, [task.remain_drtn_hr_cnt for task in tasks])
+        self.assertEqual(field_values([], "remain_drtn_hr_cnt"), [])
+
+
+class TestSlots(SchemaTestCase):
+    def test_no_instance_dict(self):
+        for obj in (
+            self.task,
+            next(iter(self.xer.relationships.values())),
+            next(iter(self.xer.projects.values())),
+            self.task.predecessors[0],
+        ):
+            with self.subTest(type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    obj.not_an_attribute = 1
+
+    def test_cached_slot(self):
+        project = self.xer.projects["1000"]
+        cost = project.actual_cost
+        self.assertIs(project.tasks_by_code, project.tasks_by_code)
+        project.tasks.pop()
+        self.assertEqual(project.actual_cost, cost)
+        # deleting the attribute clears the cached value
+        del project.tasks_by_code
+        self.assertEqual(len(project.tasks_by_code), len(project.tasks))
+
+    def test_object_state(self):
+        state = object_state(self.task)
+        self.assertEqual(state["task_code"], "A003")
+        self.assertIs(state["calendar"], self.task.calendar)
+
+
+if __name__ == "__main__":
+    unittest.main()
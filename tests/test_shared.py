@@ -0,0 +1,126 @@
+"""
+Unittests of sharing the objects of an Xer with worker processes.
+"""
+
+import os
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile
+from xerparser.src.shared import SHARED_TABLES, SharedXerView
+from xerparser.src.xer import Xer
+
+
+def shared_summary(name: str) -> tuple:
+    """Values read from a shared block in a worker process."""
+    with SharedXerView(name) as view:
+        tasks = view.tables["TASK"]
+        return (
+            len(tasks),
+            tasks.column("task_code"),
+            tasks.column("act_start_date"),
+            [status.name for status in tasks.column("status")],
+        )
+
+
+class TestShared(SampleFile, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.xer = Xer.reader(cls.file)
+        cls.shared = cls.xer.share()
+        cls.view = SharedXerView(cls.shared.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.view.close()
+        cls.shared.close()
+        cls.shared.unlink()
+        super().tearDownClass()
+
+    def test_tables(self):
+        self.assertEqual(list(self.view.tables), list(SHARED_TABLES))
+        self.assertEqual(len(self.view.tables["TASK"]), len(self.xer.tasks))
+        self.assertEqual(len(self.view.tables["PROJECT"]), len(self.xer.projects))
+
+    def test_columns(self):
+        tasks = list(self.xer.tasks.values())
+        table = self.view.tables["TASK"]
+        for column in table.columns:
+            if table.kind(column) == "ref":
+                continue
+            with self.subTest(column):
+                self.assertEqual(
+                    table.column(column), [getattr(t, column) for t in tasks]
+                )
+
+    def test_references(self):
+        tasks = list(self.xer.tasks.values())
+        nodes = list(self.xer.wbs_nodes.values())
+        table = self.view.tables["TASK"]
+        self.assertEqual(table.ref_table("wbs"), "PROJWBS")
+        self.assertEqual(
+            [nodes[i] for i in table.column("wbs")], [t.wbs for t in tasks]
+        )
+
+    def test_arrays(self):
+        table = self.view.tables["TASK"]
+        self.assertEqual(
+            table.array("remain_drtn_hr_cnt").tolist(),
+            [t.remain_drtn_hr_cnt for t in self.xer.tasks.values()],
+        )
+        with self.assertRaises(TypeError):
+            table.array("remain_drtn_hr_cnt")[0] = 1.0
+
+    def test_lookups(self):
+        table = self.view.tables["TASK"]
+        uids = list(self.xer.tasks)
+        self.assertEqual(table.position(uids[5]), 5)
+        with self.assertRaises(KeyError):
+            table.position("0")
+        by_project = table.positions("proj_id")
+        self.assertEqual(
+            {proj_id: len(rows) for proj_id, rows in by_project.items()},
+            {"1000": 12, "1001": 12},
+        )
+        self.assertEqual(table.labels("task_code")[0], "A000")
+
+    def test_worker_process(self):
+        tasks = list(self.xer.tasks.values())
+        with ProcessPoolExecutor(1) as executor:
+            result = executor.submit(shared_summary, self.shared.name).result()
+        self.assertEqual(
+            result,
+            (
+                len(tasks),
+                [t.task_code for t in tasks],
+                [t.act_start_date for t in tasks],
+                [t.status.name for t in tasks],
+            ),
+        )
+
+    def test_subset(self):
+        with self.xer.share(["TASKPRED"]) as shared:
+            with SharedXerView(shared.name) as view:
+                self.assertEqual(list(view.tables), ["TASKPRED"])
+                # references to tables that are not shared are not stored
+                self.assertNotIn("predecessor", view.tables["TASKPRED"].columns)
+        with self.assertRaises(ValueError):
+            self.xer.share(["TASKMEMO"])
+
+    def test_not_shared_block(self):
+        shm = SharedMemory(create=True, size=64)
+        try:
+            with self.assertRaises(ValueError):
+                SharedXerView(shm.name)
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
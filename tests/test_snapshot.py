@@ -0,0 +1,104 @@
+"""
+Unittests of saving and loading snapshots of parsed .xer files.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile, summary
+from xerparser.src import snapshot
+from xerparser.src.snapshot import MAGIC, SNAPSHOT_VERSION
+from xerparser.src.table import Table
+from xerparser.src.xer import Xer
+
+
+class TestSnapshot(SampleFile, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.expected = summary(Xer.reader(cls.file))
+
+    def setUp(self) -> None:
+        self._snapshots = tempfile.TemporaryDirectory()
+        self.path = Path(self._snapshots.name) / "sample.snap"
+
+    def tearDown(self) -> None:
+        self._snapshots.cleanup()
+
+    def round_trip(self, xer: Xer) -> Xer:
+        xer.save_snapshot(self.path)
+        return Xer.load_snapshot(self.path)
+
+    def test_round_trip(self):
+        xer = Xer.reader(self.file)
+        loaded = self.round_trip(xer)
+        self.assertEqual(summary(loaded), self.expected)
+        self.assertEqual(loaded.tables, xer.tables)
+        self.assertEqual(loaded.export_info, xer.export_info)
+
+    def test_references(self):
+        loaded = self.round_trip(Xer.reader(self.file))
+        project = loaded.projects["1000"]
+        task = loaded.tasks["1000003"]
+        # objects are shared, not copied, between collections
+        self.assertIs(task, project.tasks[3])
+        self.assertIs(task.wbs, loaded.wbs_nodes[task.wbs_id])
+        self.assertIs(task.calendar, loaded.calendars[task.clndr_id])
+        self.assertIs(task.predecessors[0].task, loaded.tasks["1000002"])
+        self.assertIs(task.status, type(task.status).TK_Active)
+        self.assertEqual(task.act_start_date, datetime(2024, 1, 4, 8))
+
+    def test_options(self):
+        for kwargs in ({"columnar": True}, {"lazy": True}, {"retain": "none"}):
+            with self.subTest(**kwargs):
+                xer = Xer.reader(self.file, **kwargs)
+                loaded = self.round_trip(xer)
+                self.assertEqual(summary(loaded)["projects"], self.expected["projects"])
+                self.assertEqual(list(loaded.tables), list(xer.tables))
+                self.assertEqual(loaded.released_tables, xer.released_tables)
+
+    def test_columnar_tables(self):
+        xer = Xer.reader(self.file, columnar=True)
+        loaded = self.round_trip(xer)
+        self.assertIsInstance(loaded.tables["TASK"], Table)
+        self.assertEqual(list(loaded.tables["TASK"]), list(xer.tables["TASK"]))
+
+    def test_released_tables(self):
+        loaded = self.round_trip(Xer.reader(self.file, retain="none"))
+        with self.assertRaises(ValueError):
+            loaded.table("TASK")
+
+    def test_invalid_file(self):
+        for data in (b"", b"not a snapshot file"):
+            self.path.write_bytes(data)
+            with self.subTest(data), self.assertRaises(ValueError):
+                Xer.load_snapshot(self.path)
+
+    def test_version(self):
+        Xer.reader(self.file).save_snapshot(self.path)
+        data = bytearray(self.path.read_bytes())
+        struct.pack_into("<H", data, len(MAGIC), SNAPSHOT_VERSION + 1)
+        self.path.write_bytes(bytes(data))
+        with self.assertRaisesRegex(ValueError, "format"):
+            Xer.load_snapshot(self.path)
+
+        Xer.reader(self.file).save_snapshot(self.path)
+        with mock.patch("xerparser.__version__", "0.0.0"):
+            with self.assertRaisesRegex(ValueError, "xerparser"):
+                Xer.load_snapshot(self.path)
+
+    def test_outside_class(self):
+        with self.assertRaises(ValueError):
+            snapshot._import("os:system")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unittests of reading the projects of .xer files without parsing the schedules.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile, sample_tables, write_xer
+from xerparser.src.batch import sniff_many
+from xerparser.src.errors import CorruptXerFile
+from xerparser.src.sniff import sniff
+from xerparser.src.xer import Xer
+
+
+class ReadCounter(io.BytesIO):
+    """Bytes stream counting the bytes that were read."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class TestSniff(SampleFile, unittest.TestCase):
+    sample = {"tasks": 200}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        tables = sample_tables(1)
+        del tables["PROJECT"]
+        cls.corrupt = write_xer(cls._directory.name, tables, "corrupt.xer")
+        cls.xer = Xer.reader(cls.file)
+
+    def test_matches_reader(self):
+        summary = sniff(self.file)
+        self.assertEqual(summary.export_info, self.xer.export_info)
+
+        # projects that are not exported are included
+        self.assertEqual(
+            [(p.uid, p.export_flag) for p in summary.projects],
+            [("1000", True), ("1001", True), ("9999", False)],
+        )
+        for project in summary.projects[:2]:
+            expected = self.xer.projects[project.uid]
+            with self.subTest(project.short_name):
+                self.assertEqual(project.short_name, expected.short_name)
+                self.assertEqual(project.name, expected.name)
+                self.assertEqual(project.data_date, expected.data_date)
+                self.assertEqual(project.plan_start_date, expected.plan_start_date)
+                self.assertEqual(project.finish_date, expected.finish_date)
+                self.assertEqual(
+                    project.last_schedule_date, expected.last_schedule_date
+                )
+                self.assertEqual(
+                    str(project), f"{expected.short_name} - {expected.name}"
+                )
+
+    def test_stops_reading(self):
+        data = self.file.read_bytes()
+        stream = ReadCounter(data)
+        self.assertEqual(len(sniff(stream, chunk_size=1024).projects), 3)
+        self.assertLess(stream.bytes_read, len(data) / 2)
+
+    def test_missing_project_table(self):
+        with self.assertRaises(CorruptXerFile):
+            sniff(self.corrupt)
+
+
+class TestSniffMany(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._directory = tempfile.TemporaryDirectory()
+        directory = Path(cls._directory.name)
+        (directory / "sub").mkdir()
+        cls.files = [
+            write_xer(directory, sample_tables(1), "a.xer"),
+            write_xer(directory, sample_tables(2), "b.XER"),
+            write_xer(directory / "sub", sample_tables(3), "c.xer"),
+        ]
+        (directory / "notes.txt").write_text("not a .xer file")
+        tables = sample_tables(1)
+        del tables["PROJECT"]
+        cls.corrupt = write_xer(directory / "sub", tables, "corrupt.xer")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._directory.cleanup()
+
+    def test_files(self):
+        results = list(sniff_many(self.files, workers=2))
+        self.assertEqual([result.file for result in results], self.files)
+        # the non-exported project is included in each file
+        self.assertEqual([len(result.value.projects) for result in results], [2, 3, 4])
+
+    def test_directory(self):
+        results = list(sniff_many(self._directory.name, workers=1))
+        self.assertEqual([result.file for result in results], self.files[:2])
+
+        results = list(sniff_many(self._directory.name, workers=2, recursive=True))
+        self.assertEqual(len(results), 4)
+        (corrupt,) = [result for result in results if result.is_corrupt]
+        self.assertEqual(corrupt.file, self.corrupt)
+        self.assertIsNone(corrupt.value)
+        self.assertEqual(corrupt.errors, ["Missing Required Table PROJECT"])
+
+    def test_missing_file(self):
+        missing = Path(self._directory.name) / "missing.xer"
+        results = list(sniff_many([missing, self.files[0]], workers=2))
+        self.assertTrue(results[0].is_corrupt)
+        self.assertIn("FileNotFoundError", results[0].errors[0])
+        self.assertEqual(len(results[1].value.projects), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Unittests of the streaming .xer file reader, run on generated sample files.
+"""
+
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import sample_tables, xer_text
+from xerparser.src.parser import CODEC, iter_tables, parser, read_tables
+from xerparser.src.xer import Xer
+
+
+class TestStreaming(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.contents = xer_text(sample_tables())
+        cls.data = cls.contents.encode(CODEC)
+        cls.expected = parser(cls.contents)
+
+    def test_read_tables(self):
+        self.assertEqual(read_tables(io.BytesIO(self.data)), self.expected)
+
+    def test_chunk_size(self):
+        # lines and "\r\n" line endings split across chunks
+        for chunk_size in (1, 7, 64, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                tables = read_tables(io.BytesIO(self.data), chunk_size=chunk_size)
+                self.assertEqual(tables, self.expected)
+
+    def test_no_final_line_ending(self):
+        data = self.data.rstrip(b"\r\n")
+        self.assertEqual(read_tables(io.BytesIO(data)), self.expected)
+
+    def test_iter_tables(self):
+        names = [name for name, _, _ in iter_tables(io.BytesIO(self.data))]
+        self.assertEqual(names, list(self.expected))
+
+    def test_skip_rows(self):
+        # rows that are not consumed are skipped
+        tables = {}
+        for name, cols, rows in iter_tables(io.BytesIO(self.data), chunk_size=64):
+            if name == "TASK":
+                continue
+            if name == "PROJECT":
+                tables[name] = [dict(zip(cols, next(rows)))]
+                continue
+            tables[name] = [dict(zip(cols, row)) for row in rows]
+        self.assertNotIn("TASK", tables)
+        self.assertEqual(tables["PROJECT"], self.expected["PROJECT"][:1])
+        self.assertEqual(tables["TASKPRED"], self.expected["TASKPRED"])
+
+    def test_xer_reader(self):
+        # binary files are read as a stream instead of being decoded whole
+        xer = Xer.reader(io.BytesIO(self.data))
+        self.assertEqual(xer.tables, self.expected)
+        self.assertEqual(xer.tasks.keys(), Xer(self.contents).tasks.keys())
+
+    def test_invalid_file(self):
+        with self.assertRaises(ValueError):
+            read_tables(io.BytesIO(b"not a xer file"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unittests of the columnar `Table`, run on generated sample files.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile
+from xerparser.src.parser import read_tables
+from xerparser.src.table import Table
+from xerparser.src.xer import Xer
+
+
+class TestTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = Table(["a", "b"], [["1", "2"], ["3"], ["5", "6", "7"]])
+
+    def test_rows(self):
+        rows = [{"a": "1", "b": "2"}, {"a": "3", "b": ""}, {"a": "5", "b": "6"}]
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(list(self.table), rows)
+        self.assertEqual(self.table[-1], rows[-1])
+        self.assertEqual(self.table[1:], rows[1:])
+        with self.assertRaises(IndexError):
+            self.table[3]
+
+    def test_columns(self):
+        self.assertEqual(self.table.column("b"), ["2", "", "6"])
+        self.assertEqual(
+            list(self.table.iter_values()), [("1", "2"), ("3", ""), ("5", "6")]
+        )
+        self.table.extend_values([["8", "9"]])
+        self.assertEqual(self.table.column("a"), ["1", "3", "5", "8"])
+
+    def test_equal_to_rows(self):
+        rows = [{"a": "1", "b": "2"}, {"a": "3", "b": ""}, {"a": "5", "b": "6"}]
+        self.assertEqual(self.table, rows)
+        self.assertEqual(rows, self.table)
+        self.assertEqual(
+            self.table, Table(["a", "b"], [list(r.values()) for r in rows])
+        )
+        self.assertNotEqual(self.table, rows[:2])
+        self.assertNotEqual(self.table, Table(["a", "b"]))
+
+    def test_mutation(self):
+        # rows are added and replaced like a list of row dictionaries
+        self.table.append({"a": "8", "b": "9"})
+        self.table.insert(0, {"b": "0"})
+        self.table[1] = {"a": "10", "b": "11"}
+        del self.table[2]
+        self.table += [{"a": "12", "c": "13"}]
+        self.assertEqual(self.table.columns, ["a", "b", "c"])
+        self.assertEqual(
+            self.table,
+            [
+                {"a": "", "b": "0", "c": ""},
+                {"a": "10", "b": "11", "c": ""},
+                {"a": "5", "b": "6", "c": ""},
+                {"a": "8", "b": "9", "c": ""},
+                {"a": "12", "b": "", "c": "13"},
+            ],
+        )
+        self.assertEqual(self.table.pop(), {"a": "12", "b": "", "c": "13"})
+        del self.table[:2]
+        self.assertEqual(self.table.column("a"), ["5", "8"])
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+        self.assertEqual(self.table, [])
+
+
+class TestColumnar(SampleFile, unittest.TestCase):
+    def test_read_tables(self):
+        rows = read_tables(self.file)
+        tables = read_tables(self.file, columnar=True)
+        self.assertEqual(tables["ERMHDR"], rows["ERMHDR"])
+        for name, table in tables.items():
+            if name != "ERMHDR":
+                self.assertIsInstance(table, Table)
+                self.assertEqual(list(table), rows[name])
+
+    def test_xer_reader(self):
+        xer = Xer.reader(self.file, columnar=True)
+        self.assertIsInstance(xer.tables["TASK"], Table)
+        self.assertEqual(xer.tables["TASK"], Xer.reader(self.file).tables["TASK"])
+        # the objects are built from the rows of the columns
+        rows = Xer.reader(self.file)
+        self.assertEqual(
+            [(task.task_code, task.target_drtn_hr_cnt) for task in xer.tasks.values()],
+            [(task.task_code, task.target_drtn_hr_cnt) for task in rows.tasks.values()],
+        )
+        self.assertEqual(xer.relationships.keys(), rows.relationships.keys())
+
+
+if __name__ == "__main__":
+    unittest.main()
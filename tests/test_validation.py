@@ -0,0 +1,188 @@
+"""
+Unittests of the checks run while the tables of a .xer file are read.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile, sample_tables, task_row, write_xer
+from xerparser.schemas._field import SlotCache
+from xerparser.src.errors import CorruptXerFile, find_xer_errors
+from xerparser.src.validation import (
+    Check,
+    MissingReferences,
+    RequiredColumns,
+    RequiredTablePairs,
+    RequiredTables,
+    Validator,
+    default_checks,
+    validate,
+)
+from xerparser.src.xer import Xer
+
+
+class CountRows(Check):
+    """Check reporting tables with more than `limit` rows."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts: dict[str, int] = {}
+
+    def start(self, table, columns):
+        self.counts[table] = 0
+
+        def count(row) -> None:
+            self.counts[table] += 1
+
+        return count
+
+    def errors(self, tables) -> list[str]:
+        return [
+            f"Too many rows in {table}"
+            for table, count in self.counts.items()
+            if count > self.limit
+        ]
+
+
+class TestChecks(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tables = sample_tables()
+
+    def test_no_errors(self):
+        self.assertEqual(find_xer_errors(self.tables), [])
+        self.assertEqual(Check().errors(self.tables), [])
+
+    def test_required_tables(self):
+        del self.tables["TASK"], self.tables["CALENDAR"]
+        self.assertEqual(
+            validate(self.tables, [RequiredTables()]),
+            ["Missing Required Table CALENDAR", "Missing Required Table TASK"],
+        )
+        self.assertEqual(validate(self.tables, [RequiredTables(["PROJECT"])]), [])
+        self.assertEqual(
+            find_xer_errors(self.tables, required_tables=["PROJECT", "TASK"]),
+            ["Missing Required Table TASK"],
+        )
+
+    def test_required_table_pairs(self):
+        del self.tables["MEMOTYPE"]
+        self.assertEqual(
+            validate(self.tables, [RequiredTablePairs()]),
+            ["Missing Table MEMOTYPE Required for Table TASKMEMO"],
+        )
+        # pairs outside of the loaded subset are not checked
+        self.assertEqual(find_xer_errors(self.tables, subset={"PROJECT", "TASK"}), [])
+
+    def test_required_columns(self):
+        for row in self.tables["TASK"]:
+            del row["target_drtn_hr_cnt"], row["cstr_type"]
+        self.assertEqual(
+            find_xer_errors(self.tables),
+            ["Table TASK is Missing Required Columns cstr_type, target_drtn_hr_cnt"],
+        )
+        check = RequiredColumns({"TASK": ["task_id"], "PROJECT": ["proj_url"]})
+        self.assertEqual(
+            validate(self.tables, [check]),
+            ["Table PROJECT is Missing Required Columns proj_url"],
+        )
+
+    def test_missing_references(self):
+        self.tables["TASK"].extend(
+            task_row(f"1000{i}", proj_id, f"X{i}", clndr_id="404")
+            for i, proj_id in enumerate(("1000", "1000", "1001", "9999"))
+        )
+        # tasks of projects that are not exported are not checked
+        self.assertEqual(
+            find_xer_errors(self.tables),
+            ["XER is Missing 1 Calendars Assigned to 3 Tasks"],
+        )
+
+    def test_references_in_any_order(self):
+        check = MissingReferences("TASK", "clndr_id", "CALENDAR", "clndr_id", "{rows}")
+        tables = dict(reversed(self.tables.items()))
+        self.assertEqual(validate(tables, [check]), [])
+        del tables["CALENDAR"]
+        self.assertEqual(validate(tables, [check]), [str(len(self.tables["TASK"]))])
+
+    def test_custom_check(self):
+        check = CountRows(20)
+        self.assertEqual(
+            validate(self.tables, [check]),
+            ["Too many rows in TASK", "Too many rows in TASKPRED"],
+        )
+        # each file is checked with a copy
+        self.assertEqual(check.counts, {})
+
+    def test_validator(self):
+        validator = Validator([CountRows(0), RequiredTables(["PROJECT"])])
+        rows = validator.read("TASK", ["task_id"], iter([["1"], ["2"]]))
+        # rows are checked as they are iterated over
+        self.assertEqual(validator.errors(), ["Missing Required Table PROJECT"])
+        self.assertEqual(list(rows), [["1"], ["2"]])
+        self.assertEqual(validator.tables, ["TASK"])
+        self.assertEqual(
+            validator.errors(),
+            ["Too many rows in TASK", "Missing Required Table PROJECT"],
+        )
+
+    def test_default_checks(self):
+        checks = default_checks(subset={"PROJECT", "TASKRSRC"})
+        self.assertEqual(checks[0].tables, {"PROJECT"})
+        self.assertEqual(checks[1].pairs, {("TASKRSRC", "RSRC")})
+
+    def test_slot_cache_is_abstract(self):
+        with self.assertRaises(TypeError):
+            SlotCache()
+
+
+class TestReaderChecks(SampleFile, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        tables = sample_tables()
+        del tables["PROJWBS"]
+        cls.corrupt = write_xer(cls._directory.name, tables, "corrupt.xer")
+        tables = sample_tables()
+        for row in tables["TASKPRED"]:
+            del row["lag_hr_cnt"]
+        cls.no_lags = write_xer(cls._directory.name, tables, "no_lags.xer")
+
+    def test_corrupt_file(self):
+        with self.assertRaises(CorruptXerFile) as error:
+            Xer.reader(self.corrupt)
+        self.assertEqual(error.exception.errors, ["Missing Required Table PROJWBS"])
+        self.assertIn("PROJWBS", str(error.exception))
+
+    def test_missing_column(self):
+        # row fields are converted when first used, but their columns are
+        # checked when the file is read
+        with self.assertRaises(CorruptXerFile) as error:
+            Xer.reader(self.no_lags, lazy=True)
+        self.assertEqual(
+            error.exception.errors,
+            ["Table TASKPRED is Missing Required Columns lag_hr_cnt"],
+        )
+
+    def test_required_tables(self):
+        with self.assertRaises(CorruptXerFile) as error:
+            Xer.reader(self.file, required_tables=["RCATTYPE", "TASK"])
+        self.assertEqual(error.exception.errors, ["Missing Required Table RCATTYPE"])
+
+    def test_checks(self):
+        with self.assertRaises(CorruptXerFile) as error:
+            Xer.reader(self.file, checks=[CountRows(20)])
+        self.assertEqual(
+            error.exception.errors,
+            ["Too many rows in TASK", "Too many rows in TASKPRED"],
+        )
+        self.assertEqual(len(Xer.reader(self.file, checks=[CountRows(50)]).tasks), 24)
+
+
+if __name__ == "__main__":
+    unittest.main()
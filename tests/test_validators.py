@@ -0,0 +1,56 @@
+"""
+Unittests of the functions converting raw .xer values.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from xerparser.src.validators import date_format, optional_date, parse_date
+
+
+class TestParseDate(unittest.TestCase):
+    def test_matches_strptime(self):
+        for value in (
+            "2024-01-15 08:00",
+            "1999-12-31 23:59",
+            "2024-02-29 00:00",
+            "2000-01-01 12:30",
+        ):
+            with self.subTest(value):
+                self.assertEqual(
+                    parse_date(value), datetime.strptime(value, date_format)
+                )
+
+    def test_other_formats(self):
+        # strings that are not fixed width fall back to strptime
+        self.assertEqual(parse_date("2024-1-5 8:00"), datetime(2024, 1, 5, 8))
+
+    def test_invalid(self):
+        for value in ("2023-02-29 08:00", "2024-13-01 08:00", "2024-01-15T08:00", ""):
+            with self.subTest(value), self.assertRaises(ValueError):
+                parse_date(value)
+
+    def test_malformed(self):
+        # values the fixed-width parser would read as numbers are rejected
+        for value in (
+            "2024- 1-15 08:00",
+            "2024-01-15 08:+5",
+            "2_24-01-15 08:00",
+        ):
+            with self.subTest(value), self.assertRaises(ValueError):
+                parse_date(value)
+
+    def test_memoized(self):
+        self.assertIs(parse_date("2024-03-04 08:00"), parse_date("2024-03-04 08:00"))
+
+    def test_optional_date(self):
+        self.assertIsNone(optional_date(""))
+        self.assertEqual(optional_date("2024-01-15 08:00"), datetime(2024, 1, 15, 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Unittests of the options of `Xer.reader`, run on generated sample files.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.sample import SampleFile, summary
+from xerparser.src.parser import read_tables
+from xerparser.src.xer import COLLECTIONS, Xer
+
+
+class SampleTestCase(SampleFile, unittest.TestCase):
+    """Test case comparing the objects read with the objects of the sample file."""
+
+    sample = {"projects": 2, "tasks": 12}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.expected = summary(Xer.reader(cls.file))
+
+
+class TestUserDefinedFields(SampleTestCase):
+    def udf_values(self, objects) -> list[str]:
+        return sorted(
+            str(value) for obj in objects for value in obj.user_defined_fields.values()
+        )
+
+    def test_exclude_tasks(self):
+        xer = Xer.reader(self.file, exclude={"TASK"})
+        self.assertNotIn("TASK", xer.tables)
+        self.assertIn("UDFVALUE", xer.tables)
+        self.assertEqual(xer.tasks, {})
+        self.assertEqual(self.udf_values(xer.projects.values()), ["12.5", "12.5"])
+        self.assertEqual(self.udf_values(xer.wbs_nodes.values()), ["Owner A"] * 2)
+
+    def test_exclude_wbs(self):
+        xer = Xer.reader(self.file, exclude={"PROJWBS"})
+        self.assertNotIn("PROJWBS", xer.tables)
+        self.assertEqual(xer.wbs_nodes, {})
+        self.assertEqual(self.udf_values(xer.projects.values()), ["12.5", "12.5"])
+
+    def test_select_tables(self):
+        xer = Xer.reader(self.file, tables={"PROJECT", "UDFVALUE"})
+        self.assertNotIn("TASK", xer.tables)
+        self.assertNotIn("PROJWBS", xer.tables)
+        self.assertEqual(self.udf_values(xer.projects.values()), ["12.5", "12.5"])
+
+        xer = Xer.reader(self.file, tables={"TASK", "UDFVALUE"})
+        self.assertEqual(
+            self.udf_values(xer.tasks.values()),
+            self.udf_values(Xer.reader(self.file).tasks.values()),
+        )
+
+    def test_lazy_exclude(self):
+        xer = Xer.reader(self.file, exclude={"TASK"}, lazy=True)
+        self.assertEqual(self.udf_values(xer.projects.values()), ["12.5", "12.5"])
+        self.assertEqual(xer.tasks, {})
+
+
+class TestTableSelection(SampleTestCase):
+    def test_tables(self):
+        xer = Xer.reader(self.file, tables={"TASKPRED"})
+        # dependencies of the selected tables are loaded with them
+        self.assertEqual(
+            set(xer.tables),
+            {"ERMHDR", "CALENDAR", "PROJECT", "PROJWBS", "SCHEDOPTIONS", "TASK"}
+            | {"TASKPRED"},
+        )
+        self.assertEqual(len(xer.relationships), len(self.expected["relationships"]))
+        for task in xer.tasks.values():
+            self.assertEqual(task.resources, {})
+            self.assertEqual(task.memos, [])
+
+    def test_exclude(self):
+        xer = Xer.reader(self.file, exclude={"RSRC", "MEMOTYPE"})
+        # tables depending on the excluded tables are skipped as well
+        for name in ("RSRC", "RSRCRATE", "TASKRSRC", "TRSRCFIN", "TASKMEMO"):
+            self.assertNotIn(name, xer.tables)
+        self.assertIn("TASKFIN", xer.tables)
+        self.assertEqual(xer.resources, {})
+        for project in xer.projects.values():
+            self.assertEqual(project.resources, [])
+            expected = self.expected["projects"][project.short_name]
+            self.assertEqual(len(project.tasks), len(expected["tasks"]))
+            self.assertEqual(
+                sorted(rel.uid for rel in project.relationships),
+                expected["relationships"],
+            )
+
+    def test_tables_and_exclude(self):
+        xer = Xer.reader(self.file, tables={"TASKRSRC"}, exclude={"ACCOUNT"})
+        self.assertNotIn("TASKRSRC", xer.tables)
+        self.assertNotIn("ACCOUNT", xer.tables)
+        self.assertIn("RSRC", xer.tables)
+        self.assertIn("TASK", xer.tables)
+
+    def test_required_tables(self):
+        # the default required tables are only checked if they are loaded
+        xer = Xer.reader(self.file, tables={"RSRC"})
+        self.assertEqual(set(xer.tables), {"ERMHDR", "RSRC"})
+        self.assertEqual(xer.projects, {})
+
+
+class TestProjectFilter(SampleTestCase):
+    def test_projects(self):
+        for key in ("PRJ-1001", "1001"):
+            with self.subTest(key):
+                xer = Xer.reader(self.file, projects=[key])
+                self.assertEqual(list(xer.projects), ["1001"])
+                expected = self.expected["projects"]["PRJ-1001"]
+                project = xer.projects["1001"]
+                self.assertEqual(
+                    sorted(rel.uid for rel in project.relationships),
+                    expected["relationships"],
+                )
+                self.assertEqual(project.actual_cost, expected["actual_cost"])
+                self.assertTrue(all(t.proj_id == "1001" for t in xer.tasks.values()))
+
+    def test_unselected_project_table(self):
+        # project ids are resolved from the PROJECT table even if it is skipped
+        for selection in ({"exclude": {"PROJECT"}}, {"tables": {"TASK"}}):
+            with self.subTest(**selection):
+                tables = read_tables(self.file, projects={"PRJ-1001"}, **selection)
+                self.assertNotIn("PROJECT", tables)
+                self.assertEqual(len(tables["TASK"]), self.sample["tasks"])
+                self.assertTrue(all(t["proj_id"] == "1001" for t in tables["TASK"]))
+
+
+class TestLazy(SampleTestCase):
+    def test_first_collection(self):
+        # objects are fully linked whichever collection is used first
+        for name in COLLECTIONS:
+            with self.subTest(name):
+                xer = Xer.reader(self.file, lazy=True)
+                getattr(xer, name)
+                self.assertEqual(summary(xer), self.expected)
+
+    def test_project_rollups(self):
+        eager = Xer.reader(self.file)
+        xer = Xer.reader(self.file, lazy=True)
+        for project in xer.projects.values():
+            expected = eager.projects[project.uid]
+            self.assertEqual(project.name, expected.name)
+            self.assertEqual(project.actual_cost, expected.actual_cost)
+            self.assertEqual(
+                project.tasks_by_code.keys(), expected.tasks_by_code.keys()
+            )
+            self.assertEqual(
+                len(project.network.relationships), len(expected.relationships)
+            )
+            self.assertEqual(len(project.resources), len(expected.resources))
+
+    def test_unused_collections(self):
+        xer = Xer.reader(self.file, lazy=True)
+        self.assertEqual(len(xer.calendars), 4)
+        self.assertNotIn("tasks", vars(xer))
+        self.assertEqual(len(xer.tasks), len(self.expected["tasks"]))
+        self.assertNotIn("relationships", vars(xer))
+
+    def test_projects_only(self):
+        xer = Xer.reader(self.file, lazy=True)
+        self.assertEqual(len(xer.projects), self.sample["projects"])
+        for name in ("wbs_nodes", "tasks", "relationships"):
+            self.assertNotIn(name, vars(xer))
+        # the activities are built when a project's activities are read
+        project = next(iter(xer.projects.values()))
+        self.assertEqual(len(project.tasks), self.sample["tasks"])
+        self.assertIn("tasks", vars(xer))
+        self.assertNotIn("relationships", vars(xer))
+        self.assertEqual(len(project.relationships), len(project.network.relationships))
+        self.assertIn("relationships", vars(xer))
+
+    def test_materialize(self):
+        xer = Xer.reader(self.file, lazy=True).materialize()
+        self.assertTrue(all(name in vars(xer) for name in COLLECTIONS))
+        self.assertEqual(summary(xer), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
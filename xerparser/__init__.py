@@ -18,6 +18,27 @@ from xerparser.schemas.taskpred import TASKPRED  # noqa: F401
 from xerparser.schemas.taskrsrc import TASKRSRC  # noqa: F401
 from xerparser.schemas.trsrcfin import TRSRCFIN  # noqa: F401
 from xerparser.schemas.udftype import UDFTYPE  # noqa: F401
+from xerparser.src.batch import XerResult, read_many, sniff_many  # noqa: F401
+from xerparser.src.cache import XerCache  # noqa: F401
+from xerparser.src.cpm import CPMSchedule, ScheduledDates  # noqa: F401
 from xerparser.src.errors import CorruptXerFile, find_xer_errors  # noqa: F401
-from xerparser.src.parser import file_reader, parser  # noqa: F401
+from xerparser.src.foreign_keys import FOREIGN_KEYS, ForeignKeyIndex  # noqa: F401
+from xerparser.src.index import TableInfo, XerIndex  # noqa: F401
+from xerparser.src.network import Network  # noqa: F401
+from xerparser.src.parser import (  # noqa: F401
+    file_reader,
+    iter_tables,
+    parser,
+    read_tables,
+)
+from xerparser.src.shared import SharedTable, SharedXer, SharedXerView  # noqa: F401
+from xerparser.src.sniff import ProjectSummary, XerSummary, sniff  # noqa: F401
+from xerparser.src.table import Table  # noqa: F401
+from xerparser.src.validation import (  # noqa: F401
+    Check,
+    MissingReferences,
+    RequiredColumns,
+    RequiredTablePairs,
+    RequiredTables,
+)
 from xerparser.src.xer import Xer  # noqa: F401
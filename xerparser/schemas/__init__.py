@@ -16,3 +16,30 @@ TABLE_UID_MAP = {
     "TASKPRED": "task_pred_id",
     "UDFTYPE": "udf_type_id",
 }
+
+# Tables that must be loaded to build the objects of a table
+TABLE_DEPENDENCIES = {
+    "ACCOUNT": set(),
+    "ACTVCODE": {"ACTVTYPE"},
+    "ACTVTYPE": set(),
+    "CALENDAR": set(),
+    "FINDATES": set(),
+    "MEMOTYPE": set(),
+    "PCATTYPE": set(),
+    "PCATVAL": {"PCATTYPE"},
+    "PROJECT": {"CALENDAR", "SCHEDOPTIONS"},
+    "PROJPCAT": {"PCATVAL", "PROJECT"},
+    "PROJWBS": {"PROJECT"},
+    "RSRC": set(),
+    "RSRCRATE": {"RSRC"},
+    "SCHEDOPTIONS": set(),
+    "TASK": {"CALENDAR", "PROJECT", "PROJWBS"},
+    "TASKACTV": {"ACTVCODE", "TASK"},
+    "TASKFIN": {"FINDATES", "TASK"},
+    "TASKMEMO": {"MEMOTYPE", "TASK"},
+    "TASKPRED": {"TASK"},
+    "TASKRSRC": {"ACCOUNT", "RSRC", "TASK"},
+    "TRSRCFIN": {"FINDATES", "TASKRSRC"},
+    "UDFTYPE": set(),
+    "UDFVALUE": {"UDFTYPE"},
+}
@@ -0,0 +1,224 @@
+# xerparser
+# _field.py
+
+from abc import ABC, abstractmethod
+from functools import cache
+from typing import Any, Callable, Generic, Sequence, TypeVar, overload
+
+T = TypeVar("T")
+
+_MISSING: Any = object()
+
+
+class SlotCache(ABC, Generic[T]):
+    """
+    Base class for attributes computed once and cached in a slot.
+
+    The value of attribute `name` is stored in the slot `_name`, which must be
+    listed in the `__slots__` of the owner class. Assigning the attribute sets
+    the slot and deleting it clears the cached value.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        if (slot := owner.__dict__.get(f"_{name}")) is None:
+            raise TypeError(f"{owner.__name__}.__slots__ is missing '_{name}'")
+        self._slot = slot
+
+    @overload
+    def __get__(self, obj: None, objtype: type | None = None) -> "SlotCache[T]": ...
+
+    @overload
+    def __get__(self, obj: object, objtype: type | None = None) -> T: ...
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> "T | SlotCache[T]":
+        if obj is None:
+            return self
+        try:
+            return self._slot.__get__(obj, objtype)
+        except AttributeError:
+            value = self._compute(obj)
+            self._slot.__set__(obj, value)
+            return value
+
+    def __set__(self, obj: Any, value: T) -> None:
+        self._slot.__set__(obj, value)
+
+    def __delete__(self, obj: Any) -> None:
+        try:
+            self._slot.__delete__(obj)
+        except AttributeError:
+            pass
+
+    @abstractmethod
+    def _compute(self, obj: Any) -> T:
+        """Compute the value of the attribute for `obj`."""
+
+
+class RowField(SlotCache[T]):
+    """
+    A schema attribute converted from the raw table row on first access.
+
+    Objects using row fields store the raw row as `_row`. When the attribute
+    is first read, the value is converted and cached, so the conversion only
+    happens once. Fields that are never read are never converted.
+
+    A value that cannot be converted raises a `ValueError` naming the table
+    and column it was read from.
+    """
+
+    def __init__(
+        self, column: str, convert: Callable[[str], T], default: str | None = None
+    ) -> None:
+        self.column = column
+        """Column label in the .xer table"""
+        self.convert = convert
+        """Function to transform the raw string value"""
+        self.default = default
+        """Raw value used if the column is missing; the column is required if `None`"""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        super().__set_name__(owner, name)
+        self.table = owner.__name__
+        """Name of the .xer table, which is the name of the schema class"""
+
+    def _compute(self, obj: Any) -> T:
+        if self.default is None:
+            value = obj._row[self.column]
+        else:
+            value = obj._row.get(self.column, self.default)
+        return self._convert(value)
+
+    def _convert(self, value: str) -> T:
+        try:
+            return self.convert(value)
+        except (KeyError, ValueError) as error:
+            raise ValueError(
+                f"Invalid value {value!r} in column {self.column} "
+                f"of table {self.table}"
+            ) from error
+
+
+class cached_slot(SlotCache[T]):
+    """
+    A `functools.cached_property` for classes using `__slots__`.
+    Delete the attribute to clear the cached value.
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def _compute(self, obj: Any) -> T:
+        return self.func(obj)
+
+
+class FilledBy(Generic[T]):
+    """
+    An attribute filled in by the objects of a collection built after the
+    object it belongs to, such as the activities of a project.
+
+    The value is stored in the attribute `_name`. Objects built lazily by an
+    `Xer` are given a `_fill` function, which builds the `collection` before
+    the attribute is read, so the value is complete.
+    """
+
+    def __init__(self, collection: str) -> None:
+        self.collection = collection
+        """Name of the `Xer` collection filling in the attribute"""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self._attr = f"_{name}"
+
+    @overload
+    def __get__(self, obj: None, objtype: type | None = None) -> "FilledBy[T]": ...
+
+    @overload
+    def __get__(self, obj: object, objtype: type | None = None) -> T: ...
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> "T | FilledBy[T]":
+        if obj is None:
+            return self
+        fill_from(obj, self.collection)
+        return getattr(obj, self._attr)
+
+    def __set__(self, obj: Any, value: T) -> None:
+        setattr(obj, self._attr, value)
+
+
+def fill_from(obj: Any, collection: str) -> None:
+    """Build the collection that fills in an object built lazily by an `Xer`."""
+    if (fill := getattr(obj, "_fill", None)) is not None:
+        fill(collection)
+
+
+def load_fields(obj: Any) -> None:
+    """
+    Convert all of the row fields of an object and release its raw row.
+    Used before sending objects to another process.
+    """
+    for name in row_fields(type(obj)):
+        getattr(obj, name)
+    if hasattr(obj, "_row"):
+        del obj._row
+
+
+def field_values(objects: Sequence[Any], name: str) -> list[Any]:
+    """
+    Values of the row field `name` of each object, read in one pass over the
+    objects instead of calling the descriptor of each object.
+
+    Values that were not read yet are converted from the raw rows and stored
+    in their slots, as if the attribute was read; each distinct raw value is
+    only converted once. All of the objects must be of the same class.
+    """
+    if not objects:
+        return []
+    field = getattr(type(objects[0]), name)
+    slot, column = field._slot, field.column
+    values = [getattr(obj, f"_{name}", _MISSING) for obj in objects]
+    missing = [i for i, value in enumerate(values) if value is _MISSING]
+    if missing:
+        if field.default is None:
+            raw = [objects[i]._row[column] for i in missing]
+        else:
+            raw = [objects[i]._row.get(column, field.default) for i in missing]
+        converted = {value: field._convert(value) for value in set(raw)}
+        for i, value in zip(missing, raw):
+            values[i] = value = converted[value]
+            slot.__set__(objects[i], value)
+    return values
+
+
+def object_state(obj: Any) -> dict[str, Any]:
+    """Attribute values stored on an object, in its `__dict__` or its slots."""
+    state = dict(getattr(obj, "__dict__", {}))
+    for name in slot_names(type(obj)):
+        try:
+            state[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    return state
+
+
+@cache
+def row_fields(cls: type) -> tuple[str, ...]:
+    """Names of the row fields of a class."""
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name, attr in vars(klass).items()
+        if isinstance(attr, RowField)
+    )
+
+
+@cache
+def slot_names(cls: type) -> tuple[str, ...]:
+    """Names of the slots of a class, including inherited slots."""
+    return tuple(
+        name
+        for klass in reversed(cls.__mro__)
+        for name in getattr(klass, "__slots__", ())
+        if name not in ("__dict__", "__weakref__")
+    )
@@ -3,7 +3,7 @@
 
 from datetime import datetime
 
-from xerparser.src.validators import date_format
+from xerparser.src.validators import parse_date
 
 
 class FINDATES:
@@ -16,9 +16,9 @@ class FINDATES:
         """Unique Table ID"""
         self.name: str = data["fin_dates_name"]
         """Financial Period Name"""
-        self.start_date: datetime = datetime.strptime(data["start_date"], date_format)
+        self.start_date: datetime = parse_date(data["start_date"])
         """Financial Period Start Date"""
-        self.end_date: datetime = datetime.strptime(data["end_date"], date_format)
+        self.end_date: datetime = parse_date(data["end_date"])
         """Financial Period End Date"""
 
     def __eq__(self, __o: "FINDATES") -> bool:
@@ -3,10 +3,10 @@
 
 from collections import Counter
 from datetime import datetime
-from functools import cached_property
 from statistics import mean
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from xerparser.schemas._field import FilledBy, RowField, cached_slot, fill_from
 from xerparser.schemas.actvtype import ACTVTYPE
 from xerparser.schemas.calendars import CALENDAR
 from xerparser.schemas.pcattype import PCATTYPE
@@ -18,7 +18,11 @@ from xerparser.schemas.taskpred import TASKPRED
 from xerparser.schemas.taskrsrc import TASKRSRC
 from xerparser.schemas.udftype import UDFTYPE
 from xerparser.scripts.decorators import rounded
-from xerparser.src.validators import date_format, optional_date, optional_str
+from xerparser.src.network import Network
+from xerparser.src.validators import optional_date, optional_str, parse_date
+
+if TYPE_CHECKING:
+    from xerparser.src.cpm import CPMSchedule
 
 
 class PROJECT:
@@ -28,44 +32,87 @@ class PROJECT:
 
     _wbs_root: PROJWBS
 
+    __slots__ = (
+        "_row",
+        "options",
+        "uid",
+        "default_calendar",
+        "data_date",
+        "export_flag",
+        "short_name",
+        "activity_codes",
+        "calendars",
+        "project_codes",
+        "user_defined_fields",
+        "_fill",
+        "_tasks",
+        "_relationships",
+        "_resources",
+        "_wbs_nodes",
+        "_wbs_root",
+        "_add_date",
+        "_finish_date",
+        "_last_fin_dates_id",
+        "_last_schedule_date",
+        "_must_finish_date",
+        "_plan_start_date",
+        "_actual_cost",
+        "_actual_start",
+        "_budgeted_cost",
+        "_cpm",
+        "_finish_constraints",
+        "_late_start",
+        "_network",
+        "_relationships_by_hash",
+        "_remaining_cost",
+        "_task_percent",
+        "_tasks_by_code",
+        "_this_period_cost",
+        "_wbs_by_path",
+    )
+
+    # table fields converted when first accessed
+    add_date = RowField("add_date", parse_date)
+    """Date Project was Created"""
+    finish_date = RowField("scd_end_date", parse_date)
+    """Projected Completion Date"""
+    last_fin_dates_id = RowField("last_fin_dates_id", optional_str)
+    """Last Stored Financial Period"""
+    last_schedule_date = RowField("last_schedule_date", optional_date, default="")
+    """Last Date Schedule was Calculated"""
+    must_finish_date = RowField("plan_end_date", optional_date)
+    """Must Finish by Date Assigned to Project"""
+    plan_start_date = RowField("plan_start_date", parse_date)
+    """Planned Start Date Assigned to Project"""
+
+    # objects of the project filled in when they are built
+    tasks = FilledBy("tasks")
+    relationships = FilledBy("relationships")
+    resources = FilledBy("tasks")
+    wbs_nodes = FilledBy("wbs_nodes")
+
     def __init__(
         self,
         sched_options: SCHEDOPTIONS,
         default_calendar: CALENDAR | None = None,
         **data: str,
     ) -> None:
+        self._row: dict[str, str] = data
+        self._fill = None
         self.options: SCHEDOPTIONS = sched_options
 
         # table fields from .xer file
         self.uid: str = data["proj_id"]
         """Unique Table ID"""
-        self.add_date: datetime = datetime.strptime(data["add_date"], date_format)
-        """Date Project was Created"""
         self.default_calendar: CALENDAR | None = default_calendar
         """Default Calendar Assigned to Project"""
         self.data_date: datetime = max(
-            datetime.strptime(data["last_recalc_date"], date_format),
-            datetime.strptime(data["plan_start_date"], date_format),
+            parse_date(data["last_recalc_date"]),
+            parse_date(data["plan_start_date"]),
         )
         """Date Project is Updated To"""
         self.export_flag: bool = data["export_flag"] == "Y"
         """Project Export Flag"""
-        self.finish_date: datetime = datetime.strptime(
-            data["scd_end_date"], date_format
-        )
-        """Projected Completion Date"""
-        self.last_fin_dates_id: str | None = optional_str(data["last_fin_dates_id"])
-        """Last Stored Financial Period"""
-        self.last_schedule_date: datetime | None = optional_date(
-            data.get("last_schedule_date", "")
-        )
-        """Last Date Schedule was Calculated"""
-        self.must_finish_date: datetime | None = optional_date(data["plan_end_date"])
-        """Must Finish by Date Assigned to Project"""
-        self.plan_start_date: datetime = datetime.strptime(
-            data["plan_start_date"], date_format
-        )
-        """Planned Start Date Assigned to Project"""
         self.short_name: str = data["proj_short_name"]
         """Project Code"""
 
@@ -100,7 +147,7 @@ class PROJECT:
         if isinstance(obj, PROJWBS):
             return self.wbs_by_path.get(obj.full_code)
 
-    @cached_property
+    @cached_slot
     @rounded()
     def actual_cost(self) -> float:
         """Sum of task resource actual costs"""
@@ -111,14 +158,14 @@ class PROJECT:
         """Project actual duration in calendar days from start date to data date"""
         return max((0, (self.data_date - self.actual_start).days))
 
-    @cached_property
+    @cached_slot
     def actual_start(self) -> datetime:
         """Earliest task start date"""
         if not self.tasks:
             return self.plan_start_date
         return min((task.start for task in self.tasks))
 
-    @cached_property
+    @cached_slot
     @rounded()
     def budgeted_cost(self) -> float:
         """Sum of task resource budgeted costs"""
@@ -136,7 +183,7 @@ class PROJECT:
 
         return 1 - self.remaining_duration / self.original_duration
 
-    @cached_property
+    @cached_slot
     def finish_constraints(self) -> list[tuple[TASK, str]]:
         """List of all Tasks with Finish on or Before constraints"""
         return sorted(
@@ -149,7 +196,7 @@ class PROJECT:
             key=lambda t: t[0].finish,
         )
 
-    @cached_property
+    @cached_slot
     def late_start(self) -> datetime:
         """Earliest task late start date"""
         if not self.tasks:
@@ -158,6 +205,20 @@ class PROJECT:
             (task.late_start_date for task in self.tasks if task.late_start_date)
         )
 
+    @cached_slot
+    def cpm(self) -> "CPMSchedule":
+        """Schedule calculated by `schedule` the first time it is used. Delete
+        the attribute after changing the activities or relationships to
+        calculate it again."""
+        return self.schedule()
+
+    @cached_slot
+    def network(self) -> Network:
+        """Relationship graph of the project activities as compressed sparse row
+        arrays. Delete the attribute after changing the activities or
+        relationships to build it again."""
+        return Network(self.tasks, self.relationships)
+
     @property
     def name(self) -> str:
         """Project Name"""
@@ -173,11 +234,11 @@ class PROJECT:
         """
         return (self.finish_date - self.actual_start).days
 
-    @cached_property
+    @cached_slot
     def relationships_by_hash(self) -> dict[int, TASKPRED]:
         return {hash(rel): rel for rel in self.relationships}
 
-    @cached_property
+    @cached_slot
     @rounded()
     def remaining_cost(self) -> float:
         """Sum of task resource remaining costs"""
@@ -190,7 +251,7 @@ class PROJECT:
             (0, (self.finish_date - max(self.data_date, self.actual_start)).days)
         )
 
-    @cached_property
+    @cached_slot
     @rounded(ndigits=4)
     def task_percent(self) -> float:
         """
@@ -225,7 +286,7 @@ class PROJECT:
 
         return mean([task_dur_percent, status_percent])
 
-    @cached_property
+    @cached_slot
     def tasks_by_code(self) -> dict[str, TASK]:
         """
         Returns a dictionary of the Activities using the
@@ -233,18 +294,19 @@ class PROJECT:
         """
         return {task.task_code: task for task in self.tasks}
 
-    @cached_property
+    @cached_slot
     @rounded()
     def this_period_cost(self) -> float:
         """Sum of task resource this period costs"""
         return sum(res.act_this_per_cost for res in self.resources)
 
-    @cached_property
+    @cached_slot
     def wbs_by_path(self) -> dict[str, PROJWBS]:
         return {node.full_code: node for node in self.wbs_nodes}
 
     @property
     def wbs_root(self) -> PROJWBS:
+        fill_from(self, "wbs_nodes")
         if not self._wbs_root:
             raise UnboundLocalError("WBS Root is not assigned")
 
@@ -294,3 +356,58 @@ class PROJECT:
                 progress["late_finish"].append(task)
 
         return progress
+
+    def schedule(self, data_date: datetime | None = None) -> "CPMSchedule":
+        """Calculate the early and late dates and float of the activities with a
+        forward and backward pass over the project relationships.
+
+        Uses the activity calendars, relationship types and lags, constraints,
+        and the project scheduling options (retained logic or progress override,
+        float type, calendar for relationship lags, and expected finish dates).
+        The values in the xer file are not changed, so a what-if scenario can be
+        scheduled by changing the attributes of the activities (e.g.
+        `task.remain_drtn_hr_cnt`) and calling `schedule` again. The relationships
+        are read from the cached `network`; delete it after changing the
+        relationships or their lags.
+
+        Args:
+            data_date (datetime | None, optional): Date to schedule the
+            remaining work from. Defaults to the project data date.
+
+        Raises:
+            ValueError: The project has a relationship loop, or an activity has
+            no calendar with work hours.
+
+        Returns:
+            CPMSchedule: Scheduled dates of each activity
+        """
+        from xerparser.src.cpm import schedule
+
+        return schedule(self, data_date)
+
+    def driving_path(self, task: TASK) -> list[TASK]:
+        """Activities driving the dates of a task through relationships with no
+        free float, in the schedule calculated by `cpm`.
+
+        Args:
+            task (TASK): Activity to trace the driving path into
+
+        Returns:
+            list[TASK]: Driving activities in schedule order, ending with `task`
+        """
+        return self.cpm.driving_path(task)
+
+    def float_paths(self, task: TASK, count: int | None = None) -> list[list[TASK]]:
+        """Multiple float paths into a task, in the schedule calculated by `cpm`.
+        See `CPMSchedule.float_paths`.
+
+        Args:
+            task (TASK): Activity to trace the float paths into
+            count (int | None, optional): Number of paths. Defaults to the
+            project option `max_multiple_longest_path`, or 10.
+
+        Returns:
+            list[list[TASK]]: Activities of each path, starting with the
+            driving path
+        """
+        return self.cpm.float_paths(task, count)
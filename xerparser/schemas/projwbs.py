@@ -5,6 +5,7 @@ import itertools
 from datetime import datetime
 from typing import Any
 
+from xerparser.schemas._field import fill_from
 from xerparser.schemas._node import Node
 from xerparser.schemas.task import TASK
 from xerparser.schemas.udftype import UDFTYPE
@@ -37,6 +38,7 @@ class PROJWBS(Node):
         self.status_code: str = data["status_code"]
 
         self.user_defined_fields: dict[UDFTYPE, Any] = {}
+        self._fill = None
         self._tasks: dict[str, TASK] = {}
 
         self.project.wbs_nodes.append(self)
@@ -149,6 +151,7 @@ class PROJWBS(Node):
     @property
     def tasks(self) -> list[TASK]:
         """Tasks assigned to this WBS node"""
+        fill_from(self, "tasks")
         return list(self._tasks.values())
 
     @property
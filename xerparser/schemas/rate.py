@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from xerparser.src.validators import date_format, float_or_zero
+from xerparser.src.validators import float_or_zero, parse_date
 
 
 class Rate:
@@ -19,7 +19,7 @@ class Rate:
         """Price per Unit 5"""
         self.max_qty_per_hr: float = float(data["max_qty_per_hr"].replace(",", "."))
         """Max Units per Time"""
-        self.start_date: datetime = datetime.strptime(data["start_date"], date_format)
+        self.start_date: datetime = parse_date(data["start_date"])
         """Effective Date"""
 
     def __eq__(self, __other: "Rate") -> bool:
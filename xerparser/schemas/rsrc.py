@@ -3,6 +3,7 @@
 
 from typing import Any
 
+from xerparser.schemas._field import FilledBy
 from xerparser.schemas._node import Node
 from xerparser.schemas.udftype import UDFTYPE
 from xerparser.src.validators import int_or_zero
@@ -13,6 +14,9 @@ class RSRC(Node):
     A class to represent a Resource.
     """
 
+    task_rsrcs = FilledBy("tasks")
+    """Activity resource assignments of the resource"""
+
     def __init__(self, **data: str) -> None:
         from xerparser.schemas.taskrsrc import TASKRSRC
 
@@ -26,4 +30,5 @@ class RSRC(Node):
         self.clndr_id: str = data["clndr_id"]
         self.type: str = data["rsrc_type"]
         self.user_defined_fields: dict[UDFTYPE, Any] = {}
+        self._fill = None
         self.task_rsrcs: list[TASKRSRC] = []
@@ -3,9 +3,9 @@
 
 from datetime import datetime
 from enum import Enum
-from functools import cached_property
 from typing import Any, Self
 
+from xerparser.schemas._field import FilledBy, RowField, cached_slot
 from xerparser.schemas.actvcode import ACTVCODE
 from xerparser.schemas.actvtype import ACTVTYPE
 from xerparser.schemas.calendars import CALENDAR
@@ -16,12 +16,15 @@ from xerparser.schemas.udftype import UDFTYPE
 from xerparser.scripts.dates import clean_date
 from xerparser.scripts.decorators import rounded
 from xerparser.src.validators import (
-    date_format,
+    flag_to_bool,
     float_or_zero,
     optional_date,
     optional_float,
     optional_int,
     optional_str,
+    parse_date,
+    parse_float,
+    percent_to_float,
 )
 
 
@@ -99,9 +102,126 @@ class TASK:
         def is_wbs(self) -> bool:
             return self is self.TT_WBS
 
+    __slots__ = (
+        "_row",
+        "uid",
+        "proj_id",
+        "wbs_id",
+        "clndr_id",
+        "complete_pct_type",
+        "task_code",
+        "name",
+        "duration_type",
+        "activity_codes",
+        "user_defined_fields",
+        "calendar",
+        "wbs",
+        "memos",
+        "resources",
+        "periods",
+        "_fill",
+        "_predecessors",
+        "_successors",
+        "_phys_complete_pct",
+        "_type",
+        "_status",
+        "_total_float_hr_cnt",
+        "_free_float_hr_cnt",
+        "_remain_drtn_hr_cnt",
+        "_target_drtn_hr_cnt",
+        "_float_path",
+        "_float_path_order",
+        "_is_longest_path",
+        "_act_start_date",
+        "_act_end_date",
+        "_late_start_date",
+        "_late_end_date",
+        "_expect_end_date",
+        "_early_start_date",
+        "_early_end_date",
+        "_rem_late_start_date",
+        "_rem_late_end_date",
+        "_restart_date",
+        "_reend_date",
+        "_target_start_date",
+        "_target_end_date",
+        "_suspend_date",
+        "_resume_date",
+        "_create_date",
+        "_update_date",
+        "_cstr_date",
+        "_cstr_type",
+        "_cstr_date2",
+        "_cstr_type2",
+        "_target_work_qty",
+        "_act_work_qty",
+        "_target_equip_qty",
+        "_act_equip_qty",
+        "_percent_complete",
+    )
+
+    # General Task info
+    phys_complete_pct = RowField("phys_complete_pct", percent_to_float)
+    """Activity physical percent complete"""
+    type = RowField("task_type", TaskType.__getitem__)
+    """
+    Activity type:
+        Task, Start Milestone, Finish Milestone, Level of Effort, 
+        WBS Summary, or Resource Dependent"""
+    status = RowField("status_code", TaskStatus.__getitem__)
+
+    # Durations and float
+    total_float_hr_cnt = RowField("total_float_hr_cnt", optional_float)
+    free_float_hr_cnt = RowField("free_float_hr_cnt", optional_float)
+    remain_drtn_hr_cnt = RowField("remain_drtn_hr_cnt", parse_float)
+    target_drtn_hr_cnt = RowField("target_drtn_hr_cnt", parse_float)
+    float_path = RowField("float_path", optional_int)
+    float_path_order = RowField("float_path_order", optional_int)
+    is_longest_path = RowField("driving_path_flag", flag_to_bool)
+
+    # Dates
+    act_start_date = RowField("act_start_date", optional_date)
+    act_end_date = RowField("act_end_date", optional_date)
+    late_start_date = RowField("late_start_date", optional_date)
+    late_end_date = RowField("late_end_date", optional_date)
+    expect_end_date = RowField("expect_end_date", optional_date)
+    early_start_date = RowField("early_start_date", optional_date)
+    early_end_date = RowField("early_end_date", optional_date)
+    rem_late_start_date = RowField("rem_late_start_date", optional_date)
+    rem_late_end_date = RowField("rem_late_end_date", optional_date)
+    restart_date = RowField("restart_date", optional_date)
+    reend_date = RowField("reend_date", optional_date)
+    target_start_date = RowField("target_start_date", parse_date)
+    target_end_date = RowField("target_end_date", parse_date)
+    suspend_date = RowField("suspend_date", optional_date)
+    resume_date = RowField("resume_date", optional_date)
+    create_date = RowField("create_date", optional_date)
+    update_date = RowField("update_date", optional_date)
+
+    # Constraints
+    cstr_date = RowField("cstr_date", optional_date)
+    cstr_type = RowField("cstr_type", optional_str)
+    cstr_date2 = RowField("cstr_date2", optional_date)
+    cstr_type2 = RowField("cstr_type2", optional_str)
+
+    # Unit quantities
+    # Have encoutered XER files where these qty's are stored as empty strings.
+    target_work_qty = RowField("target_work_qty", float_or_zero)
+    act_work_qty = RowField("act_work_qty", float_or_zero)
+    target_equip_qty = RowField("target_equip_qty", float_or_zero)
+    act_equip_qty = RowField("act_equip_qty", float_or_zero)
+
+    # Relationships filled in when they are built
+    predecessors = FilledBy("relationships")
+    successors = FilledBy("relationships")
+
     def __init__(self, calendar: CALENDAR, wbs, **data: str) -> None:
         from xerparser.schemas.projwbs import PROJWBS
 
+        # Raw row; most fields are converted from it when first accessed
+        self._row: dict[str, str] = data
+        self._fill = None
+
         self.uid: str = data["task_id"]
         """Unique Table ID"""
         # Foreign keys
@@ -113,78 +233,13 @@ class TASK:
         """Foreign Key for Calendar"""
 
         # General Task info
-        self.phys_complete_pct: float = (
-            float(data["phys_complete_pct"].replace(",", ".")) / 100
-        )
-        """Activity physical percent complete"""
         self.complete_pct_type: str = data["complete_pct_type"]
         """Activity percent complete type: duration, physical, or units"""
-        self.type: TASK.TaskType = TASK.TaskType[data["task_type"]]
-        """
-        Activity type:
-            Task, Start Milestone, Finish Milestone, Level of Effort, 
-            WBS Summary, or Resource Dependent"""
-        self.status: TASK.TaskStatus = TASK.TaskStatus[data["status_code"]]
         self.task_code: str = data["task_code"]
         """Activity ID"""
         self.name: str = data["task_name"]
         """Activity Name"""
-
-        # Durations and float
         self.duration_type: str = data["duration_type"]
-        self.total_float_hr_cnt: float | None = optional_float(
-            data["total_float_hr_cnt"]
-        )
-        self.free_float_hr_cnt: float | None = optional_float(data["free_float_hr_cnt"])
-        self.remain_drtn_hr_cnt: float = float(
-            data["remain_drtn_hr_cnt"].replace(",", ".")
-        )
-        self.target_drtn_hr_cnt: float = float(
-            data["target_drtn_hr_cnt"].replace(",", ".")
-        )
-        self.float_path: int | None = optional_int(data["float_path"])
-        self.float_path_order: int | None = optional_int(data["float_path_order"])
-        self.is_longest_path: bool = data["driving_path_flag"] == "Y"
-
-        # Dates
-        self.act_start_date: datetime | None = optional_date(data["act_start_date"])
-        self.act_end_date: datetime | None = optional_date(data["act_end_date"])
-        self.late_start_date: datetime | None = optional_date(data["late_start_date"])
-        self.late_end_date: datetime | None = optional_date(data["late_end_date"])
-        self.expect_end_date: datetime | None = optional_date(data["expect_end_date"])
-        self.early_start_date: datetime | None = optional_date(data["early_start_date"])
-        self.early_end_date: datetime | None = optional_date(data["early_end_date"])
-        self.rem_late_start_date: datetime | None = optional_date(
-            data["rem_late_start_date"]
-        )
-        self.rem_late_end_date: datetime | None = optional_date(
-            data["rem_late_end_date"]
-        )
-        self.restart_date: datetime | None = optional_date(data["restart_date"])
-        self.reend_date: datetime | None = optional_date(data["reend_date"])
-        self.target_start_date: datetime = datetime.strptime(
-            data["target_start_date"], date_format
-        )
-        self.target_end_date: datetime = datetime.strptime(
-            data["target_end_date"], date_format
-        )
-        self.suspend_date: datetime | None = optional_date(data["suspend_date"])
-        self.resume_date: datetime | None = optional_date(data["resume_date"])
-        self.create_date: datetime | None = optional_date(data["create_date"])
-        self.update_date: datetime | None = optional_date(data["update_date"])
-
-        # Constraints
-        self.cstr_date: datetime | None = optional_date(data["cstr_date"])
-        self.cstr_type: str | None = optional_str(data["cstr_type"])
-        self.cstr_date2: datetime | None = optional_date(data["cstr_date2"])
-        self.cstr_type2: str | None = optional_str(data["cstr_type2"])
-
-        # Unit quantities
-        # Have encoutered XER files where these qty's are stored as empty strings.
-        self.target_work_qty: float = float_or_zero(data["target_work_qty"])
-        self.act_work_qty: float = float_or_zero(data["act_work_qty"])
-        self.target_equip_qty: float = float_or_zero(data["target_equip_qty"])
-        self.act_equip_qty: float = float_or_zero(data["act_equip_qty"])
 
         self.activity_codes: dict[ACTVTYPE, ACTVCODE] = {}
         self.user_defined_fields: dict[UDFTYPE, Any] = {}
@@ -308,7 +363,7 @@ class TASK:
         """Original Duration in Days"""
         return int(self.target_drtn_hr_cnt / 8)
 
-    @cached_property
+    @cached_slot
     @rounded(ndigits=4)
     def percent_complete(self) -> float:
         """Activity percent complete based on the type of percent complete"""
@@ -468,6 +523,8 @@ class LinkToTask:
     A class to represent a logic tie to another activity
     """
 
+    __slots__ = ("task", "link", "lag")
+
     def __init__(self, task: TASK, link: str, lag_days: int) -> None:
         if link.upper() not in ("FF", "FS", "SF", "SS"):
             raise AttributeError(
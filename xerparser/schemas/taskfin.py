@@ -10,6 +10,23 @@ class TASKFIN:
     A class to represent a past Finacial Period for an activity
     """
 
+    __slots__ = (
+        "act_equip_cost",
+        "act_equip_qty",
+        "act_expense_cost",
+        "act_mat_cost",
+        "act_work_cost",
+        "act_work_qty",
+        "bcwp",
+        "bcws",
+        "fin_dates_id",
+        "perfm_work_qty",
+        "proj_id",
+        "sched_work_qty",
+        "task_id",
+        "period",
+    )
+
     def __init__(self, period: FINDATES, **data) -> None:
         self.act_equip_cost: float = float_or_zero(data["act_equip_cost"])
         self.act_equip_qty: float = float_or_zero(data["act_equip_qty"])
@@ -1,7 +1,7 @@
 # xerparser
 # taskpred.py
 
-from datetime import datetime
+from xerparser.schemas._field import RowField
 from xerparser.schemas.task import TASK
 from xerparser.src.validators import optional_int, optional_date, int_or_zero
 
@@ -12,17 +12,36 @@ class TASKPRED:
 
     """
 
+    __slots__ = (
+        "_row",
+        "uid",
+        "task_id",
+        "pred_task_id",
+        "proj_id",
+        "pred_proj_id",
+        "pred_type",
+        "predecessor",
+        "successor",
+        "_lag_hr_cnt",
+        "_float_path",
+        "_aref",
+        "_arls",
+    )
+
+    lag_hr_cnt = RowField("lag_hr_cnt", int_or_zero)
+    float_path = RowField("float_path", optional_int)
+    aref = RowField("aref", optional_date)
+    arls = RowField("arls", optional_date)
+
     def __init__(self, predecessor: TASK, successor: TASK, **data) -> None:
+        # Raw row; some fields are converted from it when first accessed
+        self._row: dict[str, str] = data
         self.uid: str = data["task_pred_id"]
         self.task_id: str = data["task_id"]
         self.pred_task_id: str = data["pred_task_id"]
         self.proj_id: str = data["proj_id"]
         self.pred_proj_id: str = data["pred_proj_id"]
         self.pred_type: str = data["pred_type"]
-        self.lag_hr_cnt: int = int_or_zero(data["lag_hr_cnt"])
-        self.float_path: int | None = optional_int(data["float_path"])
-        self.aref: datetime | None = optional_date(data["aref"])
-        self.arls: datetime | None = optional_date(data["arls"])
         self.predecessor: TASK = predecessor
         self.successor: TASK = successor
 
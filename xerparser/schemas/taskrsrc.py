@@ -4,55 +4,82 @@
 # from dataclasses import dataclass, field
 from datetime import datetime
 
+from xerparser.schemas._field import RowField
 from xerparser.schemas.account import ACCOUNT
 from xerparser.schemas.rsrc import RSRC
 from xerparser.schemas.trsrcfin import TRSRCFIN
 from xerparser.scripts.decorators import rounded
 from xerparser.src.validators import (
-    date_format,
     optional_date,
     optional_str,
+    parse_date,
+    parse_float,
 )
 
 
 class TASKRSRC:
     """A class to represent a resource assigned to an activity."""
 
+    __slots__ = (
+        "_row",
+        "uid",
+        "task_id",
+        "proj_id",
+        "acct_id",
+        "rsrc_id",
+        "rsrc_type",
+        "account",
+        "resource",
+        "periods",
+        "_remain_qty",
+        "_target_qty",
+        "_act_ot_qty",
+        "_act_reg_qty",
+        "_target_cost",
+        "_act_reg_cost",
+        "_act_ot_cost",
+        "_remain_cost",
+        "_act_start_date",
+        "_act_end_date",
+        "_restart_date",
+        "_reend_date",
+        "_target_start_date",
+        "_target_end_date",
+        "_target_lag_drtn_hr_cnt",
+        "_rem_late_start_date",
+        "_rem_late_end_date",
+        "_act_this_per_cost",
+        "_act_this_per_qty",
+    )
+
+    remain_qty = RowField("remain_qty", parse_float)
+    target_qty = RowField("target_qty", parse_float)
+    act_ot_qty = RowField("act_ot_qty", parse_float)
+    act_reg_qty = RowField("act_reg_qty", parse_float)
+    target_cost = RowField("target_cost", parse_float)
+    act_reg_cost = RowField("act_reg_cost", parse_float)
+    act_ot_cost = RowField("act_ot_cost", parse_float)
+    remain_cost = RowField("remain_cost", parse_float)
+    act_start_date = RowField("act_start_date", optional_date)
+    act_end_date = RowField("act_end_date", optional_date)
+    restart_date = RowField("restart_date", optional_date)
+    reend_date = RowField("reend_date", optional_date)
+    target_start_date = RowField("target_start_date", parse_date)
+    target_end_date = RowField("target_end_date", parse_date)
+    target_lag_drtn_hr_cnt = RowField("target_lag_drtn_hr_cnt", parse_float)
+    rem_late_start_date = RowField("rem_late_start_date", optional_date)
+    rem_late_end_date = RowField("rem_late_end_date", optional_date)
+    act_this_per_cost = RowField("act_this_per_cost", parse_float)
+    act_this_per_qty = RowField("act_this_per_qty", parse_float)
+
     def __init__(self, account: ACCOUNT | None, resource: RSRC, **data: str) -> None:
+        # Raw row; most fields are converted from it when first accessed
+        self._row: dict[str, str] = data
         self.uid: str = data["taskrsrc_id"]
         self.task_id: str = data["task_id"]
         self.proj_id: str = data["proj_id"]
         self.acct_id: str | None = optional_str(data["acct_id"])
         self.rsrc_id: str = data["rsrc_id"]
-        self.remain_qty: float = float(data["remain_qty"].replace(",", "."))
-        self.target_qty: float = float(data["target_qty"].replace(",", "."))
-        self.act_ot_qty: float = float(data["act_ot_qty"].replace(",", "."))
-        self.act_reg_qty: float = float(data["act_reg_qty"].replace(",", "."))
-        self.target_cost: float = float(data["target_cost"].replace(",", "."))
-        self.act_reg_cost: float = float(data["act_reg_cost"].replace(",", "."))
-        self.act_ot_cost: float = float(data["act_ot_cost"].replace(",", "."))
-        self.remain_cost: float = float(data["remain_cost"].replace(",", "."))
-        self.act_start_date: datetime | None = optional_date(data["act_start_date"])
-        self.act_end_date: datetime | None = optional_date(data["act_end_date"])
-        self.restart_date: datetime | None = optional_date(data["restart_date"])
-        self.reend_date: datetime | None = optional_date(data["reend_date"])
-        self.target_start_date: datetime = datetime.strptime(
-            data["target_start_date"], date_format
-        )
-        self.target_end_date: datetime = datetime.strptime(
-            data["target_end_date"], date_format
-        )
-        self.target_lag_drtn_hr_cnt: float = float(data["target_lag_drtn_hr_cnt"].replace(",", "."))
-        self.rem_late_start_date: datetime | None = optional_date(
-            data["rem_late_start_date"]
-        )
-        self.rem_late_end_date: datetime | None = optional_date(
-            data["rem_late_end_date"]
-        )
-        self.act_this_per_cost: float = float(
-            data["act_this_per_cost"].replace(",", ".")
-        )
-        self.act_this_per_qty: float = float(data["act_this_per_qty"].replace(",", "."))
         self.rsrc_type: str = data["rsrc_type"]
         self.account: ACCOUNT | None = account_or_none(account)
         self.resource: RSRC = resource
@@ -10,6 +10,16 @@ class TRSRCFIN:
     A class to represent a Activity Resource Assignment Past Period Actuals
     """
 
+    __slots__ = (
+        "act_cost",
+        "act_qty",
+        "fin_dates_id",
+        "proj_id",
+        "task_id",
+        "taskrsrc_id",
+        "period",
+    )
+
     def __init__(self, period: FINDATES, **data) -> None:
         self.act_cost: float = float_or_zero(data["act_cost"])
         self.act_qty: float = float_or_zero(data["act_qty"])
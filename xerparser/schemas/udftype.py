@@ -1,10 +1,11 @@
 # xerparser
 # udftype.py
 
-from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from xerparser.src.validators import parse_date
+
 
 class UDFTYPE:
     """
@@ -50,7 +51,7 @@ class UDFTYPE:
             UDFTYPE.FieldType.FT_END_DATE,
             UDFTYPE.FieldType.FT_START_DATE,
         ):
-            return datetime.strptime(data["udf_date"], "%Y-%m-%d %H:%M")
+            return parse_date(data["udf_date"])
 
         if udf_type.type in (
             UDFTYPE.FieldType.FT_FLOAT_2_DECIMALS,
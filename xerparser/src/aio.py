@@ -0,0 +1,50 @@
+# xerparser
+# aio.py
+
+import asyncio
+import inspect
+from typing import Any, AsyncIterable
+
+
+class AsyncStreamReader:
+    """
+    A blocking, file-like reader over an async byte stream.
+
+    Used to parse an upload while it is being received: the parser runs in a
+    worker thread and each call to `read` waits for the next chunk to be read
+    from the stream on the event loop. The event loop is never blocked.
+
+    Streams can be objects with an async `read` method (FastAPI/Starlette
+    `UploadFile`, aiohttp `StreamReader`, etc...) or async iterables of bytes
+    (Starlette `Request.stream()`, etc...).
+    """
+
+    def __init__(self, stream: Any, loop: asyncio.AbstractEventLoop) -> None:
+        if not is_async_stream(stream):
+            raise TypeError(f"Expected an async byte stream; got {type(stream)}")
+        self._stream = stream
+        self._loop = loop
+        self._chunks = None if _has_async_read(stream) else aiter(stream)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next chunk of bytes. Returns empty bytes at the end of the stream."""
+        return asyncio.run_coroutine_threadsafe(self._read(size), self._loop).result()
+
+    async def _read(self, size: int) -> bytes:
+        if self._chunks is None:
+            return await self._stream.read(size)
+
+        # skip empty chunks so they are not mistaken for the end of the stream
+        while (chunk := await anext(self._chunks, None)) is not None:
+            if chunk:
+                return bytes(chunk)
+        return b""
+
+
+def is_async_stream(stream: Any) -> bool:
+    """Check if an object is an async byte stream."""
+    return _has_async_read(stream) or isinstance(stream, AsyncIterable)
+
+
+def _has_async_read(stream: Any) -> bool:
+    return inspect.iscoroutinefunction(getattr(stream, "read", None))
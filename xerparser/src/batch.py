@@ -0,0 +1,179 @@
+# xerparser
+# batch.py
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from xerparser.src.errors import CorruptXerFile
+from xerparser.src.sniff import XerSummary, sniff
+from xerparser.src.xer import Xer
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class XerResult(Generic[T]):
+    """
+    The result of reading a .xer file with `read_many`.
+
+    Attributes
+    ----------
+    file: Path
+        Path to the .xer file
+    value: T | None
+        Value returned by the reducer, or `None` if the file could not be read
+    errors: list[str]
+        Errors found in the file if it is corrupt, or the exception raised
+        reading it
+    """
+
+    file: Path
+    value: T | None = None
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def is_corrupt(self) -> bool:
+        return bool(self.errors)
+
+
+def read_many(
+    files: Iterable[str | Path],
+    reducer: Callable[[Xer], T] | None = None,
+    workers: int | None = None,
+    ordered: bool = True,
+    max_pending: int | None = None,
+    **kwargs: Any,
+) -> Iterator[XerResult[T]]:
+    """
+    Read many .xer files in a pool of worker processes.
+
+    Each file is read with `Xer.reader` and passed to `reducer` inside the
+    worker, so only the value returned by the reducer is sent back to the
+    current process. The reducer must be a function that can be pickled
+    (i.e. defined at the top level of a module). If no reducer is passed,
+    the `Xer` object itself is returned.
+
+    Args:
+        files (Iterable[str | Path]): .xer files
+        reducer (Callable[[Xer], T], optional): Function applied to each `Xer`.
+        workers (int, optional): Number of worker processes. Defaults to CPU count.
+        ordered (bool, optional): Yield results in the order of the files;
+            otherwise results are yielded as they complete. Defaults to True.
+        max_pending (int, optional): Maximum number of files submitted to the
+            workers at a time. Defaults to twice the number of workers.
+        **kwargs: Additional arguments passed to `Xer.reader`
+
+    Yields:
+        XerResult[T]: Result for each file. The errors of a `CorruptXerFile`,
+        or any other exception raised reading or reducing a file (e.g. a file
+        that is missing or is not a .xer file), are captured in the `errors`
+        of its result, so the other files are still read.
+    """
+    return _map_files(
+        partial(_read_one, reducer=reducer, kwargs=kwargs),
+        files,
+        workers,
+        ordered,
+        max_pending,
+    )
+
+
+def sniff_many(
+    files: str | Path | Iterable[str | Path],
+    workers: int | None = None,
+    ordered: bool = True,
+    max_pending: int | None = None,
+    recursive: bool = False,
+) -> Iterator[XerResult[XerSummary]]:
+    """
+    Read the export information and projects of many .xer files
+    with `sniff` in a pool of worker processes.
+
+    Args:
+        files (str | Path | Iterable[str | Path]): .xer files, or a directory
+            to scan for .xer files
+        workers (int, optional): Number of worker processes. Defaults to CPU count.
+        ordered (bool, optional): Yield results in the order of the files;
+            otherwise results are yielded as they complete. Defaults to True.
+        max_pending (int, optional): Maximum number of files submitted to the
+            workers at a time. Defaults to twice the number of workers.
+        recursive (bool, optional): Also scan the subdirectories of a
+            directory. Defaults to False.
+
+    Yields:
+        XerResult[XerSummary]: Summary of each file. A file without a
+        `PROJECT` table, or that cannot be read, is returned with `errors`.
+    """
+    if isinstance(files, (str, Path)):
+        directory = Path(files)
+        paths = directory.rglob("*") if recursive else directory.iterdir()
+        files = sorted(
+            path for path in paths if path.suffix.lower() == ".xer" and path.is_file()
+        )
+    return _map_files(_sniff_one, files, workers, ordered, max_pending)
+
+
+def _map_files(
+    func: Callable[[Path], XerResult[T]],
+    files: Iterable[str | Path],
+    workers: int | None,
+    ordered: bool,
+    max_pending: int | None,
+) -> Iterator[XerResult[T]]:
+    """Apply `func` to each file in a pool of worker processes."""
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    with ProcessPoolExecutor(workers) as executor:
+        pending: deque[Future] = deque()
+        for file in files:
+            pending.append(executor.submit(func, Path(file)))
+            if len(pending) >= max_pending:
+                yield from _next_results(pending, ordered)
+
+        while pending:
+            yield from _next_results(pending, ordered)
+
+
+def _next_results(pending: deque[Future], ordered: bool) -> Iterator[XerResult]:
+    """Remove the next completed futures from `pending` and yield their results."""
+    if ordered:
+        yield pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
+
+
+def _read_one(
+    file: Path, reducer: Callable[[Xer], T] | None, kwargs: dict[str, Any]
+) -> XerResult[T]:
+    """Read a .xer file and reduce it. Executed in a worker process."""
+    try:
+        xer = Xer.reader(file, **kwargs)
+        return XerResult(file, reducer(xer) if reducer else xer)
+    except CorruptXerFile as e:
+        return XerResult(file, errors=e.errors)
+    except Exception as e:
+        return XerResult(file, errors=[_error_message(e)])
+
+
+def _sniff_one(file: Path) -> XerResult[XerSummary]:
+    """Sniff a .xer file. Executed in a worker process."""
+    try:
+        return XerResult(file, sniff(file))
+    except CorruptXerFile as e:
+        return XerResult(file, errors=e.errors)
+    except Exception as e:
+        return XerResult(file, errors=[_error_message(e)])
+
+
+def _error_message(error: Exception) -> str:
+    """Message of an exception, sent back from a worker process as a string."""
+    return f"{type(error).__name__}: {error}"
@@ -0,0 +1,193 @@
+# xerparser
+# cache.py
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+from xerparser.src.errors import CorruptXerFile
+from xerparser.src.parser import CHUNK_SIZE, read_tables
+from xerparser.src.snapshot import load_snapshot, save_snapshot
+from xerparser.src.validation import Check, default_checks, validate
+from xerparser.src.xer import Retain, Xer, _file_source, select_tables
+
+CACHE_FORMAT = 4  # increment when the layout of a cache entry changes
+DEFAULT_MAX_SIZE = 1 << 30  # 1 GiB
+SPOOL_SIZE = 64 << 20  # unseekable streams are copied to disk past this size
+SUFFIX = ".xercache"
+
+
+class XerCache:
+    """
+    An on-disk cache of parsed .xer files.
+
+    Entries are keyed by a hash of the file contents and the xerparser
+    version, so a file is only parsed again when its contents change.
+    Each entry is a snapshot (see `xerparser.src.snapshot`) of the objects,
+    with all of their fields converted, and of the raw tables, checked for
+    errors. Reading a cached file loads the snapshot, which skips parsing
+    the file, building and linking the objects, and converting field values.
+
+    The total size of the cache is bounded by `max_size` (in bytes);
+    the least recently used entries are removed first.
+    """
+
+    def __init__(self, directory: str | Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = Path(directory)
+        """Directory containing the cache entries"""
+        self.max_size = max_size
+        """Maximum total size of the cache entries in bytes"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
+
+    @property
+    def size(self) -> int:
+        """Total size of the cache entries in bytes"""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+
+    def reader(
+        self,
+        file: Path | str | BinaryIO,
+        tables: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        projects: Iterable[str] | None = None,
+        columnar: bool = False,
+        workers: int | None = None,
+        required_tables: Iterable[str] | None = None,
+        checks: Iterable[Check] | None = None,
+        retain: Retain = "all",
+        lazy: bool = False,
+    ) -> Xer:
+        """
+        Create an Xer object from a .XER file, using the cached entry for the
+        file if there is one. Arguments are the same as `Xer.reader`.
+        Files are only stored in the cache if they have no errors.
+        Additional `checks` are run again when a file is loaded from the cache.
+
+        All of the objects are built when a file is stored in the cache,
+        so `lazy` only skips building the objects that are not used while
+        a file is stored; `workers` is only used when a file is stored.
+        """
+        include, excluded, subset = select_tables(tables, exclude)
+        projects = None if projects is None else set(projects)
+        options = (
+            None if include is None else sorted(include),
+            None if excluded is None else sorted(excluded),
+            None if projects is None else sorted(projects),
+            columnar,
+            None if required_tables is None else sorted(required_tables),
+        )
+
+        file_source = _file_source(file, columnar, projects is not None)
+        with _seekable(file) as source:
+            key = _cache_key(source, options)
+            path = self.directory / f"{key}{SUFFIX}"
+            if (xer := self._load(path)) is not None:
+                if checks and (errors := validate(xer.tables, checks)):
+                    raise CorruptXerFile(errors)
+            else:
+                xer_data = read_tables(
+                    source,
+                    tables=include,
+                    exclude=excluded,
+                    projects=projects,
+                    columnar=columnar,
+                    checks=[
+                        *default_checks(subset, required_tables),
+                        *(checks or ()),
+                    ],
+                )
+                xer = Xer.__new__(Xer)
+                xer._build(xer_data, workers, lazy=lazy)
+                self._store(path, xer)
+
+        xer._source = file_source
+        xer.release_tables(retain)
+        return xer
+
+    def _entries(self) -> Iterator[Path]:
+        return self.directory.glob(f"*{SUFFIX}")
+
+    def _load(self, path: Path) -> Xer | None:
+        """Read a cache entry and mark it as recently used."""
+        try:
+            xer = load_snapshot(path)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # incomplete or damaged entry; parse the file again
+            path.unlink(missing_ok=True)
+            return None
+        return xer
+
+    def _store(self, path: Path, xer: Xer) -> None:
+        """Write a cache entry, then remove entries over the size limit."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            save_snapshot(xer, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits `max_size`."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+def _cache_key(source: BinaryIO, options: tuple) -> str:
+    """Hash the contents of a file and the options used to read it."""
+    from xerparser import __version__
+
+    start = source.tell()
+    digest = hashlib.blake2b(digest_size=20)
+    while chunk := source.read(CHUNK_SIZE):
+        digest.update(chunk)
+    source.seek(start)
+    digest.update(repr((__version__, CACHE_FORMAT, options)).encode())
+    return digest.hexdigest()
+
+
+@contextmanager
+def _seekable(file: Path | str | BinaryIO) -> Iterator[BinaryIO]:
+    """
+    Open a file so it can be read twice: once to hash it and once to parse it.
+    Streams that cannot seek are copied to a temporary file.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, "rb") as f:
+            yield f
+    elif getattr(file, "seekable", lambda: False)():
+        yield file
+    else:
+        with tempfile.SpooledTemporaryFile(SPOOL_SIZE) as f:
+            while chunk := file.read(CHUNK_SIZE):
+                f.write(chunk)
+            f.seek(0)
+            yield f
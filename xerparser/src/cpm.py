@@ -0,0 +1,997 @@
+# xerparser
+# cpm.py
+
+# Critical path scheduling of a project.
+#
+# Times are counted in minutes of work on a calendar (`_WorkTime`), so a
+# duration is added to a date by adding integers. Each task is scheduled on
+# its own calendar; a time is only converted to another calendar when a
+# relationship links tasks on different calendars, or its lag is counted on
+# a different calendar than the tasks. Schedules where most tasks share a
+# calendar are scheduled with integer arithmetic over the index arrays of the
+# network, without converting any dates.
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Iterator
+
+from xerparser.schemas._field import field_values
+from xerparser.schemas.calendars import CALENDAR, WEEKDAYS
+from xerparser.schemas.task import TASK
+from xerparser.schemas.taskpred import TASKPRED
+from xerparser.src.network import FF, FS, SS
+
+if TYPE_CHECKING:
+    from xerparser.schemas.project import PROJECT
+
+DAY = 1440  # minutes
+WINDOW_DAYS = 366  # days of work intervals added to a calendar at a time
+MAX_DAYS = 366 * 200  # limit on the range of dates of a schedule
+_MINUTE = timedelta(minutes=1)
+
+# Constraints limiting the early start, early finish, late start, and late finish
+_EARLY_START = {"CS_MSOA", "CS_MSO", "CS_MANDSTART"}
+_EARLY_FINISH = {"CS_MEOA", "CS_MEO", "CS_MANDFIN"}
+_LATE_START = {"CS_MSOB", "CS_MSO", "CS_MANDSTART"}
+_LATE_FINISH = {"CS_MEOB", "CS_MEO", "CS_MANDFIN"}
+
+
+@dataclass(frozen=True)
+class ScheduledDates:
+    """
+    Dates and float of an activity calculated by `PROJECT.schedule`.
+
+    Attributes
+    ----------
+    early_start: datetime
+        Early Start (Actual Start once the activity is started)
+    early_finish: datetime
+        Early Finish (Actual Finish once the activity is completed)
+    late_start: datetime
+        Late Start (remaining late start once the activity is started)
+    late_finish: datetime
+        Late Finish
+    total_float_hr_cnt: float
+        Total Float in hours on the calendar of the activity
+    free_float_hr_cnt: float
+        Free Float in hours on the calendar of the activity
+    """
+
+    early_start: datetime
+    early_finish: datetime
+    late_start: datetime
+    late_finish: datetime
+    total_float_hr_cnt: float
+    free_float_hr_cnt: float
+
+    @property
+    def is_critical(self) -> bool:
+        return self.total_float_hr_cnt <= 0
+
+
+class CPMSchedule:
+    """
+    Early and late dates, and float, of the activities of a project calculated
+    with a forward and backward pass over its relationships. The dates of an
+    activity are converted from the scheduled work counts when first read.
+    """
+
+    def __init__(self, scheduler: "_Scheduler") -> None:
+        self.project = scheduler.project
+        """Scheduled project"""
+        self.data_date = scheduler.origin
+        """Date the project was scheduled from"""
+        self.tasks = scheduler.tasks
+        """Scheduled activities"""
+        self._scheduler = scheduler
+        self._dates: list[ScheduledDates | None] = [None] * len(self.tasks)
+        self._drivers: list[list[int] | None] = [None] * len(self.tasks)
+
+    def __getitem__(self, task: TASK) -> ScheduledDates:
+        return self._get(self._scheduler.network.index(task))
+
+    def __iter__(self) -> Iterator[tuple[TASK, ScheduledDates]]:
+        for i, task in enumerate(self.tasks):
+            yield task, self._get(i)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def critical(self) -> list[TASK]:
+        """Open activities with no total float"""
+        return [
+            task
+            for task, total, done in zip(
+                self.tasks, self._scheduler.total, self._scheduler.done
+            )
+            if total <= 0 and not done
+        ]
+
+    @property
+    def finish(self) -> datetime:
+        """Latest early finish of the activities"""
+        scheduler = self._scheduler
+        finishes = [
+            task.act_end_date
+            for task, done in zip(self.tasks, scheduler.done)
+            if done and task.act_end_date
+        ]
+        if (minute := scheduler.latest_finish()) is not None:
+            finishes.append(scheduler.date(minute))
+        return max(finishes, default=self.data_date)
+
+    def driving_predecessors(self, task: TASK) -> list[TASKPRED]:
+        """Relationships with no free float, which drive the dates of an activity."""
+        network = self._scheduler.network
+        return [
+            network.relationships[network.pred_links[k]]
+            for k in self._driving(network.index(task))
+        ]
+
+    def driving_path(self, task: TASK) -> list[TASK]:
+        """
+        Activities driving the dates of an activity through relationships with
+        no free float, in schedule order and ending with the activity. The
+        driving relationships of each activity are found once and reused when
+        tracing the path of other activities.
+        """
+        preds = self._scheduler.network.pred_tasks
+        target = self._scheduler.network.index(task)
+        found, stack = {target}, [target]
+        while stack:
+            for k in self._driving(stack.pop()):
+                if (i := preds[k]) not in found:
+                    found.add(i)
+                    stack.append(i)
+        return self._ordered(found)
+
+    def float_paths(self, task: TASK, count: int | None = None) -> list[list[TASK]]:
+        """
+        Multiple float paths into an activity, like the multiple float paths
+        option of P6. The activities the activity depends on are grouped by their
+        float: path 1 is the driving path, and each following path is the group
+        of activities with the next lowest float, in schedule order. Path numbers
+        and positions can be compared with the `float_path` and
+        `float_path_order` of the activities.
+
+        Float is the relative free float (how long an activity can be delayed
+        before it delays the activity). When the project option
+        `use_total_float_multiple_longest_paths` is set, the paths after the
+        driving path group the open activities by their total float, and
+        completed activities are left out as they are in `critical`.
+
+        Args:
+            task (TASK): Activity to trace the paths into
+            count (int | None, optional): Number of paths. Defaults to the
+            project option `max_multiple_longest_path`, or 10.
+
+        Returns:
+            list[list[TASK]]: Activities of each path
+        """
+        scheduler = self._scheduler
+        options = scheduler.options
+        if count is None:
+            count = options.max_multiple_longest_path or 10
+        floats = scheduler.relative_float(scheduler.network.index(task))
+        paths: dict[int, set[int]] = {}
+        if options.use_total_float_multiple_longest_paths:
+            driving = {i for i, value in floats.items() if value == 0}
+            for i in floats.keys() - driving:
+                if not scheduler.done[i]:
+                    paths.setdefault(scheduler.total[i], set()).add(i)
+            groups = [driving] + [paths[value] for value in sorted(paths)]
+        else:
+            for i, value in floats.items():
+                paths.setdefault(value, set()).add(i)
+            groups = [paths[value] for value in sorted(paths)]
+        return [self._ordered(group) for group in groups[:count]]
+
+    def _driving(self, j: int) -> list[int]:
+        """Positions of the driving relationships of activity `j` (see `drivers`)."""
+        if (drivers := self._drivers[j]) is None:
+            drivers = self._drivers[j] = self._scheduler.drivers(j)
+        return drivers
+
+    def _get(self, i: int) -> ScheduledDates:
+        if (dates := self._dates[i]) is None:
+            dates = self._dates[i] = self._scheduler.dates(i)
+        return dates
+
+    def _ordered(self, activities: set[int]) -> list[TASK]:
+        position = self._scheduler.position
+        return [self.tasks[i] for i in sorted(activities, key=position.__getitem__)]
+
+
+class _WorkTime:
+    """
+    Work intervals of a calendar, for converting dates to the number of minutes
+    of work counted from the data date, and back. Intervals are generated a
+    year at a time around the data date as they are needed.
+
+    A date in a non-work period is counted as the work before it. Converted
+    back, a count of minutes is a start date at the beginning of the next
+    work interval, or a finish date at the end of the previous work interval.
+    """
+
+    def __init__(self, calendar: CALENDAR, origin: datetime) -> None:
+        self.origin = origin
+        self._day = origin.date()
+        self._offset = origin.hour * 60 + origin.minute
+        self._week = [
+            _intervals(calendar.work_week.get(WEEKDAYS[(day + 1) % 7]))
+            for day in range(7)
+        ]
+        self._exceptions = {
+            day.date(): _intervals(work_day)
+            for day, work_day in calendar.work_exceptions.items()
+        }
+        holidays = calendar.holidays
+        if not holidays and calendar.base_calendar:
+            holidays = calendar.base_calendar.holidays
+        self._holidays = {day.date() for day in holidays}
+
+        self.starts: list[int] = []
+        """Start of each work interval, in minutes from the origin"""
+        self.ends: list[int] = []
+        """End of each work interval, in minutes from the origin"""
+        self.counts: list[int] = []
+        """Minutes of work from the origin to the start of each work interval"""
+        self._first = self._last = 0  # range of days of the intervals
+        self._add_days(-WINDOW_DAYS, WINDOW_DAYS)
+        if not self.starts:
+            raise ValueError(f"Calendar {calendar.name} has no work hours")
+
+    def _add_days(self, first: int, last: int) -> None:
+        """Add the work intervals from day `first` to day `last` (not included)."""
+        starts, ends = [], []
+        for day in range(first, last):
+            d = self._day + timedelta(days=day)
+            if d in self._holidays:
+                continue
+            shifts = self._exceptions.get(d)
+            if shifts is None:
+                shifts = self._week[d.weekday()]
+            base = day * DAY - self._offset
+            for start, end in shifts:
+                if starts and ends[-1] == base + start:
+                    ends[-1] = base + end
+                else:
+                    starts.append(base + start)
+                    ends.append(base + end)
+
+        if not self.starts:
+            self.starts, self.ends = starts, ends
+            self.counts = _counts(starts, ends, 0)
+            self._first, self._last = first, last
+            if starts:
+                # count the minutes of work from the origin
+                shift = self.count(0)
+                self.counts = [count - shift for count in self.counts]
+        elif first >= self._last:
+            if starts and starts[0] == self.ends[-1]:
+                self.ends[-1] = ends[0]
+                starts, ends = starts[1:], ends[1:]
+            count = self.counts[-1] + self.ends[-1] - self.starts[-1]
+            self.counts.extend(_counts(starts, ends, count))
+            self.starts.extend(starts)
+            self.ends.extend(ends)
+            self._last = last
+        else:
+            if starts and ends[-1] == self.starts[0]:
+                self.counts[0] -= self.starts[0] - starts[-1]
+                self.starts[0] = starts[-1]
+                starts, ends = starts[:-1], ends[:-1]
+            total = sum(end - start for start, end in zip(starts, ends))
+            self.counts[:0] = _counts(starts, ends, self.counts[0] - total)
+            self.starts[:0] = starts
+            self.ends[:0] = ends
+            self._first = first
+
+    def _extend(self, forward: bool) -> None:
+        if self._last - self._first > MAX_DAYS:
+            raise ValueError("Schedule dates are out of range")
+        if forward:
+            self._add_days(self._last, self._last + WINDOW_DAYS)
+        else:
+            self._add_days(self._first - WINDOW_DAYS, self._first)
+
+    def count(self, minute: int) -> int:
+        """Minutes of work from the origin to a date (in minutes from the origin)."""
+        while minute >= self.ends[-1]:
+            self._extend(True)
+        while minute < self.starts[0]:
+            self._extend(False)
+        k = bisect_right(self.starts, minute) - 1
+        return self.counts[k] + min(minute, self.ends[k]) - self.starts[k]
+
+    def start(self, count: int) -> int:
+        """Date (in minutes from the origin) a count of minutes of work starts at."""
+        while count >= self.counts[-1] + self.ends[-1] - self.starts[-1]:
+            self._extend(True)
+        while count < self.counts[0]:
+            self._extend(False)
+        k = bisect_right(self.counts, count) - 1
+        return self.starts[k] + count - self.counts[k]
+
+    def finish(self, count: int) -> int:
+        """Date (in minutes from the origin) a count of minutes of work finishes at."""
+        while count > self.counts[-1] + self.ends[-1] - self.starts[-1]:
+            self._extend(True)
+        while count <= self.counts[0]:
+            self._extend(False)
+        k = bisect_left(self.counts, count) - 1
+        return self.starts[k] + count - self.counts[k]
+
+
+class _Elapsed:
+    """Continuous time, for lags counted on a 24 hour calendar."""
+
+    def count(self, minute: int) -> int:
+        return minute
+
+    def start(self, count: int) -> int:
+        return count
+
+    def finish(self, count: int) -> int:
+        return count
+
+
+def _intervals(work_day) -> list[tuple[int, int]]:
+    """Work shifts of a day in minutes from midnight."""
+    if work_day is None:
+        return []
+    intervals = []
+    for start, end in work_day.shifts:
+        start_min = start.hour * 60 + start.minute
+        end_min = end.hour * 60 + end.minute
+        if end_min <= start_min:
+            end_min = DAY
+        if intervals and intervals[-1][1] >= start_min:
+            intervals[-1] = (intervals[-1][0], max(intervals[-1][1], end_min))
+        else:
+            intervals.append((start_min, end_min))
+    return intervals
+
+
+def _counts(starts: list[int], ends: list[int], count: int) -> list[int]:
+    counts = []
+    for start, end in zip(starts, ends):
+        counts.append(count)
+        count += end - start
+    return counts
+
+
+def _minutes(hours: float | None) -> int:
+    return round((hours or 0) * 60)
+
+
+def schedule(project: "PROJECT", data_date: datetime | None = None) -> CPMSchedule:
+    """
+    Calculate the early and late dates and the float of the activities of a
+    project. See `PROJECT.schedule`.
+    """
+    return _Scheduler(project, data_date or project.data_date).run()
+
+
+class _Scheduler:
+    """
+    Forward and backward pass over the relationships of a project.
+
+    Activities are numbered by their position in the `Network` of the project,
+    and the relationships are read from its arrays of the predecessors and
+    successors of each activity. Dates are counted in minutes of work on
+    the calendar of each activity (see `_WorkTime`).
+    """
+
+    def __init__(self, project: "PROJECT", origin: datetime) -> None:
+        self.project = project
+        self.origin = origin
+        self.options = options = project.options
+        self.network = network = project.network
+        self.tasks = tasks = network.tasks
+        n = len(tasks)
+
+        self._calendars: dict[int, _WorkTime] = {}
+        self.lag_on_succ = options.calendar_on_relationship_lag == "rcal_Successor"
+        self.lag_cal: _WorkTime | _Elapsed | None = None
+        if options.calendar_on_relationship_lag == "rcal_24Hour":
+            self.lag_cal = _Elapsed()
+        elif options.calendar_on_relationship_lag == "rcal_ProjDefault":
+            self.lag_cal = self._work_time(None)
+
+        # row fields are read in one pass over the activities for each column
+        statuses = field_values(tasks, "status")
+        types = field_values(tasks, "type")
+        calendars = [task.calendar for task in tasks]
+        unique = {id(cal): cal for cal in calendars}
+        work_times = {key: self._work_time(cal) for key, cal in unique.items()}
+        self.cal: list[_WorkTime] = [work_times[id(cal)] for cal in calendars]
+        # enum members are bound to local names, which are faster to look up
+        complete, active = TASK.TaskStatus.TK_Complete, TASK.TaskStatus.TK_Active
+        loe, wbs = TASK.TaskType.TT_LOE, TASK.TaskType.TT_WBS
+        mile, fin_mile = TASK.TaskType.TT_Mile, TASK.TaskType.TT_FinMile
+        self.done: list[bool] = [s is complete for s in statuses]
+        self.started: list[bool] = [s is active for s in statuses]
+        self.spans: list[bool] = [t is loe or t is wbs for t in types]
+        """Level of effort and WBS summary activities, which span their relationships"""
+        self.finishes: list[bool] = [t is fin_mile for t in types]
+        """Finish milestones, which are dated at the end of the work before them"""
+        hours = field_values(tasks, "remain_drtn_hr_cnt")
+        minutes = {value: _minutes(value) for value in set(hours)}
+        self.duration: list[int] = [
+            0 if done or t is mile or t is fin_mile else minutes[value]
+            for done, t, value in zip(self.done, types, hours)
+        ]
+        """Remaining duration of each activity"""
+
+        # actual dates of the activities that are started or completed
+        started = [i for i in range(n) if self.done[i] or self.started[i]]
+        self.act_start: dict[int, datetime | None] = dict(
+            zip(started, field_values([tasks[i] for i in started], "act_start_date"))
+        )
+        """Actual start of the activities that are started or completed"""
+        done = [i for i in started if self.done[i]]
+        self.act_end: dict[int, datetime | None] = dict(
+            zip(done, field_values([tasks[i] for i in done], "act_end_date"))
+        )
+        """Actual finish of the completed activities"""
+        self.expect_end: dict[int, datetime | None] = {}
+        """Expected finish of the open activities, if the project uses them"""
+        if options.use_expect_end_flag:
+            open_tasks = [i for i in range(n) if not self.done[i]]
+            self.expect_end = dict(
+                zip(
+                    open_tasks,
+                    field_values([tasks[i] for i in open_tasks], "expect_end_date"),
+                )
+            )
+
+        self.constraints: dict[int, list[tuple[str, int]]] = {}
+        """Constraints of the activities that have them"""
+        kinds = field_values(tasks, "cstr_type")
+        kinds2 = field_values(tasks, "cstr_type2")
+        constrained = [i for i in range(n) if kinds[i] or kinds2[i]]
+        subset = [tasks[i] for i in constrained]
+        for i, date, date2 in zip(
+            constrained,
+            field_values(subset, "cstr_date"),
+            field_values(subset, "cstr_date2"),
+        ):
+            self.constraints[i] = [
+                (kind, self._minute(date))
+                for kind, date in ((kinds[i], date), (kinds2[i], date2))
+                if kind and (date or kind == "CS_ALAP")
+            ]
+
+        self.free = [
+            span or done or (started and options.progress_override)
+            for span, done, started in zip(self.spans, self.done, self.started)
+        ]
+        """Activities whose dates are not driven by their predecessors"""
+
+        self.ext_start: list[int | None] = [None] * n
+        self.ext_finish: list[int | None] = [None] * n
+        for rel in network.external:
+            if rel.successor in network and rel.aref:
+                # external predecessor in another project
+                succ = network.index(rel.successor)
+                value = self.cal[succ].count(self._minute(rel.aref))
+                current = self.ext_start[succ]
+                self.ext_start[succ] = value if current is None else max(current, value)
+            elif rel.predecessor in network and rel.arls:
+                # external successor in another project
+                pred = network.index(rel.predecessor)
+                value = self.cal[pred].count(self._minute(rel.arls))
+                current = self.ext_finish[pred]
+                self.ext_finish[pred] = (
+                    value if current is None else min(current, value)
+                )
+        lags = {lag: _minutes(lag) for lag in set(network.pred_lags)}
+        self.preds = (
+            list(network.pred_offsets),
+            list(network.pred_tasks),
+            list(network.pred_types),
+            [lags[lag] for lag in network.pred_lags],
+        )
+        """Predecessors of each activity (see `Network`), with lags in minutes"""
+        self.succs = (
+            list(network.succ_offsets),
+            list(network.succ_tasks),
+            list(network.succ_types),
+            [lags[lag] for lag in network.succ_lags],
+        )
+        """Successors of each activity (see `Network`), with lags in minutes"""
+
+        data = {id(cal): cal.count(0) for cal in self._calendars.values()}
+        self.data = [data[id(cal)] for cal in self.cal]
+        """Data date on the calendar of each activity"""
+        self.es, self.ef, self.ls, self.lf = [0] * n, [0] * n, [0] * n, [0] * n
+        self.rs = [0] * n
+        """Start of the remaining duration of each activity"""
+
+    def run(self) -> CPMSchedule:
+        order = self._topological_order()
+        self.position = [0] * len(order)
+        """Position of each activity in the order it was scheduled"""
+        for position, i in enumerate(order):
+            self.position[i] = position
+        self._forward(order)
+        self._backward(order)
+        self._spans()
+        self._as_late_as_possible(order)
+        self.total = self._total_floats()
+        return CPMSchedule(self)
+
+    def _work_time(self, calendar: CALENDAR | None) -> _WorkTime:
+        if calendar is None:
+            calendar = self.project.default_calendar
+        if calendar is None:
+            raise ValueError(
+                f"Project {self.project.short_name} has no default calendar"
+            )
+        if (work_time := self._calendars.get(id(calendar))) is None:
+            work_time = _WorkTime(calendar, self.origin)
+            self._calendars[id(calendar)] = work_time
+        return work_time
+
+    def _minute(self, date: datetime) -> int:
+        return (date - self.origin) // _MINUTE
+
+    def date(self, minute: int) -> datetime:
+        return self.origin + minute * _MINUTE
+
+    def _topological_order(self) -> list[int]:
+        """Order of the activities where each activity follows its predecessors."""
+        offsets, succs, _, _ = self.succs
+        spans, free = self.spans, self.free
+        count = [0] * len(self.tasks)
+        for i in range(len(self.tasks)):
+            if not spans[i]:
+                for k in range(offsets[i], offsets[i + 1]):
+                    if not free[succs[k]]:
+                        count[succs[k]] += 1
+
+        order = [i for i, c in enumerate(count) if c == 0]
+        for i in order:
+            if spans[i]:
+                continue
+            for k in range(offsets[i], offsets[i + 1]):
+                j = succs[k]
+                if not free[j]:
+                    count[j] -= 1
+                    if count[j] == 0:
+                        order.append(j)
+
+        if len(order) < len(self.tasks):
+            raise ValueError(
+                f"Cannot schedule project {self.project.short_name}: "
+                f"{len(self.tasks) - len(order)} activities are in or after "
+                "a relationship loop"
+            )
+        return order
+
+    def _to_succ(
+        self, value: int, ci: _WorkTime, finish: bool, lag: int, cj: _WorkTime
+    ) -> int:
+        """Convert a date of a predecessor plus the lag to the successor's calendar."""
+        if ci is cj and (lag == 0 or self.lag_cal is None):
+            return value + lag
+        lc = cj if self.lag_on_succ else self.lag_cal or ci
+        if lc is ci:
+            value += lag
+            return cj.count(ci.finish(value) if finish or lag else ci.start(value))
+        minute = ci.finish(value) if finish else ci.start(value)
+        if lc is cj:
+            return cj.count(minute) + lag
+        return cj.count(lc.finish(lc.count(minute) + lag))
+
+    def _to_pred(
+        self, value: int, cj: _WorkTime, finish: bool, lag: int, ci: _WorkTime
+    ) -> int:
+        """Convert a date of a successor less the lag to the predecessor's calendar."""
+        if ci is cj and (lag == 0 or self.lag_cal is None):
+            return value - lag
+        lc = cj if self.lag_on_succ else self.lag_cal or ci
+        if lc is cj:
+            value -= lag
+            return ci.count(cj.finish(value) if finish else cj.start(value))
+        minute = cj.finish(value) if finish else cj.start(value)
+        if lc is ci:
+            return ci.count(minute) - lag
+        return ci.count(lc.start(lc.count(minute) - lag))
+
+    def _forward(self, order: list[int]) -> None:
+        """Early dates: each activity starts as soon as its predecessors allow."""
+        offsets, preds, types, lags = self.preds
+        cal, spans, started, free = self.cal, self.spans, self.started, self.free
+        es, ef, rs, duration = self.es, self.ef, self.rs, self.duration
+        done, data, ext_start = self.done, self.data, self.ext_start
+        constraints, act_start = self.constraints, self.act_start
+        to_succ, minute_of = self._to_succ, self._minute
+        # lags are added without converting dates between activities on the
+        # same calendar, unless they are counted on another calendar
+        plain = self.lag_cal is None
+        expect_end = self.expect_end if self.options.use_expect_end_flag else {}
+
+        for j in order:
+            cj = cal[j]
+            if done[j]:
+                es[j] = rs[j] = cj.count(minute_of(act_start[j]))
+                ef[j] = cj.count(minute_of(self.act_end[j]))
+                continue
+
+            start, finish = data[j], None
+            if not free[j]:
+                for k in range(offsets[j], offsets[j + 1]):
+                    i = preds[k]
+                    if spans[i]:
+                        continue
+                    link, lag, ci = types[k], lags[k], cal[i]
+                    if link == FS:
+                        if ci is cj and (plain or not lag):
+                            value = ef[i] + lag
+                        else:
+                            value = to_succ(ef[i], ci, True, lag, cj)
+                        if value > start:
+                            start = value
+                    elif link == SS:
+                        value = to_succ(es[i], ci, False, lag, cj)
+                        if value > start:
+                            start = value
+                    else:
+                        value = (
+                            to_succ(ef[i], ci, True, lag, cj)
+                            if link == FF
+                            else to_succ(es[i], ci, False, lag, cj)
+                        )
+                        if finish is None or value > finish:
+                            finish = value
+            if (value := ext_start[j]) is not None and value > start:
+                start = value
+
+            dur = duration[j]
+            if j in constraints:
+                for kind, minute in constraints[j]:
+                    if kind == "CS_ALAP":
+                        continue
+                    value = cj.count(minute)
+                    if kind == "CS_MANDFIN":
+                        start = value - dur
+                    elif started[j] or kind not in _EARLY_START:
+                        if kind in _EARLY_FINISH:
+                            finish = value if finish is None else max(finish, value)
+                    elif kind == "CS_MANDSTART":
+                        start = value
+                    else:
+                        start = max(start, value)
+            if expect_end and (end_date := expect_end[j]):
+                end = cj.count(minute_of(end_date))
+                dur = duration[j] = max(0, end - start)
+            if finish is not None and finish - dur > start:
+                start = finish - dur
+
+            rs[j] = start
+            ef[j] = start + dur
+            es[j] = cj.count(minute_of(act_start[j])) if started[j] else start
+
+    def _backward(self, order: list[int]) -> None:
+        """Late dates: each activity finishes as late as its successors allow."""
+        offsets, succs, types, lags = self.succs
+        cal, spans, free, started = self.cal, self.spans, self.free, self.started
+        es, ef, ls, lf, duration = self.es, self.ef, self.ls, self.lf, self.duration
+        done, ext_finish, constraints = self.done, self.ext_finish, self.constraints
+        to_pred = self._to_pred
+        plain = self.lag_cal is None
+
+        if must_finish := self.project.must_finish_date:
+            end_minute = self._minute(must_finish)
+        else:
+            end_minute = self.latest_finish() or 0
+        ends = {id(ci): ci.count(end_minute) for ci in self._calendars.values()}
+
+        for i in reversed(order):
+            if done[i]:
+                ls[i], lf[i] = es[i], ef[i]
+                continue
+            if spans[i]:
+                continue
+
+            ci = cal[i]
+            start, finish = None, ends[id(ci)]
+            for k in range(offsets[i], offsets[i + 1]):
+                j = succs[k]
+                if free[j]:
+                    continue
+                link, lag, cj = types[k], lags[k], cal[j]
+                if link == FS:
+                    if ci is cj and (plain or not lag):
+                        value = ls[j] - lag
+                    else:
+                        value = to_pred(ls[j], cj, False, lag, ci)
+                    if value < finish:
+                        finish = value
+                elif link == FF:
+                    value = to_pred(lf[j], cj, True, lag, ci)
+                    if value < finish:
+                        finish = value
+                else:
+                    value = (
+                        to_pred(ls[j], cj, False, lag, ci)
+                        if link == SS
+                        else to_pred(lf[j], cj, True, lag, ci)
+                    )
+                    if start is None or value < start:
+                        start = value
+            if (value := ext_finish[i]) is not None and value < finish:
+                finish = value
+
+            dur = duration[i]
+            if i in constraints:
+                for kind, minute in constraints[i]:
+                    if kind == "CS_ALAP":
+                        continue
+                    value = ci.count(minute)
+                    if kind == "CS_MANDFIN":
+                        finish = value
+                    elif started[i] or kind not in _LATE_START:
+                        if kind in _LATE_FINISH:
+                            finish = min(finish, value)
+                    elif kind == "CS_MANDSTART":
+                        finish = value + dur
+                    else:
+                        start = value if start is None else min(start, value)
+            if start is not None and start + dur < finish:
+                finish = start + dur
+
+            lf[i] = finish
+            ls[i] = finish - dur
+
+    def _spans(self) -> None:
+        """
+        Level of effort and WBS summary activities start when their predecessors
+        allow, and finish when their successors start (or finish, for finish to
+        finish relationships). They do not drive the dates of other activities.
+        """
+        pred_offsets, preds, pred_types, pred_lags = self.preds
+        offsets, succs, types, lags = self.succs
+        cal, spans = self.cal, self.spans
+        for i in range(len(self.tasks)):
+            if not spans[i] or self.done[i]:
+                continue
+
+            ci = cal[i]
+            start = late_start = self.data[i]
+            for k in range(pred_offsets[i], pred_offsets[i + 1]):
+                j = preds[k]
+                if spans[j] or pred_types[k] not in (FS, SS):
+                    continue
+                value = (
+                    self._to_succ(self.ef[j], cal[j], True, pred_lags[k], ci)
+                    if pred_types[k] == FS
+                    else self._to_succ(self.es[j], cal[j], False, pred_lags[k], ci)
+                )
+                start = max(start, value)
+                late_value = (
+                    self._to_succ(self.lf[j], cal[j], True, pred_lags[k], ci)
+                    if pred_types[k] == FS
+                    else self._to_succ(self.ls[j], cal[j], False, pred_lags[k], ci)
+                )
+                late_start = max(late_start, late_value)
+
+            finish = late_finish = None
+            for k in range(offsets[i], offsets[i + 1]):
+                j = succs[k]
+                if spans[j] or types[k] not in (FS, FF):
+                    continue
+                is_finish = types[k] == FF
+                early = self.ef[j] if is_finish else self.rs[j]
+                late = self.lf[j] if is_finish else self.ls[j]
+                value = self._to_pred(early, cal[j], is_finish, lags[k], ci)
+                late_value = self._to_pred(late, cal[j], is_finish, lags[k], ci)
+                finish = value if finish is None else max(finish, value)
+                late_finish = (
+                    late_value if late_finish is None else max(late_finish, late_value)
+                )
+
+            if self.started[i]:
+                start = late_start = self.rs[i] = self.data[i]
+                self.es[i] = ci.count(self._minute(self.act_start[i]))
+            else:
+                self.es[i] = self.rs[i] = start
+            self.ef[i] = max(
+                start, start + self.duration[i] if finish is None else finish
+            )
+            self.lf[i] = max(
+                late_start,
+                late_start + self.duration[i] if late_finish is None else late_finish,
+            )
+            self.duration[i] = self.ef[i] - start
+            self.ls[i] = self.lf[i] - self.duration[i]
+
+    def _free_float(self, i: int) -> int | None:
+        """Delay of an activity that does not delay the early dates of its successors."""
+        offsets, succs, types, lags = self.succs
+        cal, free, rs, ef = self.cal, self.free, self.rs, self.ef
+        if self.spans[i]:
+            return None
+        ci = cal[i]
+        result = None
+        for k in range(offsets[i], offsets[i + 1]):
+            j = succs[k]
+            if free[j]:
+                continue
+            link = types[k]
+            if link == FS or link == SS:
+                value = self._to_pred(rs[j], cal[j], False, lags[k], ci)
+            else:
+                value = self._to_pred(ef[j], cal[j], True, lags[k], ci)
+            value -= ef[i] if link == FS or link == FF else rs[i]
+            if result is None or value < result:
+                result = value
+        return result
+
+    def _finish_minute(self, i: int, count: int) -> int:
+        """Finish date of an activity, in minutes from the origin."""
+        if self.duration[i] or self.finishes[i]:
+            return self.cal[i].finish(count)
+        return self.cal[i].start(count)
+
+    def latest_finish(self) -> int | None:
+        """Latest early finish of the open activities, in minutes from the origin."""
+        latest: dict[tuple[_WorkTime, bool], int] = {}
+        for cal, done, dur, finishes, count in zip(
+            self.cal, self.done, self.duration, self.finishes, self.ef
+        ):
+            if done:
+                continue
+            key = (cal, bool(dur or finishes))
+            if latest.get(key, count) <= count:
+                latest[key] = count
+        # a later count on the same calendar is never an earlier date
+        return (
+            max(
+                (cal.finish(count) if finish else cal.start(count))
+                for (cal, finish), count in latest.items()
+            )
+            if latest
+            else None
+        )
+
+    def _total_float(self, i: int) -> int:
+        if self.done[i]:
+            return 0
+        float_type = self.options.float_type
+        if float_type == "FT_SF":
+            return self.ls[i] - self.rs[i]
+        if float_type == "FT_SM":
+            return min(self.ls[i] - self.rs[i], self.lf[i] - self.ef[i])
+        return self.lf[i] - self.ef[i]
+
+    def _total_floats(self) -> list[int]:
+        """Total float of each activity (see `_total_float`)."""
+        float_type = self.options.float_type
+        if float_type == "FT_SF":
+            floats = [ls - rs for ls, rs in zip(self.ls, self.rs)]
+        elif float_type == "FT_SM":
+            floats = [
+                min(ls - rs, lf - ef)
+                for ls, rs, lf, ef in zip(self.ls, self.rs, self.lf, self.ef)
+            ]
+        else:
+            floats = [lf - ef for lf, ef in zip(self.lf, self.ef)]
+        return [0 if done else value for done, value in zip(self.done, floats)]
+
+    def _as_late_as_possible(self, order: list[int]) -> None:
+        """
+        Delay activities with an as late as possible constraint by their free
+        float, so they finish just before their successors need them.
+        """
+        alap = {
+            i
+            for i, constraints in self.constraints.items()
+            if any(kind == "CS_ALAP" for kind, _ in constraints)
+            and not (self.done[i] or self.started[i])
+        }
+        if not alap:
+            return
+        for i in reversed(order):
+            if i not in alap:
+                continue
+            total = self._total_float(i)
+            free = self._free_float(i)
+            if free is None or free > total:
+                free = total
+            if free > 0:
+                self.es[i] += free
+                self.rs[i] += free
+                self.ef[i] += free
+
+    def link_float(self, j: int, k: int) -> int:
+        """
+        Minutes activity `j` is scheduled after the date its predecessor at
+        position `k` of the predecessor arrays requires.
+        """
+        _, preds, types, lags = self.preds
+        i, link, cj = preds[k], types[k], self.cal[j]
+        if link == FS:
+            return self.rs[j] - self._to_succ(
+                self.ef[i], self.cal[i], True, lags[k], cj
+            )
+        if link == SS:
+            return self.rs[j] - self._to_succ(
+                self.es[i], self.cal[i], False, lags[k], cj
+            )
+        if link == FF:
+            return self.ef[j] - self._to_succ(
+                self.ef[i], self.cal[i], True, lags[k], cj
+            )
+        return self.ef[j] - self._to_succ(self.es[i], self.cal[i], False, lags[k], cj)
+
+    def drivers(self, j: int) -> list[int]:
+        """Positions of the relationships with no free float into activity `j`."""
+        if self.free[j]:
+            return []
+        offsets, preds = self.preds[0], self.preds[1]
+        return [
+            k
+            for k in range(offsets[j], offsets[j + 1])
+            if not self.spans[preds[k]] and self.link_float(j, k) <= 0
+        ]
+
+    def relative_float(self, target: int) -> dict[int, int]:
+        """
+        Minutes each activity the target depends on can be delayed before it
+        delays the target, by the lowest sum of relationship free float on the
+        paths between them. Activities are visited from the latest scheduled.
+        """
+        offsets, preds = self.preds[0], self.preds[1]
+        floats = {target: 0}
+        heap = [(-self.position[target], target)]
+        while heap:
+            _, j = heappop(heap)
+            if self.free[j]:
+                continue
+            for k in range(offsets[j], offsets[j + 1]):
+                i = preds[k]
+                if self.spans[i]:
+                    continue
+                value = floats[j] + max(0, self.link_float(j, k))
+                if i not in floats:
+                    floats[i] = value
+                    heappush(heap, (-self.position[i], i))
+                elif value < floats[i]:
+                    floats[i] = value
+        return floats
+
+    def dates(self, i: int) -> ScheduledDates:
+        """Scheduled dates of the activity at position `i`."""
+        task = self.tasks[i]
+        if self.done[i]:
+            return ScheduledDates(
+                early_start=task.act_start_date,
+                early_finish=task.act_end_date,
+                late_start=task.act_start_date,
+                late_finish=task.act_end_date,
+                total_float_hr_cnt=0.0,
+                free_float_hr_cnt=0.0,
+            )
+
+        total = self.total[i]
+        free = self._free_float(i)
+        if free is None or free > total:
+            free = total
+        # finish milestones start at the end of the work before them
+        start = self.cal[i].finish if self.finishes[i] else self.cal[i].start
+        return ScheduledDates(
+            early_start=(
+                task.act_start_date if self.started[i] else self.date(start(self.es[i]))
+            ),
+            early_finish=self.date(self._finish_minute(i, self.ef[i])),
+            late_start=self.date(start(self.ls[i])),
+            late_finish=self.date(self._finish_minute(i, self.lf[i])),
+            total_float_hr_cnt=total / 60,
+            free_float_hr_cnt=free / 60,
+        )
@@ -0,0 +1,88 @@
+# xerparser
+# foreign_keys.py
+
+from typing import Sequence
+
+from xerparser.src.table import Table
+
+# Foreign key columns of the tables in a .xer file
+FOREIGN_KEYS: dict[str, tuple[str, ...]] = {
+    "ACTVCODE": ("actv_code_type_id", "parent_actv_code_id"),
+    "ACTVTYPE": ("proj_id",),
+    "CALENDAR": ("base_clndr_id", "proj_id"),
+    "PCATVAL": ("proj_catg_type_id", "parent_proj_catg_id"),
+    "PROJECT": ("clndr_id",),
+    "PROJPCAT": ("proj_id", "proj_catg_id"),
+    "PROJWBS": ("proj_id", "parent_wbs_id"),
+    "RSRC": ("clndr_id", "parent_rsrc_id"),
+    "RSRCRATE": ("rsrc_id",),
+    "SCHEDOPTIONS": ("proj_id",),
+    "TASK": ("proj_id", "wbs_id", "clndr_id"),
+    "TASKACTV": ("task_id", "actv_code_id", "proj_id"),
+    "TASKFIN": ("task_id", "fin_dates_id", "proj_id"),
+    "TASKMEMO": ("task_id", "memo_type_id", "proj_id"),
+    "TASKPRED": ("task_id", "pred_task_id", "proj_id", "pred_proj_id"),
+    "TASKRSRC": ("task_id", "rsrc_id", "acct_id", "proj_id"),
+    "TRSRCFIN": ("taskrsrc_id", "task_id", "fin_dates_id", "proj_id"),
+    "UDFVALUE": ("udf_type_id", "fk_id", "proj_id"),
+}
+
+
+class ForeignKeyIndex:
+    """
+    An index of the rows of each table grouped by the value of a key column,
+    such as `proj_id` or `task_id`.
+
+    Each (table, column) index is built with a single pass over the table the
+    first time it is used, and then reused. Any column can be indexed; the
+    known foreign key columns are listed in `FOREIGN_KEYS`.
+
+    `Xer` uses the index to link the objects that collect many rows of another
+    table, such as the calendars of a project. Rows referencing one parent,
+    such as activities or relationships, look up the parent directly instead.
+    """
+
+    def __init__(self, tables: dict[str, Sequence[dict[str, str]]]) -> None:
+        self._tables = tables
+        self._index: dict[tuple[str, str], dict[str, list[int]]] = {}
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._index
+
+    def positions(self, table: str, column: str) -> dict[str, list[int]]:
+        """
+        Positions of the rows in `table` for each value of `column`.
+        Returns an empty dictionary if the table is not loaded.
+        """
+        if (index := self._index.get((table, column))) is not None:
+            return index
+
+        index = {}
+        rows = self._tables.get(table, [])
+        values = (
+            rows.column(column)
+            if isinstance(rows, Table)
+            else (row[column] for row in rows)
+        )
+        for i, value in enumerate(values):
+            if (group := index.get(value)) is None:
+                index[value] = [i]
+            else:
+                group.append(i)
+
+        self._index[(table, column)] = index
+        return index
+
+    def rows(self, table: str, column: str, value: str) -> list[dict[str, str]]:
+        """
+        Rows in `table` where `column` is equal to `value`.
+
+        Example:
+            `xer.foreign_keys.rows("TASKPRED", "pred_task_id", task.uid)`
+        """
+        rows = self._tables[table] if table in self._tables else []
+        return [rows[i] for i in self.positions(table, column).get(value, [])]
+
+    def count(self, table: str, column: str, value: str) -> int:
+        """Number of rows in `table` where `column` is equal to `value`."""
+        return len(self.positions(table, column).get(value, []))
@@ -0,0 +1,141 @@
+# xerparser
+# index.py
+
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from xerparser.src.parser import CODEC
+
+_TABLE_RE = re.compile(rb"^%T\t([^\r\n]*)\r?\n([^\r\n]*)", re.M)
+_ROW_RE = re.compile(rb"^%R", re.M)
+
+
+@dataclass(frozen=True)
+class TableInfo:
+    """
+    Location of a table within a .xer file.
+
+    Attributes
+    ----------
+    name: str
+        Table name
+    columns: list[str]
+        Column labels
+    offset: int
+        Byte offset of the start of the table
+    length: int
+        Length of the table in bytes
+    row_count: int
+        Number of rows in the table
+    """
+
+    name: str
+    columns: list[str]
+    offset: int
+    length: int
+    row_count: int
+
+
+class XerIndex:
+    """
+    A byte offset index of the tables in a .xer file.
+
+    The file is memory-mapped and scanned once for the location of each table.
+    Tables are only decoded when they are read, so a few tables can be pulled
+    from a large file without reading the rest of it.
+    """
+
+    def __init__(self, file: str | Path) -> None:
+        self._file = open(file, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap cannot map an empty file
+            self._file.close()
+            raise ValueError("ValueError: invalid XER file")
+
+        if self._mm[:6] != b"ERMHDR":
+            self.close()
+            raise ValueError("ValueError: invalid XER file")
+
+        header_end = self._mm.find(b"\n")
+        self.header: list[str] = (
+            self._mm[: header_end if header_end >= 0 else len(self._mm)]
+            .decode(CODEC, errors="ignore")
+            .strip()
+            .split("\t")[1:]
+        )
+        """Export information (`ERMHDR`)"""
+        self._tables: dict[str, TableInfo] = self._scan()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tables
+
+    def __enter__(self) -> "XerIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getitem__(self, name: str) -> TableInfo:
+        return self._tables[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def close(self) -> None:
+        """Close the memory map and the underlying file."""
+        self._mm.close()
+        self._file.close()
+
+    def iter_rows(self, name: str) -> Iterator[list[str]]:
+        """Decode a table and yield its row values."""
+        table = self._tables[name]
+        text = self._mm[table.offset : table.offset + table.length].decode(
+            CODEC, errors="ignore"
+        )
+        for line in text.replace("\r\n", "\n").split("\n"):
+            if line.startswith("%R"):
+                yield line.split("\t")[1:]
+
+    def read_table(self, name: str) -> list[dict[str, str]]:
+        """Decode a table into a list of rows."""
+        cols = self._tables[name].columns
+        return [dict(zip(cols, row)) for row in self.iter_rows(name)]
+
+    def read_tables(self, names: Iterable[str] | None = None) -> dict[str, list]:
+        """
+        Decode tables into a Python dictionary object in the same
+        format returned by `parser`. Tables that are not in the file are
+        skipped. All tables are decoded if `names` is None.
+        """
+        names = self._tables.keys() if names is None else names
+        xer_data: dict[str, list] = {"ERMHDR": self.header}
+        xer_data.update(
+            {name: self.read_table(name) for name in names if name in self._tables}
+        )
+        return xer_data
+
+    def _scan(self) -> dict[str, TableInfo]:
+        """Record the location of each table in the file."""
+        matches = list(_TABLE_RE.finditer(self._mm))
+        tables: dict[str, TableInfo] = {}
+        for i, match in enumerate(matches):
+            start = match.start()
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(self._mm)
+            name = match.group(1).decode(CODEC, errors="ignore").strip()
+            cols = match.group(2).decode(CODEC, errors="ignore").strip().split("\t")
+            tables[name] = TableInfo(
+                name=name,
+                columns=cols[1:],
+                offset=start,
+                length=end - start,
+                row_count=sum(1 for _ in _ROW_RE.finditer(self._mm, start, end)),
+            )
+        return tables
@@ -0,0 +1,243 @@
+# xerparser
+# network.py
+
+# The relationships of a project stored as compressed sparse row (CSR) arrays.
+#
+# Activities are numbered by their position in `Network.tasks`, and each
+# relationship by its position in `Network.relationships`. The predecessors of
+# activity `i` are stored at positions `pred_offsets[i]` to `pred_offsets[i + 1]`
+# of the arrays `pred_tasks` (linked activity), `pred_types` (link type code),
+# `pred_lags` (lag in hours), and `pred_links` (position of the relationship).
+# Successors are stored the same way in the `succ_` arrays. Graph algorithms
+# can walk these flat arrays instead of the `LinkToTask` lists of each TASK.
+
+from array import array
+from typing import Iterable
+
+from xerparser.schemas._field import field_values
+from xerparser.schemas.task import TASK
+from xerparser.schemas.taskpred import TASKPRED
+
+# Relationship types, by the link code of `TASKPRED`
+FS, SS, FF, SF = 0, 1, 2, 3
+LINK_TYPES = {"FS": FS, "SS": SS, "FF": FF, "SF": SF}
+LINK_CODES = ("FS", "SS", "FF", "SF")
+
+
+class Network:
+    """
+    The logic network of a set of activities, as compressed sparse row arrays.
+
+    Activities are numbered by their position in `tasks`; `index` finds the
+    number of a TASK and `tasks[i]` the TASK of a number. Relationships to
+    activities that are not in `tasks` (e.g. in another project) are listed in
+    `external` and are not part of the arrays.
+
+    The network is not updated when the activities or relationships change.
+    """
+
+    def __init__(self, tasks: Iterable[TASK], relationships: Iterable[TASKPRED]):
+        self.tasks: list[TASK] = list(tasks)
+        """Activities of the network, by number"""
+        self._index = index = {id(task): i for i, task in enumerate(self.tasks)}
+
+        rels = list(relationships)
+        preds = [index.get(id(rel.predecessor)) for rel in rels]
+        succs = [index.get(id(rel.successor)) for rel in rels]
+        external = []
+        if None in preds or None in succs:
+            linked = [
+                k
+                for k, (pred, succ) in enumerate(zip(preds, succs))
+                if pred is not None and succ is not None
+            ]
+            external = [
+                rel
+                for rel, pred, succ in zip(rels, preds, succs)
+                if pred is None or succ is None
+            ]
+            rels = [rels[k] for k in linked]
+            preds = [preds[k] for k in linked]
+            succs = [succs[k] for k in linked]
+        self.relationships: list[TASKPRED] = rels
+        """Relationships between activities of the network, by number"""
+        self.external: list[TASKPRED] = external
+        """Relationships to activities outside of the network"""
+
+        codes = [rel.pred_type for rel in rels]
+        link_types = {code: LINK_TYPES[code[-2:]] for code in set(codes)}
+        types = [link_types[code] for code in codes]
+        lags = field_values(rels, "lag_hr_cnt")
+
+        n = len(self.tasks)
+        offsets, links = _group(succs, n)
+        self.pred_offsets = array("l", offsets)
+        self.pred_links = array("l", links)
+        self.pred_tasks = array("l", [preds[k] for k in links])
+        """Predecessor of each relationship, grouped by successor"""
+        self.pred_types = array("b", [types[k] for k in links])
+        self.pred_lags = array("d", [lags[k] for k in links])
+
+        offsets, links = _group(preds, n)
+        self.succ_offsets = array("l", offsets)
+        self.succ_links = array("l", links)
+        self.succ_tasks = array("l", [succs[k] for k in links])
+        """Successor of each relationship, grouped by predecessor"""
+        self.succ_types = array("b", [types[k] for k in links])
+        self.succ_lags = array("d", [lags[k] for k in links])
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __contains__(self, task: TASK) -> bool:
+        return id(task) in self._index
+
+    def index(self, task: TASK) -> int:
+        """Number of an activity of the network."""
+        if (i := self._index.get(id(task))) is None:
+            raise KeyError(task.task_code)
+        return i
+
+    def topological_order(self) -> list[int]:
+        """
+        Numbers of the activities ordered so each activity follows its
+        predecessors. Raises ValueError if the relationships have a loop.
+        """
+        offsets, succs = self.succ_offsets, self.succ_tasks
+        count = [0] * len(self.tasks)
+        for j in succs:
+            count[j] += 1
+
+        order = [i for i, c in enumerate(count) if c == 0]
+        for i in order:
+            for k in range(offsets[i], offsets[i + 1]):
+                j = succs[k]
+                count[j] -= 1
+                if count[j] == 0:
+                    order.append(j)
+
+        if len(order) < len(self.tasks):
+            raise ValueError(
+                f"{len(self.tasks) - len(order)} activities are in or after "
+                "a relationship loop (see `Network.loops`)"
+            )
+        return order
+
+    def strong_components(self) -> list[list[int]]:
+        """
+        Groups of activities that are in a relationship loop together (strongly
+        connected components), found with an iterative version of Tarjan's
+        algorithm. Activities that are not in a loop are not included.
+        """
+        offsets, succs = self.succ_offsets, self.succ_tasks
+        n = len(self.tasks)
+        number, low = [-1] * n, [0] * n
+        on_stack = [False] * n
+        next_link = list(offsets[:-1])
+        stack: list[int] = []
+        components = []
+        count = 0
+        for root in range(n):
+            if number[root] >= 0:
+                continue
+            number[root] = low[root] = count
+            count += 1
+            stack.append(root)
+            on_stack[root] = True
+            path = [root]
+            while path:
+                v = path[-1]
+                if (k := next_link[v]) < offsets[v + 1]:
+                    next_link[v] = k + 1
+                    w = succs[k]
+                    if number[w] < 0:
+                        number[w] = low[w] = count
+                        count += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        path.append(w)
+                    elif on_stack[w] and number[w] < low[v]:
+                        low[v] = number[w]
+                    continue
+
+                path.pop()
+                if path and low[v] < low[path[-1]]:
+                    low[path[-1]] = low[v]
+                if low[v] != number[v]:
+                    continue
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                if len(component) > 1 or v in self.successors(v):
+                    components.append(sorted(component))
+        return components
+
+    def loops(self) -> list[list[TASKPRED]]:
+        """
+        A relationship loop through each group of activities returned by
+        `strong_components`, as the relationships in the order they are
+        followed, from the activity of the group with the lowest number back
+        to itself. The shortest loop through that activity is reported; a group
+        can contain other loops, which remain once the reported loop is broken.
+        """
+        offsets, succs = self.succ_offsets, self.succ_tasks
+        loops = []
+        for component in self.strong_components():
+            members = set(component)
+            start = component[0]
+            # breadth first search from the start back to itself, keeping the
+            # activity and link each activity was reached by
+            reached_by: dict[int, tuple[int, int]] = {}
+            queue, end = [start], None
+            for v in queue:
+                for k in range(offsets[v], offsets[v + 1]):
+                    w = succs[k]
+                    if w == start:
+                        end = (v, k)
+                        break
+                    if w in members and w not in reached_by:
+                        reached_by[w] = (v, k)
+                        queue.append(w)
+                if end:
+                    break
+
+            v, k = end
+            links = [k]
+            while v != start:
+                v, k = reached_by[v]
+                links.append(k)
+            loops.append(
+                [self.relationships[self.succ_links[k]] for k in reversed(links)]
+            )
+        return loops
+
+    def predecessors(self, i: int) -> array:
+        """Numbers of the predecessors of activity `i`."""
+        return self.pred_tasks[self.pred_offsets[i] : self.pred_offsets[i + 1]]
+
+    def successors(self, i: int) -> array:
+        """Numbers of the successors of activity `i`."""
+        return self.succ_tasks[self.succ_offsets[i] : self.succ_offsets[i + 1]]
+
+
+def _group(keys: list[int], n: int) -> tuple[list[int], list[int]]:
+    """
+    Counting sort of positions by key: returns the offsets of each key, and the
+    positions with key `i` at `offsets[i]` to `offsets[i + 1]`, in their order.
+    """
+    offsets = [0] * (n + 1)
+    for key in keys:
+        offsets[key + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+
+    position = offsets[:-1]
+    positions = [0] * len(keys)
+    for k, key in enumerate(keys):
+        positions[position[key]] = k
+        position[key] += 1
+    return offsets, positions
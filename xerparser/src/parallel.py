@@ -0,0 +1,103 @@
+# xerparser
+# parallel.py
+
+from concurrent.futures import Executor, Future
+from typing import Any, Iterable, Iterator, Sequence
+
+from xerparser.schemas._field import load_fields, object_state
+from xerparser.src.registry import SCHEMAS
+
+CHUNK_ROWS = 5_000  # number of rows converted by a worker at a time
+
+# Tables converted in worker processes, and the related objects passed as
+# placeholders during conversion. Related objects are assigned by `Xer`.
+PARALLEL_TABLES: dict[str, dict[str, None]] = {
+    "TASK": {"calendar": None, "wbs": None},
+    "TASKMEMO": {"topic": None},
+    "TASKPRED": {"predecessor": None, "successor": None},
+    "TASKRSRC": {"account": None, "resource": None},
+}
+
+
+class ConvertedChunk:
+    """
+    Typed field values for a chunk of table rows.
+
+    Attributes
+    ----------
+    fields: list[str]
+        Attribute names
+    containers: list[tuple[str, type]]
+        Attributes initialized to an empty list or dictionary
+    values: list[tuple]
+        Attribute values for each row
+    """
+
+    def __init__(
+        self, fields: list[str], containers: list[tuple[str, type]], values: list
+    ) -> None:
+        self.fields = fields
+        self.containers = containers
+        self.values = values
+
+
+def submit_tables(
+    executor: Executor, tables: dict[str, Sequence[dict]]
+) -> dict[str, Iterator[ConvertedChunk]]:
+    """
+    Submit chunks of rows from the large tables to be converted by workers.
+    The converted chunks are returned in order, waiting on each worker as needed.
+    """
+    pending: dict[str, Iterator[ConvertedChunk]] = {}
+    for name in PARALLEL_TABLES:
+        if not (rows := tables.get(name)):
+            continue
+        futures = [
+            executor.submit(convert_rows, name, rows[i : i + CHUNK_ROWS])
+            for i in range(0, len(rows), CHUNK_ROWS)
+        ]
+        pending[name] = map(Future.result, futures)
+    return pending
+
+
+def convert_rows(name: str, rows: Sequence[dict]) -> ConvertedChunk:
+    """
+    Convert table rows to typed field values. Executed in a worker process
+    when converting in parallel.
+    """
+    cls, placeholders = SCHEMAS[name], PARALLEL_TABLES[name]
+    fields: list[str] = []
+    containers: list[tuple[str, type]] = []
+    values = []
+    for row in rows:
+        obj = cls(**placeholders, **row)
+        load_fields(obj)
+        state: dict[str, Any] = object_state(obj)
+        if not fields:
+            for key, value in state.items():
+                if isinstance(value, (list, dict)):
+                    containers.append((key, type(value)))
+                elif key not in placeholders:
+                    fields.append(key)
+        values.append(tuple(state[key] for key in fields))
+    return ConvertedChunk(fields, containers, values)
+
+
+def restore_objects(name: str, chunks: Iterable[ConvertedChunk]) -> list:
+    """
+    Create objects from converted typed field values.
+    Related objects are set to `None` and must be assigned.
+    """
+    cls, placeholders = SCHEMAS[name], PARALLEL_TABLES[name]
+    objects = []
+    for chunk in chunks:
+        for values in chunk.values:
+            obj = cls.__new__(cls)
+            for key, value in placeholders.items():
+                setattr(obj, key, value)
+            for key, value in zip(chunk.fields, values):
+                setattr(obj, key, value)
+            for key, factory in chunk.containers:
+                setattr(obj, key, factory())
+            objects.append(obj)
+    return objects
@@ -3,9 +3,18 @@
 
 import re
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Collection, Container, Iterable, Iterator
+
+from xerparser.src.errors import CorruptXerFile
+from xerparser.src.table import Table
+from xerparser.src.validation import Check, Validator
 
 CODEC = "cp1252"
+CHUNK_SIZE = 1 << 20  # number of bytes read from a file at a time when streaming
+
+# Project level rows of these tables can be referenced by rows of
+# other tables without a project id, so they are not filtered by project
+UNFILTERED_TABLES = {"ACTVTYPE", "CALENDAR"}
 
 
 def file_reader(file: str | Path | BinaryIO) -> str:
@@ -74,3 +83,200 @@ def _parse_table(table: str) -> dict[str, list[dict]]:
         dict(zip(cols, row.split("\t")[1:])) for row in lines if row.startswith("%R")
     ]
     return {name: data}
+
+
+def iter_tables(
+    file: str | Path | BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, list[str], Iterator[list[str]]]]:
+    """
+    Stream the tables of a P6 .xer file one at a time.
+
+    The file is read in chunks of `chunk_size` bytes, so the contents of the
+    file are never held in memory all at once. The export information is
+    yielded first as table `ERMHDR`, with no columns and a single row.
+
+    Rows of a table must be consumed before advancing to the next table;
+    any rows that were not consumed are skipped without being parsed.
+
+    Args:
+        file (str | Path | BinaryIO): .xer file
+        chunk_size (int, optional): Bytes to read at a time. Defaults to CHUNK_SIZE.
+
+    Yields:
+        tuple[str, list[str], Iterator[list[str]]]: table name, column labels,
+        and an iterator of the row values
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, "rb") as f:
+            yield from _iter_tables(_iter_lines(f, chunk_size))
+        return
+
+    # Binary file from requests, Flask, FastAPI, etc...
+    yield from _iter_tables(_iter_lines(file, chunk_size))
+
+
+def read_tables(
+    file: str | Path | BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+    tables: Container[str] | None = None,
+    exclude: Container[str] | None = None,
+    projects: Collection[str] | None = None,
+    columnar: bool = False,
+    checks: Iterable[Check] | None = None,
+) -> dict[str, list | Table]:
+    """
+    Reads a P6 .xer file table by table and converts it into a
+    Python dictionary object. Equivalent to `parser(file_reader(file))`
+    without holding the decoded file contents in memory.
+
+    Rows of tables that are not selected are skipped without being parsed.
+    The export information (`ERMHDR`) is always included.
+
+    If `projects` is passed, rows belonging to other projects are dropped
+    as they are parsed. Projects are matched on their code (`proj_short_name`)
+    or unique table id (`proj_id`). The PROJECT table is read to resolve the
+    project ids even if it is not selected.
+
+    If `columnar` is True, tables are stored as `Table` objects, which hold
+    the values of each column in a list rather than a dictionary for each row.
+
+    If `checks` are passed, they are run on the rows of each table as it is
+    read, and a `CorruptXerFile` exception is raised once the file is read
+    if any errors are found.
+
+    Args:
+        file (str | Path | BinaryIO): .xer file
+        chunk_size (int, optional): Bytes to read at a time. Defaults to CHUNK_SIZE.
+        tables (Container[str], optional): Tables to include. Defaults to all tables.
+        exclude (Container[str], optional): Tables to exclude. Defaults to None.
+        projects (Collection[str], optional): Projects to include. Defaults to all.
+        columnar (bool, optional): Store tables as `Table` objects. Defaults to False.
+        checks (Iterable[Check], optional): Checks to run. Defaults to None.
+
+    Returns:
+        dict: xer information and data tables
+    """
+    # project ids are resolved from project codes once the PROJECT table is read
+    proj_ids = None if projects is None else set(projects)
+    validator = None if checks is None else Validator(checks)
+    xer_data: dict[str, list] = {}
+    for name, cols, rows in iter_tables(file, chunk_size):
+        if name == "ERMHDR":
+            if validator is not None:
+                validator.read(name, cols, ())
+            xer_data[name] = next(rows)
+            continue
+        if (tables is not None and name not in tables) or (
+            exclude is not None and name in exclude
+        ):
+            if proj_ids is not None and name == "PROJECT":
+                # project ids are resolved even if the table is not returned
+                uid = cols.index("proj_id")
+                proj_ids = {row[uid] for row in _filter_projects(rows, cols, proj_ids)}
+            continue
+        if proj_ids is not None:
+            if name == "PROJECT":
+                rows = _filter_projects(rows, cols, proj_ids)
+            elif name not in UNFILTERED_TABLES:
+                rows = _filter_rows(rows, cols, proj_ids)
+        if validator is not None:
+            rows = validator.read(name, cols, rows)
+        xer_data[name] = _build_table(cols, rows, columnar)
+        if proj_ids is not None and name == "PROJECT":
+            proj_ids = {proj["proj_id"] for proj in xer_data[name]}
+
+    if validator is not None and (errors := validator.errors()):
+        raise CorruptXerFile(errors)
+    return xer_data
+
+
+def _build_table(
+    cols: list[str], rows: Iterable[list[str]], columnar: bool
+) -> list[dict] | Table:
+    """Store table rows as a list of dictionaries or as a `Table`"""
+    if columnar:
+        return Table(cols, rows)
+    return [dict(zip(cols, row)) for row in rows]
+
+
+def _filter_projects(
+    rows: Iterable[list[str]], cols: list[str], projects: set[str]
+) -> Iterator[list[str]]:
+    """Filter PROJECT rows on project code or project id"""
+    keys = [i for i, col in enumerate(cols) if col in ("proj_id", "proj_short_name")]
+    return (row for row in rows if any(row[i] in projects for i in keys))
+
+
+def _filter_rows(
+    rows: Iterable[list[str]], cols: list[str], proj_ids: set[str]
+) -> Iterable[list[str]]:
+    """
+    Filter rows on the project ids they are assigned to. Rows that are not
+    assigned to a project (e.g. resource UDF values) are kept.
+    """
+    keys = [i for i, col in enumerate(cols) if col in ("proj_id", "pred_proj_id")]
+    if not keys:
+        return rows
+    keep = proj_ids | {""}
+    return (row for row in rows if all(row[i] in keep for i in keys))
+
+
+def _iter_lines(file: BinaryIO, chunk_size: int) -> Iterator[str]:
+    """Read a binary file in chunks and yield decoded lines."""
+    remainder = b""
+    while chunk := file.read(chunk_size):
+        data = remainder + chunk
+        cut = data.rfind(b"\n") + 1
+        remainder = data[cut:]
+        if cut:
+            text = data[:cut].decode(CODEC, errors="ignore").replace("\r\n", "\n")
+            yield from text.split("\n")[:-1]
+    if remainder:
+        yield remainder.decode(CODEC, errors="ignore").rstrip("\r")
+
+
+def _iter_tables(
+    lines: Iterator[str],
+) -> Iterator[tuple[str, list[str], Iterator[list[str]]]]:
+    """Group lines of a .xer file into tables"""
+    header = next(lines, "")
+    if not header.startswith("ERMHDR"):
+        raise ValueError("ValueError: invalid XER file")
+
+    # The first row in the xer file includes file export information
+    yield "ERMHDR", [], iter([header.strip().split("\t")[1:]])
+
+    next_table: list[str] = []
+    line = next(lines, None)
+    while line is not None:
+        if not line.startswith("%T\t"):
+            line = next(lines, None)
+            continue
+
+        name = line[3:].strip()  # First line is the table name
+        # Second line is the column labels
+        cols = next(lines, "").strip().split("\t")[1:]
+        rows = _iter_rows(lines, next_table)
+        yield name, cols, rows
+
+        # skip any rows that were not consumed without parsing them
+        rows.close()
+        if not next_table:
+            for line in lines:
+                if line.startswith("%T\t"):
+                    next_table.append(line)
+                    break
+        line = next_table.pop() if next_table else None
+
+
+def _iter_rows(lines: Iterator[str], next_table: list[str]) -> Iterator[list[str]]:
+    """
+    Yield the row values of a table. The line starting the
+    next table is stored in `next_table`.
+    """
+    for line in lines:
+        if line.startswith("%R"):
+            yield line.split("\t")[1:]
+        elif line.startswith("%T\t"):
+            next_table.append(line)
+            return
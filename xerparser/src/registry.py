@@ -0,0 +1,70 @@
+# xerparser
+# registry.py
+
+from typing import Iterable, Sequence
+
+from xerparser.schemas.account import ACCOUNT
+from xerparser.schemas.actvcode import ACTVCODE
+from xerparser.schemas.actvtype import ACTVTYPE
+from xerparser.schemas.calendars import CALENDAR
+from xerparser.schemas.findates import FINDATES
+from xerparser.schemas.memotype import MEMOTYPE
+from xerparser.schemas.pcattype import PCATTYPE
+from xerparser.schemas.pcatval import PCATVAL
+from xerparser.schemas.project import PROJECT
+from xerparser.schemas.projwbs import PROJWBS
+from xerparser.schemas.rsrc import RSRC
+from xerparser.schemas.rsrcrate import RSRCRATE
+from xerparser.schemas.schedoptions import SCHEDOPTIONS
+from xerparser.schemas.task import TASK
+from xerparser.schemas.taskfin import TASKFIN
+from xerparser.schemas.taskmemo import TASKMEMO
+from xerparser.schemas.taskpred import TASKPRED
+from xerparser.schemas.taskrsrc import TASKRSRC
+from xerparser.schemas.trsrcfin import TRSRCFIN
+from xerparser.schemas.udftype import UDFTYPE
+from xerparser.src.table import Table
+
+# Schema class used to build the objects of each table
+SCHEMAS: dict[str, type] = {
+    "ACCOUNT": ACCOUNT,
+    "ACTVCODE": ACTVCODE,
+    "ACTVTYPE": ACTVTYPE,
+    "CALENDAR": CALENDAR,
+    "FINDATES": FINDATES,
+    "MEMOTYPE": MEMOTYPE,
+    "PCATTYPE": PCATTYPE,
+    "PCATVAL": PCATVAL,
+    "PROJECT": PROJECT,
+    "PROJWBS": PROJWBS,
+    "RSRC": RSRC,
+    "RSRCRATE": RSRCRATE,
+    "SCHEDOPTIONS": SCHEDOPTIONS,
+    "TASK": TASK,
+    "TASKFIN": TASKFIN,
+    "TASKMEMO": TASKMEMO,
+    "TASKPRED": TASKPRED,
+    "TASKRSRC": TASKRSRC,
+    "TRSRCFIN": TRSRCFIN,
+    "UDFTYPE": UDFTYPE,
+}
+
+
+def table_values(
+    table: Sequence[dict[str, str]],
+) -> tuple[tuple[str, ...], Iterable[Sequence[str]]]:
+    """
+    Get the column labels of a table and the values of each of its rows.
+    The columns of a list of row dictionaries are taken from the first row.
+    """
+    if isinstance(table, Table):
+        return tuple(table.columns), table.iter_values()
+    if not table:
+        return (), ()
+
+    columns = tuple(table[0])
+    width = len(columns)
+    return columns, (
+        tuple(row.values()) if len(row) == width else [row.get(c, "") for c in columns]
+        for row in table
+    )
@@ -0,0 +1,441 @@
+# xerparser
+# shared.py
+
+# The attributes of the objects of each shared table are stored as fixed-width
+# typed columns in a single shared memory block, so worker processes can read
+# them without receiving a pickled copy of the object graph. Missing values
+# are stored as NaN (numbers), NULL_DATE (dates), or -1 (codes and positions).
+#
+# Block layout:
+#     MAGIC                   8 bytes
+#     header length           unsigned 32 bit integer
+#     header                  JSON: tables, rows, and column kinds and buffers
+#     buffers                 column data, each aligned to 8 bytes
+
+import json
+import math
+import struct
+from array import array
+from datetime import datetime
+from enum import Enum
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from xerparser.schemas._field import object_state, row_fields
+from xerparser.src.registry import SCHEMAS
+from xerparser.src.snapshot import _MICROSECOND, EPOCH, _class_path, _import
+
+if TYPE_CHECKING:
+    from xerparser.src.xer import Xer
+
+MAGIC = b"XERSHM\x00\x00"
+NULL_DATE = -(2**63)  # stored in date columns for missing dates
+
+_PREFIX = struct.Struct("<8sI")
+
+# Objects of each table that can be shared, in the order of their rows
+SHARED_TABLES: dict[str, Callable[["Xer"], Iterable]] = {
+    "CALENDAR": lambda xer: xer.calendars.values(),
+    "PROJECT": lambda xer: xer.projects.values(),
+    "PROJWBS": lambda xer: xer.wbs_nodes.values(),
+    "RSRC": lambda xer: xer.resources.values(),
+    "TASK": lambda xer: xer.tasks.values(),
+    "TASKPRED": lambda xer: xer.relationships.values(),
+    "TASKRSRC": lambda xer: (
+        rsrc for proj in xer.projects.values() for rsrc in proj.resources
+    ),
+}
+
+# Type codes of the arrays stored for each kind of column
+TYPECODES = {
+    "bool": "b",
+    "int": "q",
+    "float": "d",
+    "datetime": "q",
+    "str": "i",
+    "enum": "i",
+    "ref": "i",
+}
+
+
+class SharedXer:
+    """
+    Typed columns of the objects of an `Xer`, exported to shared memory for
+    worker processes. Pass `name` to the workers and read the columns with
+    `SharedXerView`.
+
+    Each table in `tables` has a column for each attribute of its objects
+    that is a number, date, string, or enum, and for each reference to an
+    object of another shared table (e.g. `TASK.wbs`), stored as the position
+    of its row. Lists and dictionaries of related objects are not shared.
+
+    The block is freed when the `SharedXer` is used as a context manager,
+    or when `unlink` is called.
+    """
+
+    def __init__(self, xer: "Xer", tables: Iterable[str] | None = None) -> None:
+        """
+        Args:
+            xer (Xer): Objects to share
+            tables (Iterable[str], optional): Tables to share; defaults to
+                all of the `SHARED_TABLES`.
+        """
+        names = list(SHARED_TABLES if tables is None else tables)
+        if unknown := [name for name in names if name not in SHARED_TABLES]:
+            raise ValueError(f"Tables cannot be shared: {', '.join(unknown)}")
+
+        objects = {name: list(SHARED_TABLES[name](xer)) for name in names}
+        positions = {
+            SCHEMAS[name]: {id(obj): i for i, obj in enumerate(rows)}
+            for name, rows in objects.items()
+        }
+        writer = _Writer()
+        header = {
+            "tables": {
+                name: {
+                    "rows": len(rows),
+                    "columns": {
+                        column: spec
+                        for column, values in _object_columns(rows).items()
+                        if (spec := writer.column(values, positions)) is not None
+                    },
+                }
+                for name, rows in objects.items()
+            }
+        }
+
+        header_bytes = json.dumps(header, separators=(",", ":")).encode()
+        start = _align(_PREFIX.size + len(header_bytes))
+        self.shm = SharedMemory(create=True, size=max(start + writer.size, 1))
+        """Shared memory block"""
+        buf = self.shm.buf
+        _PREFIX.pack_into(buf, 0, MAGIC, len(header_bytes))
+        buf[_PREFIX.size : _PREFIX.size + len(header_bytes)] = header_bytes
+        for offset, data in writer.buffers:
+            buf[start + offset : start + offset + len(data)] = data
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block, passed to `SharedXerView`"""
+        return self.shm.name
+
+    @property
+    def size(self) -> int:
+        """Size of the shared memory block in bytes"""
+        return self.shm.size
+
+    def close(self) -> None:
+        """Close access to the block from this process."""
+        self.shm.close()
+
+    def unlink(self) -> None:
+        """Free the block once all views of it are closed."""
+        self.shm.unlink()
+
+    def __enter__(self) -> "SharedXer":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+        self.unlink()
+
+
+class SharedTable:
+    """
+    Read-only view of the columns of a table in a `SharedXerView`.
+
+    `array` returns the stored values of a column without copying them:
+    numbers, dates as microseconds since 1970, codes of strings and enums,
+    and row positions of references. `column` returns the values converted
+    to Python objects. Lookups are built the first time they are used.
+    """
+
+    def __init__(self, view: "SharedXerView", name: str, spec: dict) -> None:
+        self.name = name
+        """Table name"""
+        self.columns: list[str] = list(spec["columns"])
+        """Column labels (attribute names)"""
+        self._view = view
+        self._len: int = spec["rows"]
+        self._specs: dict[str, dict] = spec["columns"]
+        self._values: dict[str, list] = {}
+        self._positions: dict[str, dict[Any, list[int]]] = {}
+        self._labels: dict[str, list] = {}
+        self._rows: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return (
+            f"<SharedTable {self.name} {self._len} rows x {len(self.columns)} columns>"
+        )
+
+    def kind(self, column: str) -> str:
+        """Kind of values stored in a column; see `TYPECODES`."""
+        return self._specs[column]["kind"]
+
+    def array(self, column: str) -> memoryview:
+        """
+        Stored values of a column, as a read-only view of the shared memory.
+        Columns with no values other than `None` have no array.
+        """
+        spec = self._specs[column]
+        if spec["kind"] == "none":
+            raise ValueError(f"Column {column} has no values")
+        return self._view._array(spec["data"], TYPECODES[spec["kind"]])
+
+    def column(self, column: str) -> list:
+        """
+        Values of a column, converted to Python objects. References are
+        returned as the positions of the rows in the referenced table.
+        """
+        if (values := self._values.get(column)) is not None:
+            return values
+
+        spec = self._specs[column]
+        kind = spec["kind"]
+        if kind == "none":
+            values = [None] * self._len
+        elif kind == "bool":
+            values = [None if v < 0 else v == 1 for v in self.array(column)]
+        elif kind == "int":
+            values = self.array(column).tolist()
+        elif kind == "float":
+            values = [None if math.isnan(v) else v for v in self.array(column)]
+        elif kind == "datetime":
+            dates: dict[int, datetime] = {}
+            values = [
+                (
+                    None
+                    if micros == NULL_DATE
+                    else dates.get(micros)
+                    or dates.setdefault(micros, EPOCH + micros * _MICROSECOND)
+                )
+                for micros in self.array(column)
+            ]
+        elif kind == "ref":
+            values = [None if i < 0 else i for i in self.array(column)]
+        else:
+            labels = self.labels(column)
+            values = [None if code < 0 else labels[code] for code in self.array(column)]
+
+        self._values[column] = values
+        return values
+
+    def labels(self, column: str) -> list:
+        """Distinct strings or enum members of a column, in the order of their codes."""
+        if (labels := self._labels.get(column)) is not None:
+            return labels
+
+        spec = self._specs[column]
+        if spec["kind"] == "enum":
+            enum = _import(spec["class"])
+            labels = [enum[name] for name in spec["members"]]
+        elif spec["kind"] == "str":
+            data = self._view._bytes(spec["strings"])
+            labels, start = [], 0
+            for length in self._view._array(spec["lengths"], "q"):
+                labels.append(data[start : start + length].decode())
+                start += length
+        else:
+            raise ValueError(f"Column {column} has no labels")
+        self._labels[column] = labels
+        return labels
+
+    def ref_table(self, column: str) -> str:
+        """Name of the table referenced by a column of references."""
+        return self._specs[column]["table"]
+
+    def position(self, uid: str) -> int:
+        """
+        Position of the row with a unique id.
+
+        Raises:
+            KeyError: No row has the unique id.
+        """
+        if self._rows is None:
+            self._rows = {uid: i for i, uid in enumerate(self.column("uid"))}
+        return self._rows[uid]
+
+    def positions(self, column: str) -> dict[Any, list[int]]:
+        """Positions of the rows for each value of a column."""
+        if (index := self._positions.get(column)) is not None:
+            return index
+
+        index = {}
+        for i, value in enumerate(self.column(column)):
+            if (group := index.get(value)) is None:
+                index[value] = [i]
+            else:
+                group.append(i)
+        self._positions[column] = index
+        return index
+
+
+class SharedXerView:
+    """
+    Read-only view of the tables exported by `SharedXer`,
+    for use in worker processes.
+
+    Example:
+        ```python
+        def total_float(name: str) -> float:
+            with SharedXerView(name) as view:
+                values = view.tables["TASK"].column("total_float_hr_cnt")
+                return sum(value for value in values if value)
+
+        with xer.share(["TASK"]) as shared, ProcessPoolExecutor() as executor:
+            result = executor.submit(total_float, shared.name).result()
+        ```
+    """
+
+    def __init__(self, name: str) -> None:
+        self.shm = SharedMemory(name=name)
+        """Shared memory block"""
+        self._views: dict[tuple[int, str], memoryview] = {}
+        buf = self.shm.buf
+        magic, header_size = _PREFIX.unpack_from(buf)
+        if magic != MAGIC:
+            self.shm.close()
+            raise ValueError(f"Shared memory block {name} was not created by SharedXer")
+        header = json.loads(bytes(buf[_PREFIX.size : _PREFIX.size + header_size]))
+        self._start = _align(_PREFIX.size + header_size)
+        self.tables: dict[str, SharedTable] = {
+            table: SharedTable(self, table, spec)
+            for table, spec in header["tables"].items()
+        }
+        """Shared tables"""
+
+    def _bytes(self, location: list[int]) -> bytes:
+        offset, size = location
+        return bytes(self.shm.buf[self._start + offset : self._start + offset + size])
+
+    def _array(self, location: list[int], typecode: str) -> memoryview:
+        if (view := self._views.get((offset := location[0], typecode))) is None:
+            start = self._start + offset
+            view = self.shm.buf[start : start + location[1]].toreadonly()
+            view = self._views[(offset, typecode)] = view.cast(typecode)
+        return view
+
+    def close(self) -> None:
+        """
+        Close access to the block. Arrays returned by `SharedTable.array`
+        can no longer be used; converted columns are kept.
+        """
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self.shm.close()
+
+    def __enter__(self) -> "SharedXerView":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _object_columns(objects: list) -> dict[str, list]:
+    """Values of the public attributes of the objects, including their row fields."""
+    names: dict[str, None] = {}
+    for cls in dict.fromkeys(type(obj) for obj in objects):
+        names.update(dict.fromkeys(row_fields(cls)))
+    for obj in objects:
+        names.update(
+            dict.fromkeys(name for name in object_state(obj) if name[0] != "_")
+        )
+    return {name: [getattr(obj, name, None) for obj in objects] for name in names}
+
+
+def _kind(values: list, positions: dict[type, dict[int, int]]) -> str | None:
+    """Kind of column for the values, or `None` if they cannot be shared."""
+    types = {type(value) for value in values if value is not None}
+    if not types:
+        return "none"
+    if len(types) == 2 and types == {int, float}:
+        return "float"
+    if len(types) > 1:
+        return None
+    cls = types.pop()
+    if cls is bool:
+        return "bool"
+    if cls is int:
+        return "float" if None in values else "int"
+    if cls is float:
+        return "float"
+    if cls is datetime:
+        return "datetime"
+    if cls is str:
+        return "str"
+    if issubclass(cls, Enum):
+        return "enum"
+    if cls in positions:
+        return "ref"
+    return None
+
+
+class _Writer:
+    """Encode columns of values to buffers aligned to 8 bytes."""
+
+    def __init__(self) -> None:
+        self.buffers: list[tuple[int, bytes]] = []
+        self.size = 0
+
+    def _buffer(self, data: bytes) -> list[int]:
+        location = [self.size, len(data)]
+        self.buffers.append((self.size, data))
+        self.size = _align(self.size + len(data))
+        return location
+
+    def column(
+        self, values: list, positions: dict[type, dict[int, int]]
+    ) -> dict | None:
+        kind = _kind(values, positions)
+        if kind is None:
+            return None
+        if kind == "none":
+            return {"kind": kind}
+
+        typecode = TYPECODES[kind]
+        spec: dict[str, Any] = {"kind": kind}
+        if kind == "bool":
+            data = [-1 if value is None else int(value) for value in values]
+        elif kind == "int":
+            data = values
+        elif kind == "float":
+            data = [math.nan if value is None else value for value in values]
+        elif kind == "datetime":
+            data = [
+                NULL_DATE if value is None else (value - EPOCH) // _MICROSECOND
+                for value in values
+            ]
+        elif kind == "ref":
+            cls = type(next(value for value in values if value is not None))
+            rows = positions[cls]
+            spec["table"] = next(
+                name for name, schema in SCHEMAS.items() if schema is cls
+            )
+            data = [
+                -1 if value is None else rows.get(id(value), -1) for value in values
+            ]
+        else:
+            labels: dict[Any, int] = {}
+            data = [
+                -1 if value is None else labels.setdefault(value, len(labels))
+                for value in values
+            ]
+            if kind == "enum":
+                cls = type(next(iter(labels)))
+                spec["class"] = _class_path(cls)
+                spec["members"] = [member.name for member in labels]
+            else:
+                encoded = [label.encode() for label in labels]
+                spec["strings"] = self._buffer(b"".join(encoded))
+                spec["lengths"] = self._buffer(array("q", map(len, encoded)).tobytes())
+
+        spec["data"] = self._buffer(array(typecode, data).tobytes())
+        return spec
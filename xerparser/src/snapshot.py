@@ -0,0 +1,461 @@
+# xerparser
+# snapshot.py
+
+# A snapshot stores the objects of each schema class as typed columns, one
+# column per attribute. References to other objects are stored as integer ids,
+# so the cycles in the graph (e.g. TASK <-> PROJWBS <-> PROJECT) are never
+# followed when saving or loading.
+#
+# File layout:
+#     MAGIC                   8 bytes
+#     SNAPSHOT_VERSION        unsigned 16 bit integer
+#     header length           unsigned 32 bit integer
+#     header                  JSON: classes, columns, raw tables, and buffer sizes
+#     buffers                 column data (arrays of ints, floats, and strings)
+#
+# Column encodings (`kind` in the header):
+#     none, missing           no data (missing attributes are not assigned)
+#     bool, int, float        array of 8 bit, 64 bit, or floating point values
+#     datetime                array of microseconds since 1970-01-01
+#     str                     distinct strings and an array of codes
+#     enum                    enum class, member names, and an array of codes
+#     ref                     array of object ids
+#     list, tuple             array of lengths and a column of the items
+#     dict                    array of lengths and columns of the keys and values
+#     mixed                   array of tags and a column for each tag
+
+import json
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+from enum import Enum
+from functools import cache, cached_property
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from xerparser.schemas._field import RowField, SlotCache, object_state, row_fields
+from xerparser.src.foreign_keys import ForeignKeyIndex
+from xerparser.src.registry import table_values
+from xerparser.src.table import Table
+
+if TYPE_CHECKING:
+    from xerparser.src.xer import Xer
+
+MAGIC = b"XERSNAP\x00"
+SNAPSHOT_VERSION = 1  # increment when the layout of a snapshot changes
+EPOCH = datetime(1970, 1, 1)
+
+_PREFIX = struct.Struct("<8sHI")
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class _Missing:
+    """Placeholder for an attribute that is not set on an object."""
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+MISSING = _Missing()
+
+
+def save_snapshot(xer: "Xer", path: str | Path) -> None:
+    """
+    Save the objects of an `Xer` and its raw tables to a snapshot file.
+    Objects that were not built yet (see `Xer.reader(lazy=True)`) are built first.
+    """
+    from xerparser import __version__
+    from xerparser.src.xer import COLLECTIONS
+
+    xer.materialize()
+    root = {name: getattr(xer, name) for name in COLLECTIONS}
+    classes = _collect_objects(root.values())
+
+    ids = (id(obj) for objects in classes.values() for obj, _ in objects)
+    encoder = _Encoder({obj: i for i, obj in enumerate(ids)})
+    header = {
+        "xerparser": __version__,
+        "byteorder": sys.byteorder,
+        "classes": [
+            {
+                "class": _class_path(cls),
+                "count": len(objects),
+                "columns": {
+                    name: encoder.column(values)
+                    for name, values in _object_columns(objects).items()
+                },
+            }
+            for cls, objects in classes.items()
+        ],
+        "root": {name: encoder.column([value]) for name, value in root.items()},
+        "released_tables": xer.released_tables,
+        "tables": [
+            _encode_table(encoder, name, table) for name, table in xer.tables.items()
+        ],
+        "buffers": [len(buffer) for buffer in encoder.buffers],
+    }
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode()
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, SNAPSHOT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for buffer in encoder.buffers:
+            f.write(buffer)
+
+
+def load_snapshot(path: str | Path) -> "Xer":
+    """
+    Load an `Xer` from a snapshot file created by `save_snapshot`.
+
+    Raises:
+        ValueError: The file is not a snapshot, or was saved with a different
+        snapshot format or version of xerparser.
+    """
+    from xerparser import __version__
+    from xerparser.src.xer import Xer
+
+    with open(path, "rb") as f:
+        data = memoryview(f.read())
+
+    if len(data) < _PREFIX.size:
+        raise ValueError("Invalid snapshot file")
+    magic, version, header_size = _PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Invalid snapshot file")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Snapshot format {version} is not supported; expected {SNAPSHOT_VERSION}"
+        )
+    start = _PREFIX.size + header_size
+    header = json.loads(bytes(data[_PREFIX.size : start]))
+    if header["xerparser"] != __version__:
+        raise ValueError(
+            f"Snapshot was saved with xerparser {header['xerparser']}; "
+            f"reading with {__version__}"
+        )
+
+    buffers = []
+    for size in header["buffers"]:
+        buffers.append(data[start : start + size])
+        start += size
+
+    # create the objects of each class before assigning any references
+    classes = [(_import(spec["class"]), spec) for spec in header["classes"]]
+    objects = [cls.__new__(cls) for cls, spec in classes for _ in range(spec["count"])]
+    decoder = _Decoder(buffers, objects, header["byteorder"] != sys.byteorder)
+
+    # scalars and references are assigned first, since the hash
+    # of objects used as dictionary keys can depend on them
+    offsets, offset = [], 0
+    for _, spec in classes:
+        offsets.append(offset)
+        offset += spec["count"]
+    for containers in (False, True):
+        for (cls, spec), offset in zip(classes, offsets):
+            group = objects[offset : offset + spec["count"]]
+            for name, column in spec["columns"].items():
+                if (
+                    column["kind"] != "missing"
+                    and _has_containers(column) == containers
+                ):
+                    _assign(group, name, decoder.column(column, len(group)))
+
+    xer = Xer.__new__(Xer)
+    for name, column in header["root"].items():
+        xer.__dict__[name] = decoder.column(column, 1)[0]
+    xer.tables = {
+        table["name"]: _decode_table(decoder, table) for table in header["tables"]
+    }
+    xer.released_tables = header["released_tables"]
+    xer.foreign_keys = ForeignKeyIndex(xer.tables)
+    xer._source = None
+    xer._converted = {}
+    xer._building = []
+    xer._lazy = False
+    return xer
+
+
+def _assign(objects: list, name: str, values: list) -> None:
+    if not any(value is MISSING for value in values):
+        for obj, value in zip(objects, values):
+            setattr(obj, name, value)
+        return
+    for obj, value in zip(objects, values):
+        if value is not MISSING:
+            setattr(obj, name, value)
+
+
+def _has_containers(column: dict) -> bool:
+    if column["kind"] == "mixed":
+        return any(_has_containers(part) for part in column["parts"])
+    return column["kind"] in ("list", "tuple", "dict")
+
+
+@cache
+def _cache_names(cls: type) -> frozenset[str]:
+    """Attributes of a class that cache a computed value and are not saved."""
+    names = {"_row", "_fill"}
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if isinstance(attr, cached_property):
+                names.add(name)
+            elif isinstance(attr, SlotCache) and not isinstance(attr, RowField):
+                names.add(f"_{name}")
+    return frozenset(names)
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import(path: str) -> Any:
+    """Import a class of the xerparser package from its path."""
+    module, _, qualname = path.partition(":")
+    if module.split(".")[0] != "xerparser":
+        raise ValueError(f"Snapshot references a class outside of xerparser: {path}")
+    obj: Any = import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+@cache
+def _is_object(cls: type) -> bool:
+    """Schema objects are stored in the object columns and referenced by id."""
+    return cls.__module__.startswith("xerparser.schemas") and not issubclass(cls, Enum)
+
+
+def _collect_objects(roots: Iterable) -> dict[type, list[tuple[Any, dict]]]:
+    """Find all objects reachable from the roots and their state, grouped by class."""
+    classes: dict[type, list[tuple[Any, dict]]] = {}
+    seen: set[int] = set()
+    stack = list(roots)
+    while stack:
+        value = stack.pop()
+        cls = type(value)
+        if cls is list or cls is tuple:
+            stack.extend(value)
+        elif cls is dict:
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif _is_object(cls) and id(value) not in seen:
+            seen.add(id(value))
+            state = _state(value)
+            classes.setdefault(cls, []).append((value, state))
+            stack.extend(state.values())
+    return classes
+
+
+def _state(obj: Any) -> dict[str, Any]:
+    """Saved attributes of an object, with all of its row fields converted."""
+    cls = type(obj)
+    for name in row_fields(cls):
+        getattr(obj, name)
+    skip = _cache_names(cls)
+    return {
+        name: value for name, value in object_state(obj).items() if name not in skip
+    }
+
+
+def _object_columns(objects: list[tuple[Any, dict]]) -> dict[str, list]:
+    states = [state for _, state in objects]
+    names = dict.fromkeys(name for state in states for name in state)
+    return {name: [state.get(name, MISSING) for state in states] for name in names}
+
+
+def _encode_table(encoder: "_Encoder", name: str, table: Any) -> dict:
+    if name == "ERMHDR":
+        return {"name": name, "header": list(table)}
+    columns, rows = table_values(table)
+    values = list(zip(*rows)) or [() for _ in columns]
+    return {
+        "name": name,
+        "columnar": isinstance(table, Table),
+        "columns": list(columns),
+        "rows": len(table),
+        "data": [encoder.column(list(column)) for column in values],
+    }
+
+
+def _decode_table(decoder: "_Decoder", table: dict) -> Any:
+    if "header" in table:
+        return table["header"]
+    data = [decoder.column(column, table["rows"]) for column in table["data"]]
+    if table["columnar"]:
+        return Table(table["columns"], (list(row) for row in zip(*data)))
+    return [dict(zip(table["columns"], row)) for row in zip(*data)]
+
+
+class _Encoder:
+    """Encode columns of values to typed buffers."""
+
+    def __init__(self, ids: dict[int, int]) -> None:
+        self.ids = ids
+        self.buffers: list[bytes] = []
+
+    def _buffer(self, data: bytes) -> int:
+        self.buffers.append(data)
+        return len(self.buffers) - 1
+
+    def _kind(self, value: Any) -> str:
+        if value is MISSING:
+            return "missing"
+        if value is None:
+            return "none"
+        cls = type(value)
+        if cls is bool:
+            return "bool"
+        if cls is int:
+            return "int"
+        if cls is float:
+            return "float"
+        if cls is str:
+            return "str"
+        if cls is datetime:
+            return "datetime"
+        if isinstance(value, Enum):
+            return f"enum:{_class_path(cls)}"
+        if cls in (list, tuple, dict):
+            return cls.__name__
+        if id(value) in self.ids:
+            return "ref"
+        raise TypeError(f"Cannot save value of type {cls.__name__} in a snapshot")
+
+    def column(self, values: list) -> dict:
+        kinds = [self._kind(value) for value in values]
+        distinct = dict.fromkeys(kinds)
+        if len(distinct) > 1:
+            tags = {kind: i for i, kind in enumerate(distinct)}
+            return {
+                "kind": "mixed",
+                "tags": self._buffer(array("b", [tags[k] for k in kinds]).tobytes()),
+                "parts": [
+                    self.column([v for v, k in zip(values, kinds) if k == kind])
+                    for kind in distinct
+                ],
+            }
+
+        kind = next(iter(distinct), "none")
+        if kind in ("none", "missing"):
+            return {"kind": kind}
+        if kind == "bool":
+            return {"kind": kind, "data": self._buffer(bytes(values))}
+        if kind == "int":
+            return {"kind": kind, "data": self._buffer(array("q", values).tobytes())}
+        if kind == "float":
+            return {"kind": kind, "data": self._buffer(array("d", values).tobytes())}
+        if kind == "datetime":
+            micros = [(value - EPOCH) // _MICROSECOND for value in values]
+            return {"kind": kind, "data": self._buffer(array("q", micros).tobytes())}
+        if kind == "str":
+            strings: dict[str, int] = {}
+            codes = array("i", [strings.setdefault(v, len(strings)) for v in values])
+            encoded = [string.encode() for string in strings]
+            return {
+                "kind": kind,
+                "strings": self._buffer(b"".join(encoded)),
+                "lengths": self._buffer(array("q", map(len, encoded)).tobytes()),
+                "codes": self._buffer(codes.tobytes()),
+            }
+        if kind.startswith("enum:"):
+            members: dict[str, int] = {}
+            codes = array(
+                "i", [members.setdefault(v.name, len(members)) for v in values]
+            )
+            return {
+                "kind": "enum",
+                "class": kind[5:],
+                "members": list(members),
+                "codes": self._buffer(codes.tobytes()),
+            }
+        if kind == "ref":
+            refs = array("q", [self.ids[id(value)] for value in values])
+            return {"kind": kind, "data": self._buffer(refs.tobytes())}
+
+        lengths = array("q", map(len, values))
+        if kind == "dict":
+            return {
+                "kind": kind,
+                "lengths": self._buffer(lengths.tobytes()),
+                "keys": self.column([k for value in values for k in value.keys()]),
+                "values": self.column([v for value in values for v in value.values()]),
+            }
+        return {
+            "kind": kind,
+            "lengths": self._buffer(lengths.tobytes()),
+            "items": self.column([item for value in values for item in value]),
+        }
+
+
+class _Decoder:
+    """Decode columns of values from typed buffers."""
+
+    def __init__(self, buffers: list[memoryview], objects: list, swap: bool) -> None:
+        self.buffers = buffers
+        self.objects = objects
+        self.swap = swap
+
+    def _array(self, typecode: str, index: int) -> array:
+        values = array(typecode)
+        values.frombytes(self.buffers[index])
+        if self.swap:
+            values.byteswap()
+        return values
+
+    def column(self, spec: dict, count: int) -> list:
+        kind = spec["kind"]
+        if kind == "none":
+            return [None] * count
+        if kind == "missing":
+            return [MISSING] * count
+        if kind == "bool":
+            return [value == 1 for value in bytes(self.buffers[spec["data"]])]
+        if kind == "int":
+            return self._array("q", spec["data"]).tolist()
+        if kind == "float":
+            return self._array("d", spec["data"]).tolist()
+        if kind == "datetime":
+            dates: dict[int, datetime] = {}
+            return [
+                dates.get(micros)
+                or dates.setdefault(micros, EPOCH + micros * _MICROSECOND)
+                for micros in self._array("q", spec["data"])
+            ]
+        if kind == "str":
+            data = bytes(self.buffers[spec["strings"]])
+            strings, start = [], 0
+            for length in self._array("q", spec["lengths"]):
+                strings.append(data[start : start + length].decode())
+                start += length
+            return [strings[code] for code in self._array("i", spec["codes"])]
+        if kind == "enum":
+            enum = _import(spec["class"])
+            members = [enum[name] for name in spec["members"]]
+            return [members[code] for code in self._array("i", spec["codes"])]
+        if kind == "ref":
+            return list(map(self.objects.__getitem__, self._array("q", spec["data"])))
+        if kind == "mixed":
+            tags = bytes(self.buffers[spec["tags"]])
+            parts = [
+                iter(self.column(part, tags.count(tag)))
+                for tag, part in enumerate(spec["parts"])
+            ]
+            return [next(parts[tag]) for tag in tags]
+
+        lengths = self._array("q", spec["lengths"])
+        total = sum(lengths)
+        if kind == "dict":
+            keys = iter(self.column(spec["keys"], total))
+            values = iter(self.column(spec["values"], total))
+            return [
+                {next(keys): next(values) for _ in range(length)} for length in lengths
+            ]
+        items = self.column(spec["items"], total)
+        container = tuple if kind == "tuple" else list
+        result, start = [], 0
+        for length in lengths:
+            result.append(container(items[start : start + length]))
+            start += length
+        return result
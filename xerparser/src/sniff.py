@@ -0,0 +1,135 @@
+# xerparser
+# sniff.py
+
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from xerparser.schemas.ermhdr import ERMHDR
+from xerparser.src.errors import CorruptXerFile
+from xerparser.src.parser import CHUNK_SIZE, iter_tables
+from xerparser.src.validators import optional_date, parse_date
+
+# Tables are exported in the order of their dependencies, so the
+# project tables have all been read once one of these tables is reached.
+STOP_TABLES = {"TASK", "TASKPRED", "TASKRSRC", "TASKACTV", "UDFVALUE"}
+
+
+@dataclass(frozen=True)
+class ProjectSummary:
+    """
+    Summary of a project in a .xer file.
+
+    Attributes
+    ----------
+    uid: str
+        Unique Table ID
+    short_name: str
+        Project Code
+    name: str
+        Project Name (name of the project level WBS node)
+    data_date: datetime
+        Date Project is Updated To
+    plan_start_date: datetime
+        Planned Start Date Assigned to Project
+    finish_date: datetime
+        Projected Completion Date
+    last_schedule_date: datetime | None
+        Last Date Schedule was Calculated
+    export_flag: bool
+        Project Export Flag
+    """
+
+    uid: str
+    short_name: str
+    name: str
+    data_date: datetime
+    plan_start_date: datetime
+    finish_date: datetime
+    last_schedule_date: datetime | None
+    export_flag: bool
+
+    def __str__(self) -> str:
+        return f"{self.short_name} - {self.name}"
+
+
+@dataclass(frozen=True)
+class XerSummary:
+    """
+    Summary of a .xer file returned by `sniff`.
+
+    Attributes
+    ----------
+    export_info: ERMHDR
+        Export information (P6 version, export date, user, and currency)
+    projects: list[ProjectSummary]
+        Projects in the file
+    """
+
+    export_info: ERMHDR
+    projects: list[ProjectSummary] = field(default_factory=list)
+
+
+def sniff(file: str | Path | BinaryIO, chunk_size: int = CHUNK_SIZE) -> XerSummary:
+    """
+    Read the export information and the projects of a .xer file without
+    reading the rest of it.
+
+    Only the `ERMHDR`, `PROJECT`, and project level `PROJWBS` rows are
+    parsed. Reading stops as soon as these tables have been read, so only
+    the start of the file is read from disk.
+
+    Args:
+        file (str | Path | BinaryIO): .xer file
+        chunk_size (int, optional): Bytes to read at a time. Defaults to CHUNK_SIZE.
+
+    Raises:
+        CorruptXerFile: The file has no `PROJECT` table.
+
+    Returns:
+        XerSummary: export information and project summaries
+    """
+    header: list[str] = []
+    projects: list[dict[str, str]] | None = None
+    names: dict[str, str] | None = None
+    with closing(iter_tables(file, chunk_size)) as tables:
+        for name, cols, rows in tables:
+            if name == "ERMHDR":
+                header = next(rows)
+            elif name == "PROJECT":
+                projects = [dict(zip(cols, row)) for row in rows]
+            elif name == "PROJWBS":
+                proj_id, wbs_name, flag = (
+                    cols.index(col) for col in ("proj_id", "wbs_name", "proj_node_flag")
+                )
+                names = {
+                    row[proj_id]: row[wbs_name] for row in rows if row[flag] == "Y"
+                }
+
+            if name in STOP_TABLES or (projects is not None and names is not None):
+                break
+
+    if projects is None:
+        raise CorruptXerFile(["Missing Required Table PROJECT"])
+
+    return XerSummary(
+        ERMHDR(*header),
+        [
+            ProjectSummary(
+                uid=proj["proj_id"],
+                short_name=proj["proj_short_name"],
+                name=(names or {}).get(proj["proj_id"], ""),
+                data_date=max(
+                    parse_date(proj["last_recalc_date"]),
+                    parse_date(proj["plan_start_date"]),
+                ),
+                plan_start_date=parse_date(proj["plan_start_date"]),
+                finish_date=parse_date(proj["scd_end_date"]),
+                last_schedule_date=optional_date(proj.get("last_schedule_date", "")),
+                export_flag=proj["export_flag"] == "Y",
+            )
+            for proj in projects
+        ],
+    )
@@ -0,0 +1,144 @@
+# xerparser
+# table.py
+
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, MutableSequence, overload
+
+BATCH_SIZE = 10_000  # number of rows transposed into columns at a time
+
+
+class Table(MutableSequence[dict[str, str]]):
+    """
+    A columnar representation of a .xer table.
+
+    Values are stored in one list per column rather than one dictionary per row.
+    A `Table` can be used in place of a list of row dictionaries: indexing and
+    iterating return a dictionary for each row, built when it is accessed, and
+    rows are added or replaced with `append`, `insert`, or by index. Changes to
+    the returned dictionaries are not stored in the table. A table is equal to
+    a list of the same row dictionaries.
+    Use `column` for bulk access to the values of a column.
+    """
+
+    def __init__(self, columns: Iterable[str], rows: Iterable[list[str]] = ()) -> None:
+        self.columns: list[str] = list(columns)
+        """Column labels"""
+        self._index: dict[str, int] = {col: i for i, col in enumerate(self.columns)}
+        self._data: list[list[str]] = [[] for _ in self.columns]
+        self._len: int = 0
+        self.extend_values(rows)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, str]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, str] | list[dict[str, str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        index = self._position(index)
+        return {col: data[index] for col, data in zip(self.columns, self._data)}
+
+    @overload
+    def __setitem__(self, index: int, row: Mapping[str, str]) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, row: Iterable[Mapping[str, str]]) -> None: ...
+
+    def __setitem__(self, index: Any, row: Any) -> None:
+        if isinstance(index, slice):
+            rows = [self[i] for i in range(self._len)]
+            rows[index] = row
+            self.clear()
+            self.extend(rows)
+            return
+        index = self._position(index)
+        values = self._values(row)
+        for data, value in zip(self._data, values):
+            data[index] = value
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, int):
+            index = self._position(index)
+        for data in self._data:
+            del data[index]
+        self._len = len(self._data[0]) if self._data else 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Table):
+            return list(self) == list(other)
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                row == other_row for row, other_row in zip(self, other)
+            )
+        return NotImplemented
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        cols = self.columns
+        for values in zip(*self._data):
+            yield dict(zip(cols, values))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"<Table {self._len} rows x {len(self.columns)} columns>"
+
+    def column(self, name: str) -> list[str]:
+        """
+        Values of a column. The list is the storage used by the table
+        and should not be modified.
+        """
+        return self._data[self._index[name]]
+
+    def iter_values(self) -> Iterator[tuple[str, ...]]:
+        """Iterate over the values of each row, in the order of the columns."""
+        return zip(*self._data)
+
+    def insert(self, index: int, row: Mapping[str, str]) -> None:
+        """
+        Insert a row dictionary before `index`. Columns missing from the row
+        are stored as empty strings, and new columns are added to the table.
+        """
+        index = min(max(index + self._len if index < 0 else index, 0), self._len)
+        for data, value in zip(self._data, self._values(row)):
+            data.insert(index, value)
+        self._len += 1
+
+    def extend_values(self, rows: Iterable[list[str]]) -> None:
+        """
+        Add rows of values to the table. Values are assigned to columns
+        by position; missing values are stored as empty strings.
+        """
+        width = len(self.columns)
+        rows = iter(rows)
+        while batch := [
+            row if len(row) == width else (row + [""] * width)[:width]
+            for row in islice(rows, BATCH_SIZE)
+        ]:
+            for data, values in zip(self._data, zip(*batch)):
+                data.extend(values)
+            self._len += len(batch)
+
+    def clear(self) -> None:
+        """Remove all of the rows, keeping the columns."""
+        for data in self._data:
+            data.clear()
+        self._len = 0
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Table index out of range")
+        return index
+
+    def _values(self, row: Mapping[str, str]) -> list[str]:
+        """Values of a row dictionary by column, adding any new columns."""
+        for col in row:
+            if col not in self._index:
+                self._index[col] = len(self.columns)
+                self.columns.append(col)
+                self._data.append([""] * self._len)
+        return [row.get(col, "") for col in self.columns]
@@ -1,4 +1,11 @@
+from typing import TYPE_CHECKING
+
 from xerparser.schemas.task import TASK, LinkToTask
+from xerparser.schemas.taskpred import TASKPRED
+from xerparser.src.network import LINK_CODES
+
+if TYPE_CHECKING:
+    from xerparser.schemas.project import PROJECT
 
 
 def find_redundant_logic(task: TASK) -> list[list[LinkToTask]]:
@@ -50,3 +57,74 @@ def _is_valid_path(
         return False
 
     return pred.link[1] == path[-1].link[1]
+
+
+def find_redundant_relationships(project: "PROJECT") -> list[TASKPRED]:
+    """Find all of the redundant relationships of a project in one pass.
+
+    A relationship is redundant when its predecessor also drives the successor
+    through other activities, by the same rules as `find_redundant_logic`:
+    the path starts with the same link type as the relationship, every link
+    on it has the same start or end type, the last link has the same end type,
+    and only the last activity before the successor can be a level of effort.
+
+    The paths are found with a transitive reduction of the logic network: the
+    activities that reach each activity are kept as a bitset (an integer with
+    a bit for each activity), built from the bitsets of its predecessors in
+    topological order and released once all of its successors are visited.
+
+    Args:
+        project (PROJECT): Project to search
+
+    Raises:
+        ValueError: The relationships of the project have a loop.
+
+    Returns:
+        list[TASKPRED]: Redundant relationships, in the order of
+        `project.relationships`
+    """
+    network = project.network
+    order = network.topological_order()
+    offsets, preds, types = network.pred_offsets, network.pred_tasks, network.pred_types
+    succ_offsets = network.succ_offsets
+    loe = [task.type.is_loe for task in network.tasks]
+
+    # only activities with more than one successor can drive one of them
+    # through another, so the bitsets only have a bit for those activities
+    bit = [-1] * len(loe)
+    position = 0
+    for i in order:
+        if not loe[i] and succ_offsets[i + 1] - succ_offsets[i] > 1:
+            bit[i] = position
+            position += 1
+
+    redundant = set()
+    for link in sorted(set(types)):
+        code = LINK_CODES[link]
+        on_path = [other[0] == code[0] or other[1] == code[1] for other in LINK_CODES]
+        on_end = [other[1] == code[1] for other in LINK_CODES]
+        successors = [succ_offsets[i + 1] - succ_offsets[i] for i in range(len(loe))]
+        reach = [0] * len(loe)
+        for j in order:
+            start, stop = offsets[j], offsets[j + 1]
+            paths = ends = 0
+            for k in range(start, stop):
+                i, t = preds[k], types[k]
+                if on_end[t]:
+                    ends |= reach[i]
+                if on_path[t] and not loe[i]:
+                    paths |= reach[i]
+                    if t == link and bit[i] >= 0:
+                        paths |= 1 << bit[i]
+                successors[i] -= 1
+                if not successors[i]:
+                    reach[i] = 0
+            if ends:
+                for k in range(start, stop):
+                    i = preds[k]
+                    if types[k] == link and bit[i] >= 0 and ends >> bit[i] & 1:
+                        redundant.add(network.pred_links[k])
+            if successors[j]:
+                reach[j] = paths
+
+    return [network.relationships[k] for k in sorted(redundant)]
@@ -0,0 +1,302 @@
+# xerparser
+# validation.py
+
+import copy
+from typing import Callable, Collection, Iterable, Iterator, Sequence
+
+from xerparser.schemas._field import row_fields
+from xerparser.src.registry import SCHEMAS, table_values
+
+RowCheck = Callable[[Sequence[str]], None]
+"""Function called with the values of each row of a table"""
+
+# This list of required tables may be subjective;
+# pass `required_tables` to use your own list.
+REQUIRED_TABLES = frozenset({"CALENDAR", "PROJECT", "PROJWBS", "TASK"})
+REQUIRED_TABLE_PAIRS = frozenset(
+    {
+        ("TASKFIN", "FINDATES"),
+        ("TRSRCFIN", "FINDATES"),
+        ("TASKRSRC", "RSRC"),
+        ("TASKMEMO", "MEMOTYPE"),
+        ("ACTVCODE", "ACTVTYPE"),
+        ("TASKACTV", "ACTVCODE"),
+        ("PCATVAL", "PCATTYPE"),
+        ("PROJPCAT", "PCATVAL"),
+        ("UDFVALUE", "UDFTYPE"),
+    }
+)
+
+
+class Check:
+    """
+    Base class for a rule checked while the tables of a .xer file are read.
+
+    `start` is called when the reading of a table starts. It returns a
+    function that is called with the values of each row of the table, or
+    `None` if the check does not use the table. `errors` is called once
+    all of the tables were read.
+
+    Each file is checked with a copy of the check, so the same check can be
+    used for many files. State kept while reading a file must be created in
+    `reset`, which is called on the copy before the file is read.
+    """
+
+    def reset(self) -> None:
+        """Clear the state of the check before reading a file."""
+
+    def start(self, table: str, columns: Sequence[str]) -> RowCheck | None:
+        """Start reading the rows of a table."""
+        return None
+
+    def errors(self, tables: Collection[str]) -> list[str]:
+        """
+        Errors found in the file.
+
+        Args:
+            tables (Collection[str]): Names of the tables that were read.
+        """
+        return []
+
+
+class RequiredTables(Check):
+    """Tables that must be included in the file."""
+
+    def __init__(self, tables: Iterable[str] = REQUIRED_TABLES) -> None:
+        self.tables = frozenset(tables)
+
+    def errors(self, tables: Collection[str]) -> list[str]:
+        return [
+            f"Missing Required Table {name}"
+            for name in sorted(self.tables)
+            if name not in tables
+        ]
+
+
+class RequiredTablePairs(Check):
+    """Pairs of tables where the second table is required if the first is included."""
+
+    def __init__(self, pairs: Iterable[tuple[str, str]] = REQUIRED_TABLE_PAIRS) -> None:
+        self.pairs = frozenset(pairs)
+
+    def errors(self, tables: Collection[str]) -> list[str]:
+        return [
+            f"Missing Table {t2} Required for Table {t1}"
+            for t1, t2 in sorted(self.pairs)
+            if t1 in tables and t2 not in tables
+        ]
+
+
+class RequiredColumns(Check):
+    """
+    Columns that must be included in a table. By default, the columns of the
+    row fields of each schema class without a default value, which are only
+    converted when the field is first used.
+    """
+
+    def __init__(self, columns: dict[str, Iterable[str]] | None = None) -> None:
+        if columns is None:
+            columns = {
+                table: required_columns(schema) for table, schema in SCHEMAS.items()
+            }
+        self.columns = {table: frozenset(cols) for table, cols in columns.items()}
+        self.reset()
+
+    def reset(self) -> None:
+        self._errors: list[str] = []
+
+    def start(self, table: str, columns: Sequence[str]) -> RowCheck | None:
+        # the columns of a table without rows are not known once it is read
+        if columns and (missing := self.columns.get(table, set()) - set(columns)):
+            self._errors.append(
+                f"Table {table} is Missing Required Columns {', '.join(sorted(missing))}"
+            )
+        return None
+
+    def errors(self, tables: Collection[str]) -> list[str]:
+        return self._errors
+
+
+class MissingReferences(Check):
+    """
+    Rows of exported projects that reference a key which is not in the table
+    it belongs to, such as tasks assigned to a calendar that is not in the
+    `CALENDAR` table.
+
+    Tables can be read in any order. The referenced keys are counted by
+    project while the rows are read, and compared to the keys of the
+    `target` table and the exported projects once all tables were read.
+    """
+
+    def __init__(
+        self, table: str, column: str, target: str, key: str, message: str
+    ) -> None:
+        self.table = table
+        """Table with the references"""
+        self.column = column
+        """Column of `table` referencing the `target` table"""
+        self.target = target
+        """Table that is referenced"""
+        self.key = key
+        """Key column of the `target` table"""
+        self.message = message
+        """Error message, formatted with the number of `missing` keys and `rows`"""
+        self.reset()
+
+    def reset(self) -> None:
+        self._keys: set[str] = set()
+        self._exported: set[str] = set()
+        self._references: dict[tuple[str, str], int] = {}
+
+    def start(self, table: str, columns: Sequence[str]) -> RowCheck | None:
+        cols = {col: i for i, col in enumerate(columns)}
+        if table == self.target and self.key in cols:
+            key, keys = cols[self.key], self._keys
+            return lambda row: keys.add(row[key])
+
+        if table == "PROJECT" and {"proj_id", "export_flag"} <= cols.keys():
+            proj_id, flag = cols["proj_id"], cols["export_flag"]
+            exported = self._exported
+
+            def add_project(row: Sequence[str]) -> None:
+                if row[flag] == "Y":
+                    exported.add(row[proj_id])
+
+            return add_project
+
+        if table == self.table and {self.column, "proj_id"} <= cols.keys():
+            column, proj_id = cols[self.column], cols["proj_id"]
+            references = self._references
+
+            def add_reference(row: Sequence[str]) -> None:
+                ref = (row[column], row[proj_id])
+                references[ref] = references.get(ref, 0) + 1
+
+            return add_reference
+
+        return None
+
+    def errors(self, tables: Collection[str]) -> list[str]:
+        missing = {
+            ref: count
+            for ref, count in self._references.items()
+            if ref[0] not in self._keys and ref[1] in self._exported
+        }
+        if not missing:
+            return []
+        return [
+            self.message.format(
+                missing=len({key for key, _ in missing}), rows=sum(missing.values())
+            )
+        ]
+
+
+class Validator:
+    """
+    Run checks over the tables of a .xer file as they are read, so each
+    table is only read once for all of the checks.
+    """
+
+    def __init__(self, checks: Iterable[Check]) -> None:
+        self.checks: list[Check] = []
+        for check in checks:
+            check = copy.copy(check)
+            check.reset()
+            self.checks.append(check)
+        self.tables: list[str] = []
+        """Names of the tables that were read"""
+
+    def read(
+        self, table: str, columns: Sequence[str], rows: Iterable[Sequence[str]]
+    ) -> Iterable[Sequence[str]]:
+        """
+        Check the rows of a table. Returns the rows, which are checked as
+        they are iterated over; they must be consumed before reading the
+        next table.
+        """
+        self.tables.append(table)
+        row_checks = [
+            row_check
+            for check in self.checks
+            if (row_check := check.start(table, columns)) is not None
+        ]
+        if not row_checks:
+            return rows
+        return _check_rows(rows, row_checks)
+
+    def errors(self) -> list[str]:
+        """Errors found by all of the checks."""
+        return [error for check in self.checks for error in check.errors(self.tables)]
+
+
+def default_checks(
+    subset: Collection[str] | None = None,
+    required_tables: Iterable[str] | None = None,
+) -> list[Check]:
+    """
+    Checks run on every .xer file:
+    - Missing tables
+    - Missing columns read by the row fields of the objects
+    - Non-existent calendars assigned to activities
+    - Non-existent resources assigned to activity resources
+
+    If only a `subset` of the tables is loaded, required tables
+    and table pairs outside of the subset are not checked.
+    """
+    required = REQUIRED_TABLES if required_tables is None else set(required_tables)
+    pairs = REQUIRED_TABLE_PAIRS
+    if subset is not None:
+        required = required & set(subset)
+        pairs = {pair for pair in pairs if pair[0] in subset}
+
+    return [
+        RequiredTables(required),
+        RequiredTablePairs(pairs),
+        RequiredColumns(),
+        MissingReferences(
+            "TASK",
+            "clndr_id",
+            "CALENDAR",
+            "clndr_id",
+            "XER is Missing {missing} Calendars Assigned to {rows} Tasks",
+        ),
+        MissingReferences(
+            "TASKRSRC",
+            "rsrc_id",
+            "RSRC",
+            "rsrc_id",
+            "XER is Missing {missing} Resources Assigned to {rows} Task Resources.",
+        ),
+    ]
+
+
+def required_columns(schema: type) -> frozenset[str]:
+    """Columns of the row fields of a schema class without a default value."""
+    fields = (getattr(schema, name) for name in row_fields(schema))
+    return frozenset(field.column for field in fields if field.default is None)
+
+
+def validate(tables: dict[str, Sequence], checks: Iterable[Check]) -> list[str]:
+    """Run checks over tables that were already read and return the errors."""
+    validator = Validator(checks)
+    for name, table in tables.items():
+        columns, rows = ((), ()) if name == "ERMHDR" else table_values(table)
+        for _ in validator.read(name, columns, rows):
+            pass
+    return validator.errors()
+
+
+def _check_rows(
+    rows: Iterable[Sequence[str]], row_checks: list[RowCheck]
+) -> Iterator[Sequence[str]]:
+    if len(row_checks) == 1:
+        row_check = row_checks[0]
+        for row in rows:
+            row_check(row)
+            yield row
+        return
+
+    for row in rows:
+        for row_check in row_checks:
+            row_check(row)
+        yield row
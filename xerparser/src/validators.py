@@ -3,8 +3,36 @@ This module contains functions to validate and transorm data during object initi
 """
 
 from datetime import datetime
+from functools import lru_cache
 
 date_format = "%Y-%m-%d %H:%M"  # date format used by P6 when exporting to an xer file
+DATE_CACHE_SIZE = 8192  # number of distinct date strings memoized by `parse_date`
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value: str) -> datetime:
+    """
+    Transform a string in the P6 date format (`YYYY-MM-DD HH:MM`) to a
+    datetime object. Fixed-width strings are sliced into integers rather
+    than parsed with `strptime`; results are memoized since the same
+    dates are repeated throughout a schedule. Strings that are not exactly
+    in this format (e.g. padded with spaces) are left to `strptime`.
+    """
+    digits = value[:4] + value[5:7] + value[8:10] + value[11:13] + value[14:]
+    if (
+        len(value) == 16
+        and value[4] + value[7] + value[10] + value[13] == "-- :"
+        and digits.isascii()
+        and digits.isdigit()
+    ):
+        return datetime(
+            int(value[:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:]),
+        )
+    return datetime.strptime(value, date_format)
 
 
 def optional_date(value: str) -> datetime | None:
@@ -14,7 +42,17 @@ def optional_date(value: str) -> datetime | None:
     """
     if value == "" or value is None:
         return None
-    return datetime.strptime(value, date_format)
+    return parse_date(value)
+
+
+def parse_float(value: str) -> float:
+    """Transform a string to a float, accepting a comma as the decimal separator."""
+    return float(value.replace(",", "."))
+
+
+def percent_to_float(value: str) -> float:
+    """Transform a percentage string (0 - 100) to a float (0.0 - 1.0)."""
+    return parse_float(value) / 100
 
 
 def optional_float(value: str) -> float | None:
@@ -57,6 +95,11 @@ def int_or_zero(value: str) -> int:
     return int(value)
 
 
+def flag_to_bool(value: str) -> bool:
+    """Transform a Y/N flag to a boolean."""
+    return value == "Y"
+
+
 def optional_str(value: str) -> str | None:
     """Transform a string to None if its empty."""
     return (value, None)[value == ""]
@@ -1,11 +1,27 @@
 # xerparser
 # xer.py
 
-from itertools import groupby
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Any, BinaryIO
-
-from xerparser.schemas import TABLE_UID_MAP
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Generic,
+    TypeVar,
+    overload,
+)
+
+from xerparser.schemas import TABLE_DEPENDENCIES, TABLE_UID_MAP
+from xerparser.schemas._field import load_fields
 from xerparser.schemas._node import build_tree
 from xerparser.schemas.account import ACCOUNT
 from xerparser.schemas.actvcode import ACTVCODE
@@ -28,8 +44,74 @@ from xerparser.schemas.taskpred import TASKPRED
 from xerparser.schemas.taskrsrc import TASKRSRC
 from xerparser.schemas.trsrcfin import TRSRCFIN
 from xerparser.schemas.udftype import UDFTYPE
+from xerparser.src.aio import AsyncStreamReader, is_async_stream
 from xerparser.src.errors import CorruptXerFile, find_xer_errors
-from xerparser.src.parser import CODEC, file_reader, parser
+from xerparser.src.foreign_keys import ForeignKeyIndex
+from xerparser.src.parallel import ConvertedChunk, restore_objects, submit_tables
+from xerparser.src.parser import CODEC, parser, read_tables
+from xerparser.src.registry import SCHEMAS
+from xerparser.src.table import Table
+from xerparser.src.validation import Check, default_checks
+
+if TYPE_CHECKING:
+    from xerparser.src.batch import XerResult
+    from xerparser.src.shared import SharedXer
+
+T = TypeVar("T")
+
+Retain = Literal["all", "unconverted", "none"]
+"""Raw tables kept in `Xer.tables` once the objects are built"""
+
+
+class XerCollection(Generic[T]):
+    """
+    A collection of objects of an `Xer`, built the first time it is used.
+
+    The collection is built by `build`, which reads any other collection it
+    depends on, building it first if needed. The collection is then stored
+    on the `Xer` object and the `links` are run to link its objects to the
+    objects of other collections.
+
+    Objects of a collection can be filled in by the collections built after
+    them (e.g. `PROJECT.tasks` by `tasks`). Those attributes are `FilledBy`
+    descriptors, which build the collection filling them in when they are
+    first read, so the objects returned are always fully linked.
+    """
+
+    def __init__(
+        self, build: Callable[[Any], T], *links: Callable[[Any], None]
+    ) -> None:
+        self.build = build
+        self.links = links
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, xer: None, owner: type | None = None) -> "XerCollection[T]": ...
+
+    @overload
+    def __get__(self, xer: "Xer", owner: type | None = None) -> T: ...
+
+    def __get__(
+        self, xer: "Xer | None", owner: type | None = None
+    ) -> "T | XerCollection[T]":
+        if xer is None:
+            return self
+        if self.name in xer._building:
+            chain = " -> ".join([*xer._building, self.name])
+            raise RuntimeError(f"Circular dependency building Xer objects: {chain}")
+
+        xer._building.append(self.name)
+        try:
+            value = self.build(xer)
+            # stored in the instance dictionary, so the descriptor is bypassed
+            xer.__dict__[self.name] = value
+            for link in self.links:
+                link(xer)
+        finally:
+            xer._building.pop()
+        return value
 
 
 class Xer:
@@ -41,47 +123,25 @@ class Xer:
     CODEC = CODEC
 
     def __init__(self, xer_file_contents: str) -> None:
-        self.tables: dict[str, list] = parser(xer_file_contents)
-        if errors := find_xer_errors(self.tables):
+        tables = parser(xer_file_contents)
+        if errors := find_xer_errors(tables):
             raise CorruptXerFile(errors)
-        self.export_info = ERMHDR(*self.tables["ERMHDR"])
-        self.accounts: dict[str, ACCOUNT] = build_tree(self._get_attr("ACCOUNT"))
-        self.activity_code_types: dict[str, ACTVTYPE] = self._get_attr("ACTVTYPE")
-        self.activity_code_values: dict[str, ACTVCODE] = build_tree(
-            self._get_activity_codes()
-        )
-        self.calendars: dict[str, CALENDAR] = self._get_attr("CALENDAR")
-
-        for cal in self.calendars.values():
-            if cal.base_clndr_id:
-                cal.base_calendar = self.calendars.get(cal.base_clndr_id)
-
-        self.financial_periods: dict[str, FINDATES] = self._get_attr("FINDATES")
-        self.notebook_topics: dict[str, MEMOTYPE] = self._get_attr("MEMOTYPE")
-        self.project_code_types: dict[str, PCATTYPE] = self._get_attr("PCATTYPE")
-        self.project_code_values: dict[str, PCATVAL] = build_tree(
-            self._get_proj_codes()
-        )
-        self.resources: dict[str, RSRC] = build_tree(self._get_attr("RSRC"))
-        self.resource_rates: dict[str, RSRCRATE] = self._get_rsrc_rates()
-        self.sched_options: dict[str, SCHEDOPTIONS] = self._get_attr("SCHEDOPTIONS")
-        self.udf_types: dict[str, UDFTYPE] = self._get_attr("UDFTYPE")
-        self.projects = self._get_projects()
-        self.wbs_nodes: dict[str, PROJWBS] = build_tree(self._get_wbs_nodes())
-        self.tasks: dict[str, TASK] = self._get_tasks()
-        self.relationships: dict[str, TASKPRED] = self._get_relationships()
-
-        self._set_proj_activity_codes()
-        self._set_proj_codes()
-        self._set_proj_calendars()
-        self._set_task_actv_codes()
-        self._set_task_memos()
-        self._set_task_resources()
-        self._set_financial_periods()
-        self._set_udf_values()
+        self._build(tables)
 
     @classmethod
-    def reader(cls, file: Path | str | BinaryIO) -> "Xer":
+    def reader(
+        cls,
+        file: Path | str | BinaryIO,
+        tables: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        projects: Iterable[str] | None = None,
+        columnar: bool = False,
+        workers: int | None = None,
+        required_tables: Iterable[str] | None = None,
+        checks: Iterable[Check] | None = None,
+        retain: Retain = "all",
+        lazy: bool = False,
+    ) -> "Xer":
         """
         Create an Xer object directly from a .XER file.
 
@@ -89,89 +149,363 @@ class Xer:
             * Path directory (str or pathlib.Path)
             * Binary file (from requests, Flask, FastAPI, etc...)
 
+        The file is streamed table by table, so its contents are never
+        held in memory as a single string.
+
+        Use `tables` to only load a subset of the tables; the tables they
+        depend on are loaded as well. Use `exclude` to skip tables; tables
+        that depend on an excluded table are skipped as well.
+
+        Use `projects` to only load the data for some of the projects in a
+        multi-project file. Projects can be passed by their code
+        (`proj_short_name`) or unique table id (`proj_id`).
+
+        Set `columnar` to store the raw tables in `Xer.tables` as `Table`
+        objects, which use less memory than a list of row dictionaries.
+
+        Set `workers` to convert the rows of the largest tables (`TASK`,
+        `TASKMEMO`, `TASKPRED`, and `TASKRSRC`) in a pool of worker processes.
+        Objects are linked together in the current process.
+
+        The file is checked for errors while it is read, and a `CorruptXerFile`
+        exception is raised before any objects are built. Use `required_tables`
+        to replace the default list of required tables, and `checks` to run
+        additional `Check` rules (see `xerparser.src.validation`).
+
+        Use `retain` to release the raw tables once the objects are built
+        (see `Xer.release_tables`).
+
+        Set `lazy` to build each collection of objects (`projects`, `tasks`,
+        `relationships`, etc.) the first time it is used, along with the
+        collections it depends on; for example, `xer.projects` builds the
+        calendars and schedule options but not the activities. Attributes
+        filled in by another collection build it when they are first read,
+        e.g. `project.tasks` builds `xer.tasks`. Call `Xer.materialize`
+        to build all of the objects. Ignored if `workers` is set.
         """
-        file_contents = file_reader(file)
-        return cls(file_contents)
+        include, excluded, subset = select_tables(tables, exclude)
+        source = _file_source(file, columnar, projects is not None)
+        xer_data = read_tables(
+            file,
+            tables=include,
+            exclude=excluded,
+            projects=None if projects is None else set(projects),
+            columnar=columnar,
+            checks=[*default_checks(subset, required_tables), *(checks or ())],
+        )
+        xer = cls.__new__(cls)
+        xer._build(xer_data, workers, lazy=lazy)
+        xer._source = source
+        xer.release_tables(retain)
+        return xer
+
+    @classmethod
+    async def areader(
+        cls,
+        file: Any,
+        executor: Executor | None = None,
+        limit: asyncio.Semaphore | None = None,
+        **kwargs: Any,
+    ) -> "Xer":
+        """
+        Create an Xer object from a .XER file without blocking the event loop.
+
+        Files can be passed as an:
+            * Async byte stream (FastAPI/Starlette `UploadFile`, aiohttp
+            `StreamReader`, or an async iterable of bytes)
+            * Path directory (str or pathlib.Path)
+            * Binary file
+
+        Parsing and object building run in `executor` (defaults to the event
+        loop's default thread pool). Async streams are parsed as they are read,
+        so the executor must be a thread pool when reading from a stream.
+
+        Pass a shared `limit` semaphore to cap the number of files parsed at
+        the same time. Additional keyword arguments are passed to `Xer.reader`.
+        """
+        loop = asyncio.get_running_loop()
+        if is_async_stream(file):
+            file = AsyncStreamReader(file, loop)
+
+        async with limit or nullcontext():
+            return await loop.run_in_executor(
+                executor, partial(cls.reader, file, **kwargs)
+            )
+
+    @staticmethod
+    def read_many(
+        files: Iterable[str | Path],
+        reducer: Callable[["Xer"], Any] | None = None,
+        workers: int | None = None,
+        ordered: bool = True,
+        max_pending: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator["XerResult"]:
+        """
+        Read many .xer files in a pool of worker processes and yield
+        the value returned by `reducer` for each file.
+        See `xerparser.src.batch.read_many`.
+        """
+        from xerparser.src.batch import read_many
+
+        return read_many(files, reducer, workers, ordered, max_pending, **kwargs)
+
+    def release_tables(self, retain: Retain = "unconverted") -> None:
+        """
+        Release raw tables from `Xer.tables` to free the memory they use
+        once the objects are built.
+
+        Args:
+            retain (str, optional): Tables to keep; `"all"` tables,
+                only the `"unconverted"` tables that are not built into objects
+                (e.g. `PROJPCAT` and `UDFVALUE`), or `"none"`.
+                Defaults to "unconverted".
+
+        The fields of the objects built from a released table are converted
+        before it is released, so the objects no longer reference its rows.
+        Released tables can be read again from the .xer file with `Xer.table`.
+        """
+        if retain not in ("all", "unconverted", "none"):
+            raise ValueError(
+                f"retain must be 'all', 'unconverted', or 'none'; got {retain!r}"
+            )
+        if retain == "all":
+            return
+
+        # objects are built from the raw tables
+        self.materialize()
+        row_objects = self._row_objects()
+        for name in list(self.tables):
+            if retain == "none" or name in SCHEMAS or name == "ERMHDR":
+                # objects keep their raw rows until their fields are converted
+                for obj in row_objects.get(name, ()):
+                    load_fields(obj)
+                del self.tables[name]
+                self.released_tables.append(name)
+        self.foreign_keys = ForeignKeyIndex(self.tables)
+
+    def table(self, name: str) -> list[dict[str, str]] | Table:
+        """
+        Get a raw table. A table released from `Xer.tables` is read again
+        from the .xer file, which must not have changed since it was read;
+        the table is returned without being stored in `Xer.tables`.
+
+        Raises:
+            KeyError: The table was not loaded.
+            ValueError: The table was released and cannot be read again.
+        """
+        if name in self.tables:
+            return self.tables[name]
+        if name not in self.released_tables:
+            raise KeyError(name)
+        if self._source is None:
+            raise ValueError(
+                f"Table {name} was released and the .xer file is not available"
+            )
+
+        path, stat, columnar, filtered = self._source
+        current = os.stat(path)
+        if (current.st_mtime_ns, current.st_size) != stat:
+            raise ValueError(f"Table {name} was released and {path} has changed")
+        tables = read_tables(
+            path,
+            tables={name},
+            projects=set(self.projects) if filtered else None,
+            columnar=columnar,
+        )
+        if name == "ERMHDR":
+            return tables[name]
+        return tables.get(name, Table([]) if columnar else [])
+
+    def _build(
+        self,
+        tables: dict[str, list | Table],
+        workers: int | None = None,
+        lazy: bool = False,
+    ) -> None:
+        # tables are checked for errors before the objects are built
+        self.tables: dict[str, list | Table] = tables
+        self.released_tables: list[str] = []
+        """Raw tables released from `tables` after the objects were built"""
+        self._source: tuple[Path, tuple[int, int], bool, bool] | None = None
+        self.foreign_keys = ForeignKeyIndex(self.tables)
+        """Rows of each table grouped by foreign key"""
+
+        # Rows converted to typed values by the workers
+        self._converted: dict[str, Iterable[ConvertedChunk]] = {}
+        self._building: list[str] = []
+        self._lazy = lazy and (workers is None or workers < 2)
+        if workers is None or workers < 2:
+            if not lazy:
+                self.materialize()
+            return
+
+        # Rows are converted by the workers while the other objects are built
+        with ProcessPoolExecutor(workers) as executor:
+            self._converted = submit_tables(executor, self.tables)
+            self.materialize()
+
+    def materialize(self) -> "Xer":
+        """
+        Build all of the objects that have not been built yet.
+        Use for long-lived objects read with `lazy=True`.
+        """
+        for name in COLLECTIONS:
+            getattr(self, name)
+        self._converted = {}
+        return self
+
+    def save_snapshot(self, path: str | Path) -> None:
+        """
+        Save the objects and raw tables to a binary snapshot file,
+        which is loaded with `Xer.load_snapshot` much faster than the
+        .xer file is read. See `xerparser.src.snapshot`.
+        """
+        from xerparser.src.snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(cls, path: str | Path) -> "Xer":
+        """
+        Load an `Xer` from a snapshot file created by `Xer.save_snapshot`.
+
+        Released tables cannot be read again from a loaded snapshot.
+
+        Raises:
+            ValueError: The file is not a snapshot, or was saved with a different
+            snapshot format or version of xerparser.
+        """
+        from xerparser.src.snapshot import load_snapshot
+
+        return load_snapshot(path)
+
+    def share(self, tables: Iterable[str] | None = None) -> "SharedXer":
+        """
+        Export the objects of some tables to shared memory as typed columns,
+        to be read by worker processes with `SharedXerView`.
+        See `xerparser.src.shared.SharedXer`.
+        """
+        from xerparser.src.shared import SharedXer
+
+        return SharedXer(self.materialize(), tables)
 
     def _get_activity_codes(self) -> dict:
-        activity_code_values = {
-            code_val["actv_code_id"]: ACTVCODE(
-                code_type=self.activity_code_types[code_val["actv_code_type_id"]],
-                **code_val,
+        return {
+            row["actv_code_id"]: ACTVCODE(
+                self.activity_code_types[row["actv_code_type_id"]], **row
             )
-            for code_val in self.tables.get("ACTVCODE", [])
+            for row in self.tables.get("ACTVCODE", [])
         }
-        return activity_code_values
 
     def _get_attr(self, table_name: str) -> dict:
-        if table := self.tables.get(table_name):
-            row_id = TABLE_UID_MAP[table_name]
-            return {row[row_id]: eval(table_name)(**row) for row in table}
-        return {}
+        schema = SCHEMAS[table_name]
+        uid = TABLE_UID_MAP[table_name]
+        return {row[uid]: schema(**row) for row in self.tables.get(table_name, [])}
 
     def _get_projects(self) -> dict[str, PROJECT]:
-        projects = {
-            proj["proj_id"]: PROJECT(
-                self.sched_options[proj["proj_id"]],
-                self.calendars.get(proj["clndr_id"]),
-                **proj,
+        return {
+            row["proj_id"]: PROJECT(
+                self.sched_options[row["proj_id"]],
+                self.calendars.get(row["clndr_id"]),
+                **row,
             )
-            for proj in self.tables.get("PROJECT", [])
-            if proj["export_flag"] == "Y"
+            for row in self.tables.get("PROJECT", [])
+            if row["export_flag"] == "Y"
         }
-        return projects
 
     def _get_proj_codes(self) -> dict:
-        project_code_values = {
-            code_val["proj_catg_id"]: PCATVAL(
-                code_type=self.project_code_types[code_val["proj_catg_type_id"]],
-                **code_val,
+        return {
+            row["proj_catg_id"]: PCATVAL(
+                self.project_code_types[row["proj_catg_type_id"]], **row
             )
-            for code_val in self.tables.get("PCATVAL", [])
+            for row in self.tables.get("PCATVAL", [])
         }
 
-        return project_code_values
-
     def _get_relationships(self) -> dict[str, TASKPRED]:
+        if chunks := self._converted.pop("TASKPRED", None):
+            relationships = restore_objects("TASKPRED", chunks)
+        else:
+            relationships = [
+                TASKPRED(None, None, **row) for row in self.tables.get("TASKPRED", [])
+            ]
         return {
-            rel["task_pred_id"]: self._set_taskpred(**rel)
-            for rel in self.tables.get("TASKPRED", [])
+            rel.uid: self._link_taskpred(
+                rel, self.tasks[rel.pred_task_id], self.tasks[rel.task_id]
+            )
+            for rel in relationships
         }
 
     def _get_rsrc_rates(self) -> dict[str, RSRCRATE]:
         return {
-            rr["rsrc_rate_id"]: self._set_rsrc_rates(**rr)
-            for rr in self.tables.get("RSRCRATE", [])
+            row["rsrc_rate_id"]: RSRCRATE(self.resources[row["rsrc_id"]], **row)
+            for row in self.tables.get("RSRCRATE", [])
         }
 
     def _get_tasks(self) -> dict[str, TASK]:
+        if chunks := self._converted.pop("TASK", None):
+            tasks = restore_objects("TASK", chunks)
+        else:
+            tasks = [TASK(None, None, **row) for row in self.tables.get("TASK", [])]
         return {
-            task["task_id"]: self._set_task(**task)
-            for task in self.tables.get("TASK", [])
+            task.uid: self._link_task(
+                task, self.calendars[task.clndr_id], self.wbs_nodes[task.wbs_id]
+            )
+            for task in tasks
         }
 
     def _get_wbs_nodes(self) -> dict:
-        nodes: dict[str, PROJWBS] = {
-            node["wbs_id"]: self._set_proj_wbs(**node)
-            for node in self.tables.get("PROJWBS", [])
+        return {
+            row["wbs_id"]: PROJWBS(self.projects[row["proj_id"]], **row)
+            for row in self.tables.get("PROJWBS", [])
+        }
+
+    def _row_objects(self) -> dict[str, Iterable[Any]]:
+        """Built objects that convert their fields from the rows of a table."""
+        return {
+            "PROJECT": self.projects.values(),
+            "TASK": self.tasks.values(),
+            "TASKPRED": self.relationships.values(),
+            "TASKRSRC": [
+                taskrsrc
+                for task in self.tasks.values()
+                for taskrsrc in task.resources.values()
+            ],
         }
-        return nodes
+
+    def _fill(self, collection: str) -> None:
+        """Build a collection filling in the objects built lazily."""
+        # objects are filled in by the collection being built
+        if not self._building:
+            getattr(self, collection)
+
+    def _set_fill(self, objects: Iterable[Any]) -> None:
+        """Let objects built lazily build the collections filling them in."""
+        if self._lazy:
+            fill = self._fill
+            for obj in objects:
+                obj._fill = fill
 
     def _set_proj_activity_codes(self) -> None:
-        code_group = groupby(
-            sorted(self.activity_code_types.values(), key=proj_key), proj_key
-        )
-        for proj_id, codes in code_group:
+        code_types = self.tables.get("ACTVTYPE", [])
+        by_project = self.foreign_keys.positions("ACTVTYPE", "proj_id")
+        for proj_id, positions in by_project.items():
             if proj := self.projects.get(proj_id):
-                proj.activity_codes = list(codes)
+                proj.activity_codes = [
+                    self.activity_code_types[code_types[i]["actv_code_type_id"]]
+                    for i in positions
+                ]
 
     def _set_proj_calendars(self) -> None:
+        calendars = self.tables.get("CALENDAR", [])
+        by_project = self.foreign_keys.positions("CALENDAR", "proj_id")
+        global_cals = by_project.get("", [])
         for project in self.projects.values():
-            cal_list = []
-            for cal in self.calendars.values():
-                if not cal.proj_id or cal.proj_id == project.uid:
-                    cal_list.append(cal)
-            project.calendars = cal_list
+            # global and project calendars in the order of the table
+            positions = sorted(global_cals + by_project.get(project.uid, []))
+            project.calendars = [
+                self.calendars[calendars[i]["clndr_id"]] for i in positions
+            ]
 
     def _set_proj_codes(self) -> None:
         for proj_code in self.tables.get("PROJPCAT", []):
@@ -188,87 +522,210 @@ class Xer:
                 task.activity_codes.update({code_value.code_type: code_value})
 
     def _set_task_memos(self) -> None:
-        for memo in self.tables.get("TASKMEMO", []):
-            self._set_memo(**memo)
+        if chunks := self._converted.pop("TASKMEMO", None):
+            for memo in restore_objects("TASKMEMO", chunks):
+                memo.topic = self.notebook_topics[memo.memo_type_id].topic
+                self.tasks[memo.task_id].memos.append(memo)
+            return
 
-    def _set_task_resources(self) -> None:
-        for res in self.tables.get("TASKRSRC", []):
-            self._set_taskrsrc(**res)
+        for row in self.tables.get("TASKMEMO", []):
+            topic = self.notebook_topics[row["memo_type_id"]].topic
+            self.tasks[row["task_id"]].memos.append(TASKMEMO(topic=topic, **row))
 
-    def _set_udf_values(self) -> None:
-        for udf in self.tables.get("UDFVALUE", []):
+    def _set_task_resources(self) -> None:
+        if chunks := self._converted.pop("TASKRSRC", None):
+            for taskrsrc in restore_objects("TASKRSRC", chunks):
+                taskrsrc.resource = self.resources[taskrsrc.rsrc_id]
+                taskrsrc.account = self.accounts.get(taskrsrc.acct_id)
+                self._link_taskrsrc(taskrsrc)
+            return
+
+        for row in self.tables.get("TASKRSRC", []):
+            account = self.accounts.get(row["acct_id"])
+            resource = self.resources[row["rsrc_id"]]
+            self._link_taskrsrc(TASKRSRC(account, resource, **row))
+
+    def _set_udf_values(self, table: str, objects: dict[str, Any]) -> None:
+        """Assign the user defined field values of a table to its objects."""
+        if table not in self.tables:
+            # values of a table that was not loaded have no object to belong to
+            return
+        udf_values = self.tables.get("UDFVALUE", [])
+        by_type = self.foreign_keys.positions("UDFVALUE", "udf_type_id")
+        udf_types = [
+            udf_type for udf_type in self.udf_types.values() if udf_type.table == table
+        ]
+        # values are assigned in the order of the table
+        positions = sorted(
+            i for udf_type in udf_types for i in by_type.get(udf_type.uid, [])
+        )
+        for i in positions:
+            udf = udf_values[i]
             udf_type = self.udf_types[udf["udf_type_id"]]
-            udf_value = UDFTYPE.get_udf_value(udf_type, **udf)
-            if udf_type.table == "TASK":
-                self.tasks[udf["fk_id"]].user_defined_fields[udf_type] = udf_value
-            elif udf_type.table == "PROJECT":
-                self.projects[udf["fk_id"]].user_defined_fields[udf_type] = udf_value
-            elif udf_type.table == "PROJWBS":
-                self.wbs_nodes[udf["fk_id"]].user_defined_fields[udf_type] = udf_value
-            elif udf_type.table == "RSRC":
-                self.resources[udf["fk_id"]].user_defined_fields[udf_type] = udf_value
+            objects[udf["fk_id"]].user_defined_fields[udf_type] = UDFTYPE.get_udf_value(
+                udf_type, **udf
+            )
+
+    def _set_base_calendars(self) -> None:
+        for cal in self.calendars.values():
+            if cal.base_clndr_id:
+                cal.base_calendar = self.calendars.get(cal.base_clndr_id)
 
     def _set_financial_periods(self) -> None:
-        for task_fin in self.tables.get("TASKFIN", []):
-            self._set_taskfin(**task_fin)
-
-        for rsrc_fin in self.tables.get("TRSRCFIN", []):
-            self._set_taskrsrc_fin(**rsrc_fin)
-
-    def _set_memo(self, **kwargs) -> None:
-        topic = self.notebook_topics[kwargs["memo_type_id"]].topic
-        task = self.tasks[kwargs["task_id"]]
-        task.memos.append(TASKMEMO(topic=topic, **kwargs))
-
-    def _set_proj_wbs(self, **kwargs) -> PROJWBS:
-        proj = self.projects[kwargs["proj_id"]]
-        wbs = PROJWBS(proj, **kwargs)
-        return wbs
-
-    def _set_rsrc_rates(self, **kwargs) -> RSRCRATE:
-        rsrc = self.resources[kwargs["rsrc_id"]]
-        rsrc_rate = RSRCRATE(rsrc, **kwargs)
-        return rsrc_rate
-
-    def _set_task(self, **kwargs) -> TASK:
-        calendar = self.calendars[kwargs["clndr_id"]]
-        wbs = self.wbs_nodes[kwargs["wbs_id"]]
-        task = TASK(calendar=calendar, wbs=wbs, **kwargs)
+        for row in self.tables.get("TASKFIN", []):
+            task_fin = TASKFIN(self.financial_periods[row["fin_dates_id"]], **row)
+            self.tasks[task_fin.task_id].periods.append(task_fin)
+
+        for row in self.tables.get("TRSRCFIN", []):
+            rsrc_fin = TRSRCFIN(self.financial_periods[row["fin_dates_id"]], **row)
+            task = self.tasks[rsrc_fin.task_id]
+            task.resources[rsrc_fin.taskrsrc_id].periods.append(rsrc_fin)
+
+    def _link_task(self, task: TASK, calendar: CALENDAR, wbs: PROJWBS) -> TASK:
+        task.calendar = calendar
+        task.wbs = wbs
         wbs.add_task(task)
-        self.projects[task.proj_id].tasks.append(task)
+        self.projects[task.proj_id]._tasks.append(task)
         return task
 
-    def _set_taskpred(self, **kwargs) -> TASKPRED:
-        pred = self.tasks[kwargs["pred_task_id"]]
-        succ = self.tasks[kwargs["task_id"]]
-        task_pred = TASKPRED(predecessor=pred, successor=succ, **kwargs)
-        pred.successors.append(LinkToTask(succ, task_pred.link, task_pred.lag))
-        succ.predecessors.append(LinkToTask(pred, task_pred.link, task_pred.lag))
-        self.projects[task_pred.proj_id].relationships.append(task_pred)
+    def _link_taskpred(self, task_pred: TASKPRED, pred: TASK, succ: TASK) -> TASKPRED:
+        task_pred.predecessor = pred
+        task_pred.successor = succ
+        pred._successors.append(LinkToTask(succ, task_pred.link, task_pred.lag))
+        succ._predecessors.append(LinkToTask(pred, task_pred.link, task_pred.lag))
+        self.projects[task_pred.proj_id]._relationships.append(task_pred)
         return task_pred
 
-    def _set_taskrsrc(self, **kwargs) -> None:
-        rsrc = self.resources[kwargs["rsrc_id"]]
-        account = self.accounts.get(kwargs["acct_id"])
-        task = self.tasks[kwargs["task_id"]]
-        proj = self.projects[kwargs["proj_id"]]
-        taskrsrc = TASKRSRC(resource=rsrc, account=account, **kwargs)
-        rsrc.task_rsrcs.append(taskrsrc)
+    def _link_taskrsrc(self, taskrsrc: TASKRSRC) -> None:
+        task = self.tasks[taskrsrc.task_id]
+        proj = self.projects[taskrsrc.proj_id]
+        taskrsrc.resource._task_rsrcs.append(taskrsrc)
         task.resources.update({taskrsrc.uid: taskrsrc})
-        proj.resources.append(taskrsrc)
-
-    def _set_taskfin(self, **kwargs) -> None:
-        period = self.financial_periods[kwargs["fin_dates_id"]]
-        task_fin = TASKFIN(period=period, **kwargs)
-        self.tasks[task_fin.task_id].periods.append(task_fin)
-
-    def _set_taskrsrc_fin(self, **kwargs) -> None:
-        period = self.financial_periods[kwargs["fin_dates_id"]]
-        rsrc_fin = TRSRCFIN(period=period, **kwargs)
-        self.tasks[rsrc_fin.task_id].resources[rsrc_fin.taskrsrc_id].periods.append(
-            rsrc_fin
-        )
+        proj._resources.append(taskrsrc)
+
+    # Objects are built the first time they are used, along with the objects
+    # they reference, and are then linked to the objects built before them.
+    export_info: XerCollection[ERMHDR] = XerCollection(
+        lambda xer: ERMHDR(*xer.tables["ERMHDR"])
+    )
+    accounts: XerCollection[dict[str, ACCOUNT]] = XerCollection(
+        lambda xer: build_tree(xer._get_attr("ACCOUNT"))
+    )
+    activity_code_types: XerCollection[dict[str, ACTVTYPE]] = XerCollection(
+        lambda xer: xer._get_attr("ACTVTYPE")
+    )
+    activity_code_values: XerCollection[dict[str, ACTVCODE]] = XerCollection(
+        lambda xer: build_tree(xer._get_activity_codes())
+    )
+    calendars: XerCollection[dict[str, CALENDAR]] = XerCollection(
+        lambda xer: xer._get_attr("CALENDAR"), _set_base_calendars
+    )
+    financial_periods: XerCollection[dict[str, FINDATES]] = XerCollection(
+        lambda xer: xer._get_attr("FINDATES")
+    )
+    notebook_topics: XerCollection[dict[str, MEMOTYPE]] = XerCollection(
+        lambda xer: xer._get_attr("MEMOTYPE")
+    )
+    project_code_types: XerCollection[dict[str, PCATTYPE]] = XerCollection(
+        lambda xer: xer._get_attr("PCATTYPE")
+    )
+    project_code_values: XerCollection[dict[str, PCATVAL]] = XerCollection(
+        lambda xer: build_tree(xer._get_proj_codes())
+    )
+    resources: XerCollection[dict[str, RSRC]] = XerCollection(
+        lambda xer: build_tree(xer._get_attr("RSRC")),
+        lambda xer: xer._set_udf_values("RSRC", xer.resources),
+        lambda xer: xer._set_fill(xer.resources.values()),
+    )
+    resource_rates: XerCollection[dict[str, RSRCRATE]] = XerCollection(_get_rsrc_rates)
+    sched_options: XerCollection[dict[str, SCHEDOPTIONS]] = XerCollection(
+        lambda xer: xer._get_attr("SCHEDOPTIONS")
+    )
+    udf_types: XerCollection[dict[str, UDFTYPE]] = XerCollection(
+        lambda xer: xer._get_attr("UDFTYPE")
+    )
+    projects: XerCollection[dict[str, PROJECT]] = XerCollection(
+        _get_projects,
+        _set_proj_activity_codes,
+        _set_proj_codes,
+        _set_proj_calendars,
+        lambda xer: xer._set_udf_values("PROJECT", xer.projects),
+        lambda xer: xer._set_fill(xer.projects.values()),
+    )
+    wbs_nodes: XerCollection[dict[str, PROJWBS]] = XerCollection(
+        lambda xer: build_tree(xer._get_wbs_nodes()),
+        lambda xer: xer._set_udf_values("PROJWBS", xer.wbs_nodes),
+        lambda xer: xer._set_fill(xer.wbs_nodes.values()),
+    )
+    tasks: XerCollection[dict[str, TASK]] = XerCollection(
+        _get_tasks,
+        _set_task_actv_codes,
+        _set_task_memos,
+        _set_task_resources,
+        _set_financial_periods,
+        lambda xer: xer._set_udf_values("TASK", xer.tasks),
+        lambda xer: xer._set_fill(xer.tasks.values()),
+    )
+    relationships: XerCollection[dict[str, TASKPRED]] = XerCollection(
+        _get_relationships
+    )
+
+
+# Object collections of an `Xer`, in the order they are built by `materialize`
+COLLECTIONS = tuple(
+    name for name, attr in vars(Xer).items() if isinstance(attr, XerCollection)
+)
+
+
+def select_tables(
+    tables: Iterable[str] | None = None, exclude: Iterable[str] | None = None
+) -> tuple[set[str] | None, set[str] | None, set[str] | None]:
+    """
+    Resolve the tables to load from a .xer file.
+
+    Args:
+        tables (Iterable[str], optional): Tables to load along with their dependencies.
+        exclude (Iterable[str], optional): Tables to skip along with their dependents.
 
+    Returns:
+        tuple: tables to include, tables to exclude, and the subset of
+        tables used to build objects (`None` if not filtered)
+    """
+    if tables is None and exclude is None:
+        return None, None, None
+
+    include: set[str] | None = None
+    if tables is not None:
+        include = set()
+        pending = list(tables)
+        while pending:
+            if (name := pending.pop()) not in include:
+                include.add(name)
+                pending.extend(TABLE_DEPENDENCIES.get(name, ()))
+
+    excluded: set[str] = set()
+    pending = list(exclude or ())
+    while pending:
+        if (name := pending.pop()) not in excluded:
+            excluded.add(name)
+            pending.extend(
+                table for table, deps in TABLE_DEPENDENCIES.items() if name in deps
+            )
+
+    subset = (set(TABLE_DEPENDENCIES) if include is None else include) - excluded
+    if include is not None:
+        include -= excluded
+    return include, excluded, subset
 
-def proj_key(obj: Any) -> str:
-    return (obj.proj_id, "")[obj.proj_id is None]
+
+def _file_source(
+    file: Path | str | BinaryIO, columnar: bool, filtered: bool
+) -> tuple[Path, tuple[int, int], bool, bool] | None:
+    """
+    The path, modification time and size of a .xer file, and the options it
+    was read with, used to read released tables again. `None` for a stream.
+    """
+    if not isinstance(file, (str, Path)):
+        return None
+    stat = os.stat(file)
+    return Path(file), (stat.st_mtime_ns, stat.st_size), columnar, filtered